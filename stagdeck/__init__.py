@@ -4,10 +4,13 @@ from .slide import Slide
 from .slide_deck import SlideDeck
 from .viewer import DeckViewer
 from .app import App
+from .broadcast import BroadcastSession
 from .file_watcher import FileWatcher
+from .loop_monitor import LoopLagMonitor
 from .registry import DeckRegistry, registry, register_deck, get_deck
 from .theme import Theme, ElementStyle, LayoutStyle
 from .renderer import SlideRenderer, setup_render_endpoint
+from .audience import RenderCache, setup_audience_endpoint
 
 
 def format_duration(seconds: float) -> str:
@@ -25,7 +28,9 @@ __all__ = [
     'SlideDeck',
     'DeckViewer',
     'App',
+    'BroadcastSession',
     'FileWatcher',
+    'LoopLagMonitor',
     'DeckRegistry',
     'registry',
     'register_deck',
@@ -36,4 +41,6 @@ __all__ = [
     'LayoutStyle',
     'SlideRenderer',
     'setup_render_endpoint',
+    'RenderCache',
+    'setup_audience_endpoint',
 ]
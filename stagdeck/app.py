@@ -1,16 +1,63 @@
 """🚀 App - Application lifecycle management for StagDeck."""
 
-import asyncio
-from pathlib import Path
+from functools import partial
 from typing import Callable
 
 from nicegui import ui, app
 
-from .file_watcher import FileWatcher
+from .loop_monitor import LoopLagMonitor
+from .registry import DeckFactory, DeckRegistry, build_deck, registry
 from .slide_deck import SlideDeck
 from .viewer import DeckViewer
 
 
+# Built decks of App pages, keyed by page path
+_page_decks = DeckRegistry()
+
+# Whether _stop_watching() is registered for the running app (by the first page)
+_shutdown_hooked = False
+
+
+def _stop_watching() -> None:
+    """Shutdown handler: stop the registries' file watching."""
+    global _shutdown_hooked
+    _shutdown_hooked = False  # An app started again registers it anew
+    registry.stop_watching()
+    _page_decks.stop_watching()
+
+
+def _stop_watching_on_shutdown() -> None:
+    """Register _stop_watching() as shutdown handler, once per app run."""
+    global _shutdown_hooked
+    if not _shutdown_hooked:
+        _shutdown_hooked = True
+        app.on_shutdown(_stop_watching)
+
+
+def _page_factory(path: str, deck_factory: DeckFactory, cache: bool) -> Callable[[str], DeckFactory]:
+    """Prepare the deck source of a page.
+    
+    :return: Function mapping the `?deck=` query value to an async factory:
+        the registry deck if one with that name exists, else the page's own
+        deck (from the page cache, or built fresh when caching is off).
+    """
+    _stop_watching_on_shutdown()
+    if cache:
+        _page_decks.register(path, deck_factory)
+    
+    def select(name: str) -> DeckFactory:
+        # Cached decks are dropped when the watcher reports a changed dependency
+        if name and registry.has(name):
+            registry.watch_dependencies()
+            return partial(registry.get_async, name)
+        if cache:
+            _page_decks.watch_dependencies()
+            return partial(_page_decks.get_async, path)
+        return partial(build_deck, deck_factory)
+    
+    return select
+
+
 class App:
     """🚀 Application lifecycle manager for StagDeck presentations.
     
@@ -28,25 +75,46 @@ class App:
     @classmethod
     def run(
         cls,
-        deck_factory: Callable[[], SlideDeck],
+        deck_factory: DeckFactory,
         title: str = 'Presentation',
         path: str = '/',
         enable_render: bool = True,
         render_path: str = '/render',
         hot_reload: bool = True,
+        prebuild_decks: bool = False,
+        cache_decks: bool = False,
+        lag_threshold: float | None = 0.25,
+        profile: bool = False,
         **kwargs,
     ) -> None:
         """🚀 Run the presentation app.
         
         Creates a page at the specified path and starts the NiceGUI server.
-        The deck_factory is called for each user request, ensuring isolated state.
+        The deck is built off the event loop (async factories are awaited, sync
+        factories run in a worker thread), by default once per request, ensuring
+        isolated state. Decks registered in the DeckRegistry are selected with
+        `?deck=name` and served from the registry's built-deck cache.
+        
+        As factories run in worker threads, SlideDeck.add_from_files() loads
+        files in-process there by default (workers=None never starts a process
+        pool outside the main thread); pass `workers=n` to use a pool anyway, or
+        build large decks once with `cache_decks=True` or `prebuild_decks=True`.
         
-        :param deck_factory: Factory function that creates a SlideDeck per request.
+        :param deck_factory: Sync or async factory function that creates a SlideDeck.
         :param title: Browser window title.
         :param path: URL path for the presentation (default: '/').
         :param enable_render: Enable slide rendering endpoint (requires Selenium).
         :param render_path: URL path for render endpoint (default: '/render').
         :param hot_reload: Auto-reload when markdown source files change (default: True).
+        :param prebuild_decks: Build all registered decks in the background at startup.
+        :param cache_decks: Build the deck once and give each request a clone
+            until its source, theme or media files change (default: False).
+            Clones share the Slide objects, so only enable this if the factory's
+            slides are not modified in place after the deck was built.
+        :param lag_threshold: Warn when the event loop is blocked for longer than
+            this many seconds, naming the page handler (None disables the check).
+        :param profile: Record per-slide build times and serve the report at
+            /stagdeck/profile (see `python -m stagdeck.profiler`).
         :param kwargs: Additional arguments passed to ui.run().
         
         Example:
@@ -60,83 +128,82 @@ class App:
             >>> App.run(create_deck, enable_render=True)
             # GET /render?slide=0&step=0&width=1920&height=1080
         """
+        select_factory = _page_factory(path, deck_factory, cache_decks)
+        monitor = LoopLagMonitor.get_instance()
+        if lag_threshold is not None or profile:
+            # Profiling needs the lag measurements, even without warnings
+            monitor.threshold = lag_threshold if lag_threshold is not None else float('inf')
+            app.on_startup(monitor.start)
+        if profile:
+            from .profiler import setup_profiler_endpoint
+            setup_profiler_endpoint()
+        
         @ui.page(path)
-        async def presentation_page():
-            deck = deck_factory()
-            viewer = DeckViewer(
-                deck=deck,
-                deck_factory=deck_factory if hot_reload else None,
-            )
-            
-            # Setup hot-reload for this viewer
-            if hot_reload and deck.source_files:
-                watcher = FileWatcher()
-                viewer._file_watcher = watcher
-                viewer._needs_reload = False
-                
-                for source_file in deck.source_files:
-                    watcher.watch(source_file)
-                
-                # FileWatcher sets flag, timer checks it from UI context
-                def on_file_change(path):
-                    viewer._needs_reload = True
+        async def presentation_page(deck: str = ''):
+            with monitor.track(path):
+                factory = select_factory(deck)
+                viewer = DeckViewer(
+                    deck=await factory(),
+                    deck_factory=factory if hot_reload else None,
+                )
                 
-                async def check_reload():
-                    if viewer._needs_reload:
-                        viewer._needs_reload = False
-                        await viewer.reload()
+                # Setup hot-reload for this viewer (changes are pushed, no timers)
+                if hot_reload:
+                    viewer.enable_hot_reload()
                 
-                watcher.on_change(on_file_change)
-                asyncio.create_task(watcher.start())
-                
-                # Timer runs in UI context and can safely call reload
-                ui.timer(0.5, check_reload)
-            
-            await viewer.build()
+                await viewer.build()
         
         # Render-only page (no navbar, for screenshot capture)
         @ui.page('/_render_frame')
         async def render_frame_page():
-            deck = deck_factory()
-            viewer = DeckViewer(deck=deck)
-            await viewer.build_render_frame()
+            with monitor.track('/_render_frame'):
+                viewer = DeckViewer(deck=await select_factory('')())
+                await viewer.build_render_frame()
         
         if enable_render:
             from .renderer import setup_render_endpoint
             setup_render_endpoint(path=render_path)
         
+        if prebuild_decks:
+            app.on_startup(registry.start_background_build)
+        
         ui.run(title=title, reload=True, show=kwargs.pop('show', False), **kwargs)
     
     @classmethod
     def create_page(
         cls,
-        deck_factory: Callable[[], SlideDeck],
+        deck_factory: DeckFactory,
         path: str = '/',
         enable_render_frame: bool = True,
+        cache_decks: bool = False,
     ) -> None:
         """📄 Register a presentation page without starting the server.
         
         Use this when you need custom routes or multiple presentations.
         Call ui.run() separately after setting up all pages.
         
-        :param deck_factory: Factory function that creates a SlideDeck per request.
+        :param deck_factory: Sync or async factory function that creates a SlideDeck.
         :param path: URL path for the presentation.
         :param enable_render_frame: If True, also create /_render_frame endpoint for rendering.
+        :param cache_decks: Share one build across requests, see App.run() (default: False).
         
         Example:
             >>> App.create_page(create_main_deck, path='/')
             >>> App.create_page(create_backup_deck, path='/backup')
             >>> ui.run(title='My Presentations')
         """
+        select_factory = _page_factory(path, deck_factory, cache_decks)
+        monitor = LoopLagMonitor.get_instance()
+        
         @ui.page(path)
-        async def presentation_page():
-            deck = deck_factory()
-            viewer = DeckViewer(deck=deck)
-            await viewer.build()
+        async def presentation_page(deck: str = ''):
+            with monitor.track(path):
+                viewer = DeckViewer(deck=await select_factory(deck)())
+                await viewer.build()
         
         if enable_render_frame:
             @ui.page('/_render_frame')
             async def render_frame_page():
-                deck = deck_factory()
-                viewer = DeckViewer(deck=deck)
-                await viewer.build_render_frame()
+                with monitor.track('/_render_frame'):
+                    viewer = DeckViewer(deck=await select_factory('')())
+                    await viewer.build_render_frame()
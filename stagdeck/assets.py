@@ -0,0 +1,199 @@
+"""📦 Static asset bundle - fingerprinted, precompressed package assets."""
+
+import gzip
+import hashlib
+import mimetypes
+from dataclasses import dataclass
+from pathlib import Path
+
+
+STATIC_DIR = Path(__file__).parent / 'static'
+ASSETS_URL = '/stagdeck/assets'
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+
+
+def _brotli_compress(data: bytes) -> bytes | None:
+    """Compress with brotli if the optional package is installed."""
+    try:
+        import brotli
+    except ImportError:
+        try:
+            import brotlicffi as brotli
+        except ImportError:
+            return None
+    return brotli.compress(data, quality=11)
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    """Parse an Accept-Encoding header into the set of acceptable codings."""
+    accepted = set()
+    for part in accept_encoding.lower().split(','):
+        coding, _, params = part.strip().partition(';')
+        q = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding and q > 0:
+            accepted.add(coding)
+    return accepted
+
+
+@dataclass
+class Asset:
+    """📄 One static file with its precompressed variants.
+    
+    :ivar name: Original file name (e.g. 'scaling.js').
+    :ivar fingerprinted: File name with content hash (e.g. 'scaling.3f2a9c1d7b4e.js').
+    :ivar media_type: MIME type.
+    :ivar content: Uncompressed bytes.
+    :ivar gzip: Gzip variant, or None if it is not smaller.
+    :ivar brotli: Brotli variant, or None if unavailable or not smaller.
+    :ivar etag: Strong ETag derived from the content hash.
+    """
+    name: str
+    fingerprinted: str
+    media_type: str
+    content: bytes
+    gzip: bytes | None
+    brotli: bytes | None
+    etag: str
+    
+    def select(self, accept_encoding: str) -> tuple[bytes, str | None]:
+        """Choose the best variant for an Accept-Encoding header.
+        
+        :param accept_encoding: Request Accept-Encoding header value.
+        :return: Tuple of (body, content encoding or None for identity).
+        """
+        accepted = _accepted_encodings(accept_encoding)
+        if self.brotli is not None and 'br' in accepted:
+            return self.brotli, 'br'
+        if self.gzip is not None and ('gzip' in accepted or '*' in accepted):
+            return self.gzip, 'gzip'
+        return self.content, None
+
+
+class AssetBundle:
+    """📦 Fingerprinted, precompressed bundle of the package's static files.
+    
+    Files are hashed and compressed once when the bundle is built (at server
+    startup), and served under content-hashed names with `immutable` caching,
+    so repeat visitors never re-request them. A changed file gets a new URL.
+    
+    Example:
+        >>> bundle = AssetBundle.get_instance()
+        >>> bundle.register()
+        >>> bundle.url('scaling.js')
+        '/stagdeck/assets/scaling.3f2a9c1d7b4e.js'
+    """
+    
+    _instance: 'AssetBundle | None' = None
+    
+    def __init__(
+        self,
+        directory: Path | str = STATIC_DIR,
+        url_prefix: str = ASSETS_URL,
+        patterns: tuple[str, ...] = ('*.css', '*.js'),
+    ) -> None:
+        """
+        Build the bundle.
+        
+        :param directory: Folder containing the static files.
+        :param url_prefix: URL path the assets are served under.
+        :param patterns: Glob patterns of files to include.
+        """
+        self.directory = Path(directory)
+        self.url_prefix = url_prefix.rstrip('/')
+        self._by_name: dict[str, Asset] = {}
+        self._by_fingerprint: dict[str, Asset] = {}
+        for pattern in patterns:
+            for path in sorted(self.directory.glob(pattern)):
+                self._add(path)
+    
+    @classmethod
+    def get_instance(cls) -> 'AssetBundle':
+        """🔍 Get the bundle of the package's static folder."""
+        if cls._instance is None:
+            cls._instance = AssetBundle()
+        return cls._instance
+    
+    def _add(self, path: Path) -> None:
+        """Hash and precompress one file."""
+        content = path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()[:12]
+        fingerprinted = f'{path.stem}.{digest}{path.suffix}'
+        media_type = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+        if media_type.startswith('text/') or media_type.endswith('javascript'):
+            media_type += '; charset=utf-8'
+        
+        # mtime=0 keeps the gzip output reproducible across restarts
+        gzipped = gzip.compress(content, compresslevel=9, mtime=0)
+        brotli = _brotli_compress(content)
+        asset = Asset(
+            name=path.name,
+            fingerprinted=fingerprinted,
+            media_type=media_type,
+            content=content,
+            gzip=gzipped if len(gzipped) < len(content) else None,
+            brotli=brotli if brotli is not None and len(brotli) < len(content) else None,
+            etag=f'"{digest}"',
+        )
+        self._by_name[asset.name] = asset
+        self._by_fingerprint[asset.fingerprinted] = asset
+    
+    def url(self, name: str) -> str:
+        """🔗 Get the fingerprinted URL of a static file.
+        
+        :param name: Original file name (e.g. 'styles.css').
+        :return: URL with content hash.
+        :raises KeyError: If the file is not part of the bundle.
+        """
+        return f'{self.url_prefix}/{self._by_name[name].fingerprinted}'
+    
+    def get(self, fingerprinted: str) -> Asset | None:
+        """Get an asset by its fingerprinted file name."""
+        return self._by_fingerprint.get(fingerprinted)
+    
+    def head_html(self, *names: str) -> str:
+        """🧩 Build <link>/<script> tags for the given files.
+        
+        :param names: Original file names, in load order.
+        :return: HTML for the page head.
+        """
+        tags = []
+        for name in names:
+            if name.endswith('.css'):
+                tags.append(f'<link rel="stylesheet" href="{self.url(name)}">')
+            else:
+                tags.append(f'<script src="{self.url(name)}"></script>')
+        return '\n'.join(tags)
+    
+    def register(self) -> None:
+        """🔌 Add the asset route to the NiceGUI app (once)."""
+        from fastapi import Request
+        from fastapi.responses import Response
+        from nicegui import app
+        
+        route_path = f'{self.url_prefix}/{{name}}'
+        if any(getattr(route, 'path', None) == route_path for route in app.routes):
+            return
+        
+        @app.get(route_path, include_in_schema=False)
+        async def serve_asset(name: str, request: Request) -> Response:
+            asset = self.get(name)
+            if asset is None:
+                return Response(status_code=404)
+            headers = {
+                'Cache-Control': IMMUTABLE_CACHE,
+                'ETag': asset.etag,
+                'Vary': 'Accept-Encoding',
+            }
+            if request.headers.get('if-none-match') == asset.etag:
+                return Response(status_code=304, headers=headers)
+            body, encoding = asset.select(request.headers.get('accept-encoding', ''))
+            if encoding:
+                headers['Content-Encoding'] = encoding
+            return Response(content=body, media_type=asset.media_type, headers=headers)
@@ -0,0 +1,467 @@
+"""🖼️ Audience endpoint - image-only slide viewer for large audiences."""
+
+import asyncio
+import json
+import uuid
+import warnings
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Iterable
+
+from .broadcast import BroadcastSession
+
+if TYPE_CHECKING:
+    from .slide_deck import SlideDeck
+
+
+RenderFunc = Callable[[int, int, int, int], Awaitable[bytes]]
+
+
+class RenderCache:
+    """🗄️ Cache of pre-rendered slide images.
+    
+    Keeps the most recently used PNGs in memory and, if a directory is given,
+    persists them on disk so a restarted server starts warm. Concurrent misses
+    for the same image share one render (single flight), so a crowd hitting an
+    uncached slide triggers exactly one browser render.
+    
+    :ivar cache_id: Random id naming this cache in thumbnail URLs.
+    :ivar generation: Bumped by clear(); part of image URLs so browsers and
+        proxies may cache images forever.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 256,
+        directory: Path | str | None = None,
+        render: RenderFunc | None = None,
+    ) -> None:
+        """
+        Initialize the cache.
+        
+        :param max_entries: Maximum images held in memory before LRU eviction.
+        :param directory: Optional folder for persisting rendered PNGs.
+        :param render: Default render function for misses (None = cache only).
+        """
+        self.max_entries = max_entries
+        self.render = render
+        self.directory = Path(directory) if directory else None
+        self.cache_id = uuid.uuid4().hex[:12]
+        self.generation = 0
+        self._images: OrderedDict[str, bytes] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[bytes]] = {}
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+    
+    @staticmethod
+    def key(index: int, step: int, width: int, height: int) -> str:
+        """Build the cache key of a rendered slide step."""
+        return f'{index}_{step}_{width}x{height}'
+    
+    def get(self, index: int, step: int, width: int, height: int) -> bytes | None:
+        """🔍 Get a cached image from memory or disk.
+        
+        Reads the disk synchronously; use load() inside the event loop.
+        
+        :return: PNG bytes or None if not cached.
+        """
+        key = self.key(index, step, width, height)
+        png = self._images.get(key)
+        if png is not None:
+            self._images.move_to_end(key)
+            return png
+        png = self._read(key)
+        if png is not None:
+            self._remember(key, png)
+        return png
+    
+    async def load(self, index: int, step: int, width: int, height: int) -> bytes | None:
+        """🔍 Get a cached image, reading the disk in a worker thread.
+        
+        :return: PNG bytes or None if not cached.
+        """
+        key = self.key(index, step, width, height)
+        png = self._images.get(key)
+        if png is not None:
+            self._images.move_to_end(key)
+            return png
+        if self.directory is None:
+            return None
+        png = await asyncio.to_thread(self._read, key)
+        if png is not None:
+            self._remember(key, png)
+        return png
+    
+    def has(self, index: int, step: int, width: int, height: int) -> bool:
+        """Check whether an image is cached in memory or on disk (without reading it)."""
+        key = self.key(index, step, width, height)
+        return key in self._images or (self.directory is not None and (self.directory / f'{key}.png').exists())
+    
+    def put(self, index: int, step: int, width: int, height: int, png: bytes) -> None:
+        """💾 Store a rendered image.
+        
+        Writes the disk synchronously; use store() inside the event loop.
+        """
+        key = self.key(index, step, width, height)
+        self._remember(key, png)
+        if self.directory:
+            (self.directory / f'{key}.png').write_bytes(png)
+    
+    async def store(self, index: int, step: int, width: int, height: int, png: bytes) -> None:
+        """💾 Store a rendered image, writing the disk in a worker thread."""
+        key = self.key(index, step, width, height)
+        self._remember(key, png)
+        if self.directory:
+            await asyncio.to_thread((self.directory / f'{key}.png').write_bytes, png)
+    
+    def _read(self, key: str) -> bytes | None:
+        """Read a persisted image (None without a directory or file)."""
+        if self.directory is None:
+            return None
+        try:
+            return (self.directory / f'{key}.png').read_bytes()
+        except FileNotFoundError:
+            return None
+    
+    def _remember(self, key: str, png: bytes) -> None:
+        """Insert into the in-memory LRU."""
+        self._images[key] = png
+        self._images.move_to_end(key)
+        while len(self._images) > self.max_entries:
+            self._images.popitem(last=False)
+    
+    async def get_or_render(
+        self,
+        index: int,
+        step: int,
+        width: int,
+        height: int,
+        render: RenderFunc | None = None,
+    ) -> bytes:
+        """⚡ Return a cached image, rendering it once on a miss.
+        
+        :param render: Async function (index, step, width, height) -> PNG bytes.
+            Defaults to the cache's own render function.
+        :return: PNG bytes.
+        :raises LookupError: On a miss without any render function.
+        """
+        png = await self.load(index, step, width, height)
+        if png is not None:
+            return png
+        render = render or self.render
+        if render is None:
+            raise LookupError(f'Slide {index} step {step} at {width}x{height} is not cached')
+        
+        key = self.key(index, step, width, height)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            try:
+                png = await render(index, step, width, height)
+                await self.store(index, step, width, height, png)
+                future.set_result(png)
+            except Exception as e:
+                future.set_exception(e)
+                future.exception()  # Mark retrieved when nobody else waits
+                raise
+            finally:
+                del self._inflight[key]
+            return png
+        return await asyncio.shield(future)
+    
+    async def prerender(
+        self,
+        deck: 'SlideDeck',
+        render: RenderFunc | None = None,
+        width: int = 1920,
+        height: int = 1080,
+        steps: bool = True,
+    ) -> int:
+        """🔥 Render the slides that are not cached yet.
+        
+        :param deck: Deck whose slides to render.
+        :param render: Async function (index, step, width, height) -> PNG bytes.
+            Defaults to the cache's own render function.
+        :param width: Image width.
+        :param height: Image height.
+        :param steps: Render every step; if False only the first step (thumbnails).
+        :return: Number of newly rendered images.
+        """
+        rendered = 0
+        for index, slide in enumerate(deck.slides):
+            for step in range(slide.steps if steps else 1):
+                if not await asyncio.to_thread(self.has, index, step, width, height):
+                    await self.get_or_render(index, step, width, height, render)
+                    rendered += 1
+        return rendered
+    
+    def clear(self) -> None:
+        """🧹 Drop all cached images (e.g. after the deck changed)."""
+        self._images.clear()
+        if self.directory:
+            for path in self.directory.glob('*.png'):
+                path.unlink()
+        self.generation += 1
+    
+    def __len__(self) -> int:
+        """Return number of images held in memory."""
+        return len(self._images)
+
+
+def _page_html(path: str, width: int, height: int, script_url: str) -> str:
+    """Build the static audience page."""
+    return f'''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>StagDeck Audience</title>
+    <style>
+        html, body {{ margin: 0; height: 100%; background: #000; overflow: hidden; }}
+        #stagdeck-audience {{ width: 100%; height: 100%; object-fit: contain; display: block; }}
+    </style>
+</head>
+<body>
+    <img id="stagdeck-audience" alt="" width="{width}" height="{height}">
+    <script src="{script_url}" data-stream="{path}/stream"></script>
+</body>
+</html>'''
+
+
+def _current_deck(deck: 'SlideDeck | Callable[[], SlideDeck] | None') -> 'SlideDeck | None':
+    """Resolve a deck given directly or via a function returning the current deck."""
+    return deck() if callable(deck) else deck
+
+
+def _is_valid_step(deck: 'SlideDeck | None', index: int, step: int) -> bool:
+    """Check that a slide step exists in the deck (False without a deck)."""
+    if deck is None or not 0 <= index < len(deck.slides):
+        return False
+    return 0 <= step < deck.slides[index].steps
+
+
+def setup_audience_endpoint(
+    session: BroadcastSession,
+    path: str = '/audience',
+    cache: RenderCache | None = None,
+    render: RenderFunc | None = None,
+    width: int = 1920,
+    height: int = 1080,
+    keepalive: float = 15.0,
+    deck: 'SlideDeck | Callable[[], SlideDeck] | None' = None,
+) -> RenderCache:
+    """Setup a lightweight, image-only audience viewer on the NiceGUI app.
+    
+    Audience members do not get a NiceGUI client: they load a static page that
+    shows pre-rendered slide images and follows the presenter through a single
+    Server-Sent Events stream. Per viewer the server only holds one idle
+    stream; images are served from the RenderCache and rendered live (once)
+    only for slides that are not cached yet.
+    
+    Live rendering is limited to slide steps that exist in `deck`, so
+    requests for arbitrary indexes cannot make the server render (and store)
+    images. Without a deck only cached images are served: every miss answers
+    404, so the cache must be prerendered (see RenderCache.prerender()).
+    
+    Routes:
+        - `{path}`: The audience page.
+        - `{path}/stream`: SSE stream of presenter positions.
+        - `{path}/slide/{index}/{step}.png`: Slide images.
+    
+    :param session: Broadcast session the presenter publishes to.
+    :param path: URL path of the audience page.
+    :param cache: Render cache to serve from (a new in-memory one if None).
+    :param render: Async (index, step, width, height) -> PNG fallback for cache
+        misses. Defaults to the cache's render function, else a SlideRenderer
+        on the local server.
+    :param width: Rendered image width.
+    :param height: Rendered image height.
+    :param keepalive: Seconds between SSE keep-alive comments.
+    :param deck: The presented deck, or a function returning the current one.
+        Required for live rendering; without it misses answer 404.
+    :return: The RenderCache used by the endpoint.
+    
+    Example:
+        >>> session = BroadcastSession.get('keynote')
+        >>> cache = setup_audience_endpoint(session, cache=RenderCache(directory='.render_cache'), deck=deck)
+        >>> # In the presenter page: viewer.present_to(session, cache=cache)
+    """
+    from fastapi import Request
+    from fastapi.responses import HTMLResponse, Response, StreamingResponse
+    from nicegui import app
+    
+    from .assets import AssetBundle
+    
+    cache = cache if cache is not None else RenderCache()
+    path = path.rstrip('/')
+    if deck is None and (render or cache.render) is not None:
+        warnings.warn(
+            f'Audience endpoint {path!r} has no deck: the render function is never used, '
+            'uncached slides answer 404',
+            stacklevel=2,
+        )
+    bundle = AssetBundle.get_instance()
+    bundle.register()
+    
+    render = render or cache.render
+    if render is None:
+        renderer = None
+        
+        async def render(index: int, step: int, width: int, height: int) -> bytes:
+            nonlocal renderer
+            if renderer is None:
+                from .renderer import SlideRenderer
+                renderer = SlideRenderer()
+            return await renderer.render_slide(slide=index, step=step, width=width, height=height)
+    
+    def message(position: tuple[int, int]) -> str:
+        index, step = position
+        payload = {
+            'slide': index,
+            'step': step,
+            'src': f'{path}/slide/{index}/{step}.png?v={cache.generation}',
+        }
+        return f'data: {json.dumps(payload)}\n\n'
+    
+    @app.get(path)
+    async def audience_page() -> HTMLResponse:
+        """Serve the static audience page."""
+        return HTMLResponse(_page_html(path, width, height, bundle.url('audience.js')))
+    
+    @app.get(f'{path}/stream')
+    async def audience_stream(request: Request) -> StreamingResponse:
+        """Stream presenter positions as Server-Sent Events."""
+        changed = asyncio.Event()
+        unsubscribe = session.subscribe(lambda index, step: changed.set())
+        
+        async def events() -> AsyncIterator[str]:
+            try:
+                if session.position is not None:
+                    yield message(session.position)
+                while not await request.is_disconnected():
+                    try:
+                        await asyncio.wait_for(changed.wait(), keepalive)
+                    except asyncio.TimeoutError:
+                        yield ': keep-alive\n\n'
+                        continue
+                    changed.clear()
+                    if session.position is not None:
+                        yield message(session.position)
+            finally:
+                unsubscribe()
+        
+        return StreamingResponse(
+            events(),
+            media_type='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+        )
+    
+    @app.get(f'{path}/slide/{{index}}/{{step}}.png')
+    async def audience_image(index: int, step: int) -> Response:
+        """Serve a slide image, rendering it on a cache miss."""
+        png = await cache.load(index, step, width, height)
+        if png is None and not _is_valid_step(_current_deck(deck), index, step):
+            return Response(status_code=404)
+        try:
+            png = png or await cache.get_or_render(index, step, width, height, render)
+        except Exception as e:
+            return Response(content=f'Render error: {e}', status_code=503, media_type='text/plain')
+        return Response(
+            content=png,
+            media_type='image/png',
+            # URLs carry the cache generation, so the content never changes
+            headers={'Cache-Control': 'public, max-age=31536000, immutable'},
+        )
+    
+    return cache
+
+
+THUMBNAIL_URL = '/stagdeck/thumbnails'
+
+
+@dataclass(eq=False)
+class _ThumbnailSource:
+    """Cache, deck and allowed sizes behind one thumbnail URL key."""
+    
+    cache: RenderCache
+    deck: 'weakref.ref[SlideDeck] | None' = None
+    sizes: set[tuple[int, int]] = field(default_factory=set)
+
+
+# Thumbnail sources by cache id, per endpoint path
+_thumbnail_sources: dict[str, dict[str, _ThumbnailSource]] = {}
+
+
+def thumbnail_url(cache: RenderCache, index: int, width: int, height: int, path: str = THUMBNAIL_URL) -> str:
+    """🔗 Get the URL of a slide thumbnail served by setup_thumbnail_endpoint().
+    
+    :param cache: Cache holding the thumbnails.
+    :param index: Slide index.
+    :param width: Thumbnail width.
+    :param height: Thumbnail height.
+    :param path: URL path of the thumbnail endpoint.
+    :return: URL including the cache id and generation (safe to cache forever).
+    """
+    return f'{path}/{cache.cache_id}/{width}x{height}/{index}.png?v={cache.generation}'
+
+
+def setup_thumbnail_endpoint(
+    cache: RenderCache,
+    deck: 'SlideDeck | None' = None,
+    sizes: Iterable[tuple[int, int]] = (),
+    path: str = THUMBNAIL_URL,
+) -> None:
+    """Serve first-step slide thumbnails from a RenderCache.
+    
+    One route per path serves every registered cache; thumbnail_url() puts
+    the cache id into the URL. Calling this again for the same cache rebinds
+    it to the given (current) deck and adds sizes.
+    
+    Requests for sizes that were not registered, or for slides that do not
+    exist in the deck, answer 404 and never render. Cached thumbnails are
+    returned directly; misses are rendered only if the cache has a render
+    function, otherwise they answer 404 and the overview keeps its placeholder.
+    
+    Route: `{path}/{cache_id}/{width}x{height}/{index}.png`
+    
+    :param cache: Cache holding the thumbnails.
+    :param deck: Deck the thumbnails show (held weakly).
+    :param sizes: Allowed (width, height) pairs.
+    :param path: URL path of the endpoint.
+    """
+    from fastapi.responses import Response
+    from nicegui import app
+    
+    sources = _thumbnail_sources.setdefault(path, {})
+    source = sources.get(cache.cache_id)
+    if source is None or source.cache is not cache:
+        source = sources[cache.cache_id] = _ThumbnailSource(cache)
+    source.deck = weakref.ref(deck) if deck is not None else None
+    source.sizes.update(sizes)
+    
+    route_path = f'{path}/{{cache_id}}/{{width}}x{{height}}/{{index}}.png'
+    if any(getattr(route, 'path', None) == route_path for route in app.routes):
+        return
+    
+    @app.get(route_path, include_in_schema=False)
+    async def serve_thumbnail(cache_id: str, width: int, height: int, index: int) -> Response:
+        source = sources.get(cache_id)
+        if source is None or (width, height) not in source.sizes:
+            return Response(status_code=404)
+        current = source.deck() if source.deck is not None else None
+        if current is None or not 0 <= index < len(current.slides):
+            return Response(status_code=404)
+        try:
+            png = await source.cache.get_or_render(index, 0, width, height)
+        except LookupError:
+            return Response(status_code=404)
+        except Exception as e:
+            return Response(content=f'Render error: {e}', status_code=503, media_type='text/plain')
+        return Response(
+            content=png,
+            media_type='image/png',
+            headers={'Cache-Control': 'public, max-age=31536000, immutable'},
+        )
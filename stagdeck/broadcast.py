@@ -0,0 +1,129 @@
+"""📡 Broadcast sessions - one presenter drives many audience viewers."""
+
+import asyncio
+import inspect
+import warnings
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+
+BroadcastCallback = Callable[[int, int], Awaitable[None] | None]
+
+
+@dataclass(eq=False)
+class _Subscriber:
+    """A follower callback plus the last position version delivered to it."""
+    
+    callback: BroadcastCallback
+    is_async: bool = False
+    version: int = 0
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+
+class BroadcastSession:
+    """📡 Pub/sub channel from one presenter to many audience viewers.
+    
+    The presenter publishes (slide, step) positions, followers subscribe with
+    a callback. Delivery is coalesced per follower: while a follower is still
+    applying a position, newer publishes only replace the pending position, so
+    a slow client never builds intermediate slides and never delays others.
+    
+    Example:
+        >>> session = BroadcastSession.get('keynote')
+        >>> presenter_viewer.present_to(session)   # in the presenter page
+        >>> audience_viewer.follow(session)        # in each audience page
+    
+    :ivar name: Session name.
+    :ivar position: Last published (slide index, step), or None.
+    """
+    
+    _sessions: dict[str, 'BroadcastSession'] = {}
+    
+    def __init__(self, name: str = 'default') -> None:
+        """
+        Create a broadcast session.
+        
+        :param name: Session name, used by BroadcastSession.get().
+        """
+        self.name = name
+        self.position: tuple[int, int] | None = None
+        self._version = 0
+        self._subscribers: list[_Subscriber] = []
+    
+    @classmethod
+    def get(cls, name: str = 'default') -> 'BroadcastSession':
+        """🔍 Get or create the shared session with the given name.
+        
+        :param name: Session name.
+        :return: The shared BroadcastSession.
+        """
+        session = cls._sessions.get(name)
+        if session is None:
+            session = cls._sessions[name] = BroadcastSession(name)
+        return session
+    
+    @property
+    def subscriber_count(self) -> int:
+        """Number of subscribed followers."""
+        return len(self._subscribers)
+    
+    def subscribe(self, callback: BroadcastCallback) -> Callable[[], None]:
+        """➕ Subscribe a follower.
+        
+        :param callback: Called with (slide index, step) on each new position.
+            Sync callbacks run inline and must be cheap (e.g. set an event);
+            async callbacks run in a background task per follower.
+        :return: Function that unsubscribes the follower again.
+        """
+        subscriber = _Subscriber(
+            callback, is_async=inspect.iscoroutinefunction(callback), version=self._version,
+        )
+        self._subscribers.append(subscriber)
+        
+        def unsubscribe() -> None:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+            if subscriber.task is not None and not subscriber.task.done():
+                subscriber.task.cancel()
+        
+        return unsubscribe
+    
+    def publish(self, index: int, step: int = 0) -> None:
+        """📣 Publish a new presenter position to all followers.
+        
+        Returns immediately; delivery runs in background tasks. Publishing the
+        current position again is a no-op.
+        
+        :param index: Slide index.
+        :param step: Step within the slide.
+        """
+        position = (index, step)
+        if position == self.position:
+            return
+        self.position = position
+        self._version += 1
+        for subscriber in self._subscribers:
+            if not subscriber.is_async:
+                subscriber.version = self._version
+                self._invoke(subscriber.callback, position)
+            elif subscriber.task is None or subscriber.task.done():
+                subscriber.task = asyncio.get_running_loop().create_task(
+                    self._deliver(subscriber), name=f'stagdeck-broadcast-{self.name}',
+                )
+    
+    async def _deliver(self, subscriber: _Subscriber) -> None:
+        """Deliver the latest position until the subscriber has caught up."""
+        while subscriber.version != self._version and self.position is not None:
+            subscriber.version = self._version
+            try:
+                await subscriber.callback(*self.position)
+            except Exception as e:
+                # A broken follower must not stop delivery to itself or others
+                warnings.warn(f"Broadcast '{self.name}' delivery failed: {e}")
+    
+    def _invoke(self, callback: BroadcastCallback, position: tuple[int, int]) -> None:
+        """Call a sync follower callback, isolating its errors."""
+        try:
+            callback(*position)
+        except Exception as e:
+            warnings.warn(f"Broadcast '{self.name}' delivery failed: {e}")
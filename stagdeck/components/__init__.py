@@ -7,7 +7,13 @@ from .markdown_parser import (
     MarkdownParser,
     MarkdownDeckInfo,
     MarkdownSlideInfo,
+    MarkdownToken,
+    PARSER_VERSION,
+    ParseCache,
+    SlideAST,
     SlideContentType,
+    TokenKind,
+    tokenize_slide,
 )
 
 from .slide_layout import (
@@ -48,7 +54,13 @@ __all__ = [
     'MarkdownParser',
     'MarkdownDeckInfo',
     'MarkdownSlideInfo',
+    'MarkdownToken',
+    'PARSER_VERSION',
+    'ParseCache',
+    'SlideAST',
     'SlideContentType',
+    'TokenKind',
+    'tokenize_slide',
     # Slide Layout
     'LayoutMode',
     'LayoutConfig',
@@ -10,7 +10,10 @@ from .base import (
     REM_TO_PX_FACTOR,
 )
 
-from .media import MediaView, MediaStyle, ImageView, VideoView, IMAGE_EXTENSIONS, VIDEO_EXTENSIONS
+from .media import (
+    MediaView, MediaStyle, ImageView, VideoView, IMAGE_EXTENSIONS, VIDEO_EXTENSIONS,
+    BLUR_ENDPOINT, DEFAULT_BLUR_RADIUS, blur_url,
+)
 from .table import TableElement, render_table
 from .bullet_list import BulletListElement, render_bullet_list
 from .numbered_list import NumberedListElement, render_numbered_list
@@ -31,6 +34,9 @@ __all__ = [
     'VideoView',
     'IMAGE_EXTENSIONS',
     'VIDEO_EXTENSIONS',
+    'BLUR_ENDPOINT',
+    'DEFAULT_BLUR_RADIUS',
+    'blur_url',
     # Element Classes
     'TableElement',
     'BulletListElement',
@@ -18,6 +18,31 @@ if TYPE_CHECKING:
 IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.bmp', '.ico', '.heic', '.heif', '.tiff'}
 VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mov', '.webm', '.mkv', '.m4v', '.ogv'}
 
+# Server-side blur: endpoint and theme default radius for a plain 'blur' modifier
+BLUR_ENDPOINT = '/stagdeck/blur'
+DEFAULT_BLUR_RADIUS = 4.0
+
+
+def _unwrap_css_url(src: str) -> str:
+    """Strip a CSS url(...) wrapper from a media source."""
+    if src.startswith('url(') and src.endswith(')'):
+        return src[4:-1].strip('"\'')
+    return src
+
+
+def blur_url(path: str, radius: float, endpoint: str = BLUR_ENDPOINT) -> str:
+    """Build the URL of a blurred image.
+    
+    Rendering and preloading both use this, so the browser requests (and
+    caches) exactly one URL per image and radius; 4 and 4.0 give the same URL.
+    
+    :param path: Image URL path (e.g., '/media/photo.jpg').
+    :param radius: Blur radius in pixels.
+    :param endpoint: URL endpoint for server-side blur.
+    :return: Blur endpoint URL.
+    """
+    return f'{endpoint}?path={path}&radius={radius:g}'
+
 
 @dataclass
 class MediaStyle:
@@ -218,7 +243,7 @@ class MediaView(ContentElement):
         """Check if overlay effect is requested."""
         return self.style.overlay is not None
     
-    def get_blur_radius(self, theme_default: float = 4.0) -> float:
+    def get_blur_radius(self, theme_default: float = DEFAULT_BLUR_RADIUS) -> float:
         """Get effective blur radius.
         
         :param theme_default: Default blur radius from theme.
@@ -255,6 +280,14 @@ class MediaView(ContentElement):
             return 'center bottom'
         return 'center'
     
+    def get_preload_url(self, theme_blur_default: float = DEFAULT_BLUR_RADIUS) -> str | None:
+        """Get the URL the browser fetches for this media, for preloading.
+        
+        :param theme_blur_default: Default blur radius from theme.
+        :return: URL, or None if nothing needs to be fetched. Override in subclasses.
+        """
+        return None
+    
     async def build(self) -> None:
         """Build the media element UI. Override in subclasses."""
         pass
@@ -321,7 +354,7 @@ class ImageView(MediaView):
         if 'object_fit' in kwargs:
             self.style.object_fit = kwargs['object_fit']
     
-    def get_image_url(self, blur_endpoint: str = '/stagdeck/blur') -> str:
+    def get_image_url(self, blur_endpoint: str = BLUR_ENDPOINT) -> str:
         """Get the image URL, applying blur endpoint if needed.
         
         :param blur_endpoint: URL endpoint for server-side blur.
@@ -329,19 +362,12 @@ class ImageView(MediaView):
         """
         if not self.has_blur:
             return self.src
-        
-        # Extract path from url(...) if present
-        src = self.src
-        if src.startswith('url(') and src.endswith(')'):
-            src = src[4:-1].strip('"\'')
-        
-        radius = self.get_blur_radius()
-        return f'{blur_endpoint}?path={src}&radius={radius}'
+        return blur_url(_unwrap_css_url(self.src), self.get_blur_radius(), blur_endpoint)
     
     def get_background_css(
         self,
-        blur_endpoint: str = '/stagdeck/blur',
-        theme_blur_default: float = 4.0,
+        blur_endpoint: str = BLUR_ENDPOINT,
+        theme_blur_default: float = DEFAULT_BLUR_RADIUS,
         region_index: int = 0,
         region_count: int = 1,
         region_direction: str = 'horizontal',
@@ -381,19 +407,25 @@ class ImageView(MediaView):
         
         # Get image URL (with blur if needed)
         if self.has_blur:
-            src = self.src
-            if src.startswith('url(') and src.endswith(')'):
-                src = src[4:-1].strip('"\'')
-            radius = self.get_blur_radius(theme_blur_default)
-            img_url = f'{blur_endpoint}?path={src}&radius={radius}'
+            img_url = blur_url(_unwrap_css_url(self.src), self.get_blur_radius(theme_blur_default), blur_endpoint)
         else:
-            if self.src.startswith('url('):
-                img_url = self.src[4:-1].strip('"\'')
-            else:
-                img_url = self.src
+            img_url = _unwrap_css_url(self.src)
         
         return f'background: url({img_url}) {bg_position}/{bg_size} no-repeat;'
     
+    def get_preload_url(self, theme_blur_default: float = DEFAULT_BLUR_RADIUS) -> str | None:
+        """Get the image URL exactly as build_background() will request it.
+        
+        :param theme_blur_default: Default blur radius from theme.
+        :return: Image URL (blur endpoint URL if blurred), or None for colors/gradients.
+        """
+        if self.src.startswith('#') or 'gradient' in self.src.lower():
+            return None
+        src = _unwrap_css_url(self.src)
+        if self.has_blur:
+            return blur_url(src, self.get_blur_radius(theme_blur_default))
+        return src
+    
     def _register_for_hot_reload(self) -> None:
         """Register this image's source file for hot-reload watching."""
         # Skip non-file sources
@@ -416,7 +448,7 @@ class ImageView(MediaView):
         self,
         container_classes: str = 'absolute inset-0',
         theme_overlay_opacity: float = 0.5,
-        theme_blur_default: float = 4.0,
+        theme_blur_default: float = DEFAULT_BLUR_RADIUS,
         region_index: int = 0,
         region_count: int = 1,
         region_direction: str = 'horizontal',
@@ -544,6 +576,10 @@ class VideoView(MediaView):
             src = src[4:-1].strip('"\'')
         return src
     
+    def get_preload_url(self, theme_blur_default: float = DEFAULT_BLUR_RADIUS) -> str | None:
+        """Get the video URL for preloading."""
+        return self.get_video_url()
+    
     def build_background(
         self,
         container_classes: str = 'absolute inset-0',
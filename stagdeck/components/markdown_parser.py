@@ -3,7 +3,10 @@
 Parses Markdown source into structured deck and slide information.
 """
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any
@@ -11,6 +14,9 @@ from typing import Any
 # Slide separator - must be on its own line
 SLIDE_SEPARATOR = '---'
 
+# Bump whenever slide parse results change, invalidates ParseCache keys
+PARSER_VERSION = 1
+
 
 class SlideContentType(Enum):
     """Types of content that can appear on a slide."""
@@ -93,6 +99,430 @@ class MarkdownSlideInfo:
     raw_markdown: str = ''
 
 
+class TokenKind(Enum):
+    """Kinds of lines in a single slide's markdown."""
+    NAME = auto()    # [name: slide_name]
+    NOTE = auto()    # ^ presenter note
+    STYLE = auto()   # [.element:property: value]
+    IMAGE = auto()   # ![modifiers](url) on its own line
+    H1 = auto()      # # Heading
+    H2 = auto()      # ## Heading
+    BLANK = auto()   # Empty or whitespace-only line
+    TEXT = auto()    # Anything else (content)
+
+
+# Line patterns, matched against the stripped line
+_NAME_LINE = re.compile(r'^\[name:\s*([^\]]+)\]$', re.IGNORECASE)
+_STYLE_LINE = re.compile(r'^\[\.(\w+):(\w+):\s*(.+)\]$')
+# Permissive URL part handles nested parentheses (for gradients)
+_IMAGE_LINE = re.compile(r'^!\[([^\]]*)\]\((.+)\)\s*$')
+_H1_LINE = re.compile(r'^#\s+(.+)$')
+_H2_LINE = re.compile(r'^##\s+(.+)$')
+
+
+@dataclass
+class MarkdownToken:
+    """One classified line of slide markdown.
+    
+    :ivar kind: Line kind.
+    :ivar index: Line number within the slide.
+    :ivar line: Original (unstripped) line.
+    :ivar text: Payload: name, note, heading text or style value.
+    :ivar alt: Lower-cased image modifiers (IMAGE) or style element (STYLE).
+    :ivar url: Image URL or color (IMAGE) or style property (STYLE).
+    """
+    kind: TokenKind
+    index: int
+    line: str
+    text: str = ''
+    alt: str = ''
+    url: str = ''
+
+
+def tokenize_slide(markdown: str) -> list[MarkdownToken]:
+    """Classify every line of one slide's markdown in a single pass.
+    
+    Lines are dispatched on their first character, so each line is matched
+    against at most one or two compiled patterns.
+    
+    :param markdown: Markdown source for a single slide.
+    :return: One token per line.
+    """
+    tokens: list[MarkdownToken] = []
+    for index, line in enumerate(markdown.strip().split('\n')):
+        stripped = line.strip()
+        first = stripped[:1]
+        kind = TokenKind.TEXT
+        text = alt = url = ''
+        if not first:
+            kind = TokenKind.BLANK
+        elif first == '^':
+            kind, text = TokenKind.NOTE, stripped[1:].strip()
+        elif first == '[':
+            if match := _NAME_LINE.match(stripped):
+                kind, text = TokenKind.NAME, match.group(1).strip()
+            elif match := _STYLE_LINE.match(stripped):
+                kind, alt, url, text = TokenKind.STYLE, match.group(1).lower(), match.group(2).lower(), match.group(3).strip()
+        elif first == '!':
+            if match := _IMAGE_LINE.match(stripped):
+                kind, alt, url = TokenKind.IMAGE, match.group(1).lower(), match.group(2)
+        elif first == '#':
+            if match := _H1_LINE.match(stripped):
+                kind, text = TokenKind.H1, match.group(1).strip()
+            elif match := _H2_LINE.match(stripped):
+                kind, text = TokenKind.H2, match.group(1).strip()
+        tokens.append(MarkdownToken(kind, index, line, text, alt, url))
+    return tokens
+
+
+def _filter_modifiers(modifiers: list[str]) -> tuple[float | None, float | None]:
+    """Extract (overlay opacity, blur radius) from image modifiers.
+    
+    -1.0 is the sentinel for "use theme default".
+    """
+    overlay_opacity = None
+    blur_radius = None
+    for mod in modifiers:
+        if mod == 'overlay':
+            overlay_opacity = -1.0
+        elif mod.startswith('overlay:'):
+            try:
+                overlay_opacity = float(mod.split(':')[1])
+            except (ValueError, IndexError):
+                overlay_opacity = -1.0
+        elif mod == 'blur':
+            blur_radius = -1.0
+        elif mod.startswith('blur:'):
+            try:
+                blur_radius = float(mod.split(':')[1])
+            except (ValueError, IndexError):
+                blur_radius = -1.0
+    return overlay_opacity, blur_radius
+
+
+@dataclass
+class SlideAST:
+    """Tokenized slide markdown from which all parse results are derived.
+    
+    :ivar tokens: One token per line.
+    :ivar images: Non-inline IMAGE tokens (region boundaries).
+    """
+    tokens: list[MarkdownToken]
+    images: list[MarkdownToken] = field(default_factory=list)
+    
+    @classmethod
+    def parse(cls, markdown: str) -> 'SlideAST':
+        """Tokenize slide markdown once.
+        
+        :param markdown: Markdown source for a single slide.
+        :return: New SlideAST.
+        """
+        tokens = tokenize_slide(markdown)
+        images = [t for t in tokens if t.kind is TokenKind.IMAGE and 'inline' not in t.alt]
+        return cls(tokens, images)
+    
+    @property
+    def is_multi_region(self) -> bool:
+        """Whether the slide has more than one image region."""
+        return len(self.images) > 1
+    
+    def to_slide_dict(self) -> dict[str, Any]:
+        """Derive the single-region result (see MarkdownParser.parse_slide_markdown)."""
+        result: dict[str, Any] = {
+            'title': '',
+            'subtitle': '',
+            'background': '',
+            'background_modifiers': '',  # Raw modifier string for ImageView
+            'background_position': '',  # 'left', 'right', 'top', 'bottom', or '' for full
+            'overlay_opacity': None,  # None = no overlay, 0.0-1.0 for opacity
+            'blur_radius': None,  # None = no blur, value in pixels
+            'content': '',
+            'images': [],
+            'notes': '',
+            'text_style': {},  # Slide-level text style overrides
+            'name': '',  # Slide name from [name: ...] directive
+        }
+        tokens = self.tokens
+        content_lines: list[str] = []
+        found_title = False
+        
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            kind = token.kind
+            i += 1
+            
+            if kind is TokenKind.NAME:
+                result['name'] = token.text
+            elif kind is TokenKind.NOTE:
+                if result['notes']:
+                    result['notes'] += '\n'
+                result['notes'] += token.text
+            elif kind is TokenKind.STYLE:
+                result['text_style'].setdefault(token.alt, {})[token.url] = token.text
+            elif kind is TokenKind.IMAGE:
+                alt_text = token.alt
+                modifiers = alt_text.split()
+                is_left = any(m == 'left' or m.startswith('left:') for m in modifiers)
+                is_right = any(m == 'right' or m.startswith('right:') for m in modifiers)
+                is_top = any(m == 'top' or m.startswith('top:') for m in modifiers)
+                is_bottom = any(m == 'bottom' or m.startswith('bottom:') for m in modifiers)
+                is_split = is_left or is_right or is_top or is_bottom
+                
+                # Explicit background, positioned, or leading image = background
+                if 'background' in modifiers or is_split or (
+                    not content_lines and not found_title and not alt_text.startswith('inline')
+                ):
+                    value = token.url
+                    is_color = value.startswith('#') or 'gradient' in value.lower()
+                    result['background'] = value if is_color else f'url({value})'
+                    result['background_modifiers'] = alt_text
+                    result['overlay_opacity'], result['blur_radius'] = _filter_modifiers(modifiers)
+                    if is_left:
+                        result['background_position'] = 'left'
+                    elif is_right:
+                        result['background_position'] = 'right'
+                    elif is_top:
+                        result['background_position'] = 'top'
+                    elif is_bottom:
+                        result['background_position'] = 'bottom'
+                else:
+                    # Inline/positioned image, kept in content
+                    result['images'].append({'modifier': alt_text, 'url': token.url, 'line': token.index})
+                    content_lines.append(token.line)
+            elif kind is TokenKind.H1 and not found_title:
+                result['title'] = token.text
+                found_title = True
+                # Subtitle: next non-empty line, if it is an H2
+                while i < len(tokens) and tokens[i].kind is TokenKind.BLANK:
+                    i += 1
+                if i < len(tokens) and tokens[i].kind is TokenKind.H2:
+                    result['subtitle'] = tokens[i].text
+                    i += 1
+            else:
+                content_lines.append(token.line)
+        
+        result['content'] = '\n'.join(content_lines).strip()
+        return result
+    
+    def to_multi_region_dict(self) -> dict[str, Any]:
+        """Derive the region result (see MarkdownParser.parse_multi_region_markdown)."""
+        result: dict[str, Any] = {
+            'regions': [],
+            'direction': 'horizontal',
+            'notes': '',
+            'name': '',  # Slide name from [name: ...] directive
+        }
+        
+        # 0 or 1 images: standard single-region parsing
+        if not self.is_multi_region:
+            single = self.to_slide_dict()
+            region: dict[str, Any] = {
+                'image': single['background'],
+                'overlay_opacity': single['overlay_opacity'],
+                'blur_radius': single['blur_radius'],
+            } if single['background'] else {
+                'image': '',
+                'overlay_opacity': None,
+                'blur_radius': None,
+            }
+            region.update(content=single['content'], title=single['title'], subtitle=single['subtitle'])
+            result['regions'] = [region]
+            result['notes'] = single['notes']
+            result['name'] = single['name']
+            if single['background_position'] in ('top', 'bottom'):
+                result['direction'] = 'vertical'
+            return result
+        
+        for token in self.tokens:
+            if token.kind is TokenKind.NAME:
+                result['name'] = token.text
+            elif token.kind is TokenKind.NOTE:
+                if result['notes']:
+                    result['notes'] += '\n'
+                result['notes'] += token.text
+        
+        images = self.images
+        has_left_right = any('left' in t.alt or 'right' in t.alt for t in images)
+        has_top_bottom = any('top' in t.alt or 'bottom' in t.alt for t in images)
+        if has_top_bottom and not has_left_right:
+            result['direction'] = 'vertical'
+        
+        # Each region starts at an image line and ends before the next image
+        for idx, image in enumerate(images):
+            end_idx = images[idx + 1].index if idx + 1 < len(images) else len(self.tokens)
+            
+            region_title = ''
+            region_subtitle = ''
+            content_lines = []
+            content_started = False
+            for token in self.tokens[image.index + 1:end_idx]:
+                kind = token.kind
+                if kind is TokenKind.NOTE:
+                    continue  # Already extracted
+                if kind is TokenKind.H1 and not region_title and not content_started:
+                    region_title = token.text
+                    continue
+                if kind is TokenKind.H2 and region_title and not region_subtitle and not content_started:
+                    region_subtitle = token.text
+                    continue
+                if kind is not TokenKind.BLANK:
+                    content_started = True
+                content_lines.append(token.line)
+            
+            url = image.url
+            is_color = url.startswith('#') or 'gradient' in url.lower()
+            modifiers = image.alt.split()
+            overlay_opacity, blur_radius = _filter_modifiers(modifiers)
+            position = ''
+            for mod in modifiers:
+                if mod in ('left', 'right', 'top', 'bottom'):
+                    position = mod
+            
+            result['regions'].append({
+                'image': url if is_color else f'url({url})',
+                'modifiers': image.alt,  # Raw modifier string for ImageView
+                'overlay_opacity': overlay_opacity,
+                'blur_radius': blur_radius,
+                'position': position,
+                'content': '\n'.join(content_lines).strip(),
+                'title': region_title,
+                'subtitle': region_subtitle,
+            })
+        
+        return result
+
+
+def _copy_result(value: Any) -> Any:
+    """Copy the dict/list structure of a parse result (values are immutable)."""
+    if isinstance(value, dict):
+        return {key: _copy_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_result(item) for item in value]
+    return value
+
+
+class ParseCache:
+    """Process-wide LRU cache of parsed slide markdown.
+    
+    Keyed by a hash of the slide markdown plus PARSER_VERSION, so rebuilding
+    a deck (every deck factory call, every hot reload) only parses slides
+    whose text actually changed. Callers get their own copy of each result.
+    Thread-safe, as deck factories may run in worker threads. Loading a
+    markdown file larger than the cache grows it (reserve()), so rebuilding
+    one deck never evicts its own slides.
+    
+    Example:
+        >>> cache = ParseCache.get_instance()
+        >>> multi_region, result = cache.parse('# Hello')
+        >>> cache.hits, cache.misses
+        (0, 1)
+    
+    :ivar max_entries: Maximum cached slides before LRU eviction.
+    :ivar hits: Number of lookups answered from the cache.
+    :ivar misses: Number of lookups that had to parse.
+    """
+    
+    _instance: 'ParseCache | None' = None
+    
+    DEFAULT_MAX_ENTRIES = 65536
+    
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Create an empty cache.
+        
+        :param max_entries: Maximum cached slides before LRU eviction.
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[bool, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def get_instance(cls) -> 'ParseCache':
+        """Get the shared cache instance."""
+        if cls._instance is None:
+            cls._instance = ParseCache()
+        return cls._instance
+    
+    @staticmethod
+    def digest(markdown: str) -> str:
+        """Hash a slide's markdown (the same hash deck source records use)."""
+        return hashlib.md5(markdown.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def key(markdown: str) -> str:
+        """Build the cache key of a slide's markdown."""
+        return f'{PARSER_VERSION}:{ParseCache.digest(markdown)}'
+    
+    def parse(self, markdown: str) -> tuple[bool, dict[str, Any]]:
+        """Parse one slide's markdown, or return a copy of the cached result.
+        
+        :param markdown: Markdown source for a single slide.
+        :return: Tuple of (is multi-region, result). The result has the shape of
+            parse_multi_region_markdown() for multi-region slides, else of
+            parse_slide_markdown().
+        """
+        key = self.key(markdown)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if entry is None:
+            ast = SlideAST.parse(markdown)
+            result = ast.to_multi_region_dict() if ast.is_multi_region else ast.to_slide_dict()
+            entry = (ast.is_multi_region, result)
+            with self._lock:
+                self.misses += 1
+                self._store(key, entry)
+        return entry[0], _copy_result(entry[1])
+    
+    def reserve(self, count: int) -> None:
+        """Grow the cache to hold at least `count` slides (it never shrinks).
+        
+        :param count: Number of slides of the deck being loaded.
+        """
+        with self._lock:
+            self.max_entries = max(self.max_entries, count)
+    
+    def peek(self, digest: str) -> tuple[bool, dict[str, Any]] | None:
+        """Get a cached entry by markdown digest without copying or counting.
+        
+        The returned result must not be modified.
+        """
+        return self._entries.get(f'{PARSER_VERSION}:{digest}')
+    
+    def put(self, digest: str, multi_region: bool, result: dict[str, Any]) -> None:
+        """Insert a parse result obtained elsewhere (e.g. from a deck snapshot).
+        
+        :param digest: ParseCache.digest() of the slide's markdown.
+        :param multi_region: Whether the result has the multi-region shape.
+        :param result: Parse result (owned by the cache afterwards).
+        """
+        with self._lock:
+            self._store(f'{PARSER_VERSION}:{digest}', (multi_region, result))
+    
+    def _store(self, key: str, entry: tuple[bool, dict[str, Any]]) -> None:
+        """Insert into the LRU (caller holds the lock)."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached results and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def __len__(self) -> int:
+        """Return number of cached slides."""
+        return len(self._entries)
+
+
 class MarkdownParser:
     """Parser for Markdown presentation source.
     
@@ -453,175 +883,7 @@ class MarkdownParser:
             >>> result['background']
             '#1a1a2e'
         """
-        result: dict[str, Any] = {
-            'title': '',
-            'subtitle': '',
-            'background': '',
-            'background_modifiers': '',  # Raw modifier string for ImageView
-            'background_position': '',  # 'left', 'right', 'top', 'bottom', or '' for full
-            'overlay_opacity': None,  # None = no overlay, 0.0-1.0 for opacity
-            'blur_radius': None,  # None = no blur, value in pixels
-            'content': '',
-            'images': [],
-            'notes': '',
-            'text_style': {},  # Slide-level text style overrides
-            'name': '',  # Slide name from [name: ...] directive
-        }
-        
-        lines = markdown.strip().split('\n')
-        content_lines: list[str] = []
-        found_title = False
-        found_subtitle = False
-        title_line_idx = -1
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            stripped = line.strip()
-            
-            # Check for slide name directive: [name: slidename]
-            name_match = re.match(r'^\[name:\s*([^\]]+)\]$', stripped, re.IGNORECASE)
-            if name_match:
-                result['name'] = name_match.group(1).strip()
-                i += 1
-                continue
-            
-            # Check for presenter notes
-            if stripped.startswith('^'):
-                if result['notes']:
-                    result['notes'] += '\n'
-                result['notes'] += stripped[1:].strip()
-                i += 1
-                continue
-            
-            # Check for element style directives: [.element:property: value]
-            # Examples: [.title:shadow: 2px 2px 4px black], [.text:color: white], [.subtitle:class: italic]
-            style_match = re.match(r'^\[\.(\w+):(\w+):\s*(.+)\]$', stripped)
-            if style_match:
-                element = style_match.group(1).lower()  # title, subtitle, text, etc.
-                prop = style_match.group(2).lower()     # shadow, color, class, etc.
-                value = style_match.group(3).strip()
-                
-                # Initialize element dict if needed
-                if element not in result['text_style']:
-                    result['text_style'][element] = {}
-                result['text_style'][element][prop] = value
-                i += 1
-                continue
-            
-            # Check for background image: ![modifiers](url)
-            # Modifiers: background, left, right, top, bottom, overlay, overlay:N, blur, blur:N
-            # Use a more permissive pattern that handles nested parentheses (for gradients)
-            bg_match = re.match(r'^!\[([^\]]*)\]\((.+)\)\s*$', stripped)
-            if bg_match:
-                alt_text = bg_match.group(1).lower()
-                value = bg_match.group(2)
-                
-                # Parse modifiers from alt text
-                modifiers = alt_text.split()
-                
-                # Position modifiers
-                is_background = 'background' in modifiers
-                is_left = any(m == 'left' or m.startswith('left:') for m in modifiers)
-                is_right = any(m == 'right' or m.startswith('right:') for m in modifiers)
-                is_top = any(m == 'top' or m.startswith('top:') for m in modifiers)
-                is_bottom = any(m == 'bottom' or m.startswith('bottom:') for m in modifiers)
-                is_split = is_left or is_right or is_top or is_bottom
-                
-                # Filter modifiers: overlay, overlay:N, blur, blur:N
-                overlay_opacity = None
-                blur_radius = None
-                
-                for mod in modifiers:
-                    if mod == 'overlay':
-                        overlay_opacity = -1.0  # Sentinel for "use theme default"
-                    elif mod.startswith('overlay:'):
-                        try:
-                            overlay_opacity = float(mod.split(':')[1])
-                        except (ValueError, IndexError):
-                            overlay_opacity = -1.0
-                    elif mod == 'blur':
-                        blur_radius = -1.0  # Sentinel for "use theme default"
-                    elif mod.startswith('blur:'):
-                        try:
-                            blur_radius = float(mod.split(':')[1])
-                        except (ValueError, IndexError):
-                            blur_radius = -1.0
-                
-                # If it's explicitly "background" or positioned, or at start with no content
-                if is_background or is_split or (not content_lines and not found_title and not alt_text.startswith('inline')):
-                    # Check if it's a color (starts with # or contains gradient)
-                    if value.startswith('#') or 'gradient' in value.lower():
-                        result['background'] = value
-                    else:
-                        # It's an image URL
-                        result['background'] = f'url({value})'
-                    
-                    # Store raw modifiers string for ImageView
-                    result['background_modifiers'] = alt_text
-                    
-                    # Set filter values (for backward compatibility)
-                    result['overlay_opacity'] = overlay_opacity
-                    result['blur_radius'] = blur_radius
-                    
-                    # Set position for split layouts
-                    if is_left:
-                        result['background_position'] = 'left'
-                    elif is_right:
-                        result['background_position'] = 'right'
-                    elif is_top:
-                        result['background_position'] = 'top'
-                    elif is_bottom:
-                        result['background_position'] = 'bottom'
-                    
-                    i += 1
-                    continue
-                else:
-                    # It's an inline/positioned image, keep track of it
-                    result['images'].append({
-                        'modifier': alt_text,
-                        'url': value,
-                        'line': i,
-                    })
-                    content_lines.append(line)
-                    i += 1
-                    continue
-            
-            # Check for inline images ![inline](...) - keep in content
-            inline_match = re.match(r'^!\[inline[^\]]*\]\(([^)]+)\)', stripped)
-            if inline_match:
-                content_lines.append(line)
-                i += 1
-                continue
-            
-            # Check for H1 title
-            h1_match = re.match(r'^#\s+(.+)$', stripped)
-            if h1_match and not found_title:
-                result['title'] = h1_match.group(1).strip()
-                found_title = True
-                title_line_idx = i
-                i += 1
-                
-                # Check if next non-empty line is H2 (subtitle)
-                while i < len(lines) and not lines[i].strip():
-                    i += 1
-                
-                if i < len(lines):
-                    h2_match = re.match(r'^##\s+(.+)$', lines[i].strip())
-                    if h2_match:
-                        result['subtitle'] = h2_match.group(1).strip()
-                        found_subtitle = True
-                        i += 1
-                continue
-            
-            # Regular content line
-            content_lines.append(line)
-            i += 1
-        
-        # Join remaining content
-        result['content'] = '\n'.join(content_lines).strip()
-        
-        return result
+        return SlideAST.parse(markdown).to_slide_dict()
     
     def parse_multi_region_markdown(self, markdown: str) -> dict[str, Any]:
         """Parse markdown with multiple image/content regions.
@@ -649,165 +911,4 @@ class MarkdownParser:
         :param markdown: Markdown source with multiple regions.
         :return: Dict with 'regions' list and 'direction' ('horizontal' or 'vertical').
         """
-        result: dict[str, Any] = {
-            'regions': [],
-            'direction': 'horizontal',
-            'notes': '',
-            'name': '',  # Slide name from [name: ...] directive
-        }
-        
-        lines = markdown.strip().split('\n')
-        
-        # First pass: detect if this is a multi-region slide
-        image_pattern = re.compile(r'^!\[([^\]]*)\]\((.+)\)\s*$')
-        image_lines: list[tuple[int, str, str]] = []  # (line_idx, modifiers, url)
-        
-        name_pattern = re.compile(r'^\[name:\s*([^\]]+)\]$', re.IGNORECASE)
-        
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            
-            # Check for slide name directive
-            name_match = name_pattern.match(stripped)
-            if name_match:
-                result['name'] = name_match.group(1).strip()
-                continue
-            
-            # Skip presenter notes
-            if stripped.startswith('^'):
-                if result['notes']:
-                    result['notes'] += '\n'
-                result['notes'] += stripped[1:].strip()
-                continue
-            
-            match = image_pattern.match(stripped)
-            if match:
-                modifiers = match.group(1).lower()
-                url = match.group(2)
-                # Skip inline images
-                if 'inline' not in modifiers:
-                    image_lines.append((i, modifiers, url))
-        
-        # If 0 or 1 images, use standard single-region parsing
-        if len(image_lines) <= 1:
-            single = self.parse_slide_markdown(markdown)
-            if single.get('background'):
-                result['regions'] = [{
-                    'image': single['background'],
-                    'overlay_opacity': single['overlay_opacity'],
-                    'blur_radius': single['blur_radius'],
-                    'content': single['content'],
-                    'title': single['title'],
-                    'subtitle': single['subtitle'],
-                }]
-            else:
-                result['regions'] = [{
-                    'image': '',
-                    'overlay_opacity': None,
-                    'blur_radius': None,
-                    'content': single['content'],
-                    'title': single['title'],
-                    'subtitle': single['subtitle'],
-                }]
-            result['notes'] = single.get('notes', '')
-            result['name'] = single.get('name', '')
-            # Detect direction from position modifiers
-            if single.get('background_position') in ('top', 'bottom'):
-                result['direction'] = 'vertical'
-            return result
-        
-        # Determine direction from modifiers
-        has_left_right = any('left' in m or 'right' in m for _, m, _ in image_lines)
-        has_top_bottom = any('top' in m or 'bottom' in m for _, m, _ in image_lines)
-        
-        if has_top_bottom and not has_left_right:
-            result['direction'] = 'vertical'
-        else:
-            result['direction'] = 'horizontal'
-        
-        # Split content into regions based on image positions
-        # Each region starts at an image line and ends before the next image
-        for idx, (line_idx, modifiers, url) in enumerate(image_lines):
-            # Find end of this region (start of next image or end of file)
-            if idx + 1 < len(image_lines):
-                end_idx = image_lines[idx + 1][0]
-            else:
-                end_idx = len(lines)
-            
-            # Extract content lines for this region (excluding the image line)
-            region_lines = []
-            for j in range(line_idx + 1, end_idx):
-                stripped = lines[j].strip()
-                # Skip presenter notes (already extracted)
-                if not stripped.startswith('^'):
-                    region_lines.append(lines[j])
-            
-            region_content = '\n'.join(region_lines).strip()
-            
-            # Parse title/subtitle from region content
-            region_title = ''
-            region_subtitle = ''
-            final_content_lines = []
-            
-            content_started = False
-            for line in region_lines:
-                stripped = line.strip()
-                
-                # Check for H1 title
-                h1_match = re.match(r'^#\s+(.+)$', stripped)
-                if h1_match and not region_title and not content_started:
-                    region_title = h1_match.group(1).strip()
-                    continue
-                
-                # Check for H2 subtitle (only right after title)
-                h2_match = re.match(r'^##\s+(.+)$', stripped)
-                if h2_match and region_title and not region_subtitle and not content_started:
-                    if not stripped or h2_match:
-                        region_subtitle = h2_match.group(1).strip()
-                        continue
-                
-                # Everything else is content
-                if stripped:
-                    content_started = True
-                final_content_lines.append(line)
-            
-            # Determine image URL
-            is_color = url.startswith('#') or 'gradient' in url.lower()
-            image_url = url if is_color else f'url({url})'
-            
-            # Parse filter and position modifiers from this region's modifiers
-            mod_list = modifiers.split()
-            overlay_opacity = None
-            blur_radius = None
-            position = ''  # left, right, top, bottom
-            
-            for mod in mod_list:
-                if mod == 'overlay':
-                    overlay_opacity = -1.0  # Sentinel for "use theme default"
-                elif mod.startswith('overlay:'):
-                    try:
-                        overlay_opacity = float(mod.split(':')[1])
-                    except (ValueError, IndexError):
-                        overlay_opacity = -1.0
-                elif mod == 'blur':
-                    blur_radius = -1.0  # Sentinel for "use theme default"
-                elif mod.startswith('blur:'):
-                    try:
-                        blur_radius = float(mod.split(':')[1])
-                    except (ValueError, IndexError):
-                        blur_radius = -1.0
-                elif mod in ('left', 'right', 'top', 'bottom'):
-                    position = mod
-            
-            result['regions'].append({
-                'image': image_url,
-                'modifiers': modifiers,  # Raw modifier string for ImageView
-                'overlay_opacity': overlay_opacity,
-                'blur_radius': blur_radius,
-                'position': position,
-                'content': '\n'.join(final_content_lines).strip(),
-                'title': region_title,
-                'subtitle': region_subtitle,
-            })
-        
-        return result
+        return SlideAST.parse(markdown).to_multi_region_dict()
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING
 
 from nicegui import ui
 
-from .content_elements import MediaView
+from .content_elements import DEFAULT_BLUR_RADIUS, MediaView
 
 if TYPE_CHECKING:
     from ..slide import Slide
@@ -376,11 +376,7 @@ def build_slide_layout(
     theme_overlay_color = overlay_style.color if overlay_style.color else 'rgba(0, 0, 0, 0.5)'
     theme_overlay_opacity = getattr(overlay_style, 'opacity', 0.5) if overlay_style else 0.5
     
-    blur_style = style.get('blur')
-    theme_blur_radius = 4  # Default
-    if blur_style and hasattr(blur_style, 'css') and blur_style.css:
-        # Try to extract radius from css if set
-        pass
+    theme_blur_radius = DEFAULT_BLUR_RADIUS
     
     # Get split background color from theme
     split_bg_style = style.get('split_background')
@@ -513,7 +509,7 @@ def _build_multi_region_layout(
     # Get theme defaults for filters
     overlay_style = style.get('overlay')
     theme_overlay_opacity = getattr(overlay_style, 'opacity', 0.5) if overlay_style else 0.5
-    theme_blur_radius = 4  # Default
+    theme_blur_radius = DEFAULT_BLUR_RADIUS
     
     split_bg_style = style.get('split_background')
     split_bg_color = split_bg_style.color if split_bg_style.color else '#1a1a2e'
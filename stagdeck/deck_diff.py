@@ -0,0 +1,168 @@
+"""🔍 Deck diff - structural changes between two slide decks."""
+
+import hashlib
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from .slide import Slide
+
+
+def slide_fingerprint(slide: 'Slide') -> str:
+    """🔑 Fingerprint a slide's content (everything but its name).
+    
+    Covers the displayed text, backgrounds, regions, steps, timing, the
+    slide-level theme overrides, the data dict and the slide's class (for
+    slides with custom build_content). Values in data without a stable
+    repr make independently built slides differ, so they count as modified.
+    
+    :param slide: The slide.
+    :return: Hex digest.
+    """
+    cls = type(slide)
+    overrides = slide.theme_context.slide_overrides if slide.theme_context else None
+    regions = tuple(
+        (r.image, r.modifiers, r.content, r.title, r.subtitle, r.position,
+         r.theme_context.slide_overrides if r.theme_context else None)
+        for r in slide.regions
+    )
+    key = (
+        cls.__module__, cls.__qualname__,
+        slide.layout, slide.title, slide.subtitle, slide.content, slide.final_content, slide.notes,
+        slide.background_color, slide.background_modifiers, slide.background_position,
+        regions, slide.region_direction, overrides,
+        slide.steps, slide.step_names, slide.step_durations, slide.transition_duration,
+        slide.data,
+    )
+    return hashlib.md5(repr(key).encode('utf-8')).hexdigest()
+
+
+@dataclass
+class DeckDiff:
+    """🔍 Changes that turn one deck's slide list into another's.
+    
+    Slides are given by index: old indices refer to the deck diff() was
+    called on, new indices to the other deck. Every slide of either deck is
+    either matched or listed in added/removed.
+    
+    :ivar added: New indices of slides without a counterpart in the old deck.
+    :ivar removed: Old indices of slides without a counterpart in the new deck.
+    :ivar moved: (old, new) index pairs of matched slides whose order changed
+        relative to the other matched slides.
+    :ivar modified: (old, new) index pairs of matched slides whose content changed.
+    :ivar renamed: (old, new) index pairs of matched slides whose name changed.
+    """
+    added: list[int] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+    moved: list[tuple[int, int]] = field(default_factory=list)
+    modified: list[tuple[int, int]] = field(default_factory=list)
+    renamed: list[tuple[int, int]] = field(default_factory=list)
+    
+    @property
+    def changed(self) -> bool:
+        """Whether the decks differ at all."""
+        return bool(self.added or self.removed or self.moved or self.modified or self.renamed)
+
+
+def _group_by_key(keys: Sequence[object], indices: list[int]) -> dict[object, list[int]]:
+    """Group indices by key, each group in reverse order (next match last)."""
+    groups: dict[object, list[int]] = {}
+    for i in reversed(indices):
+        groups.setdefault(keys[i], []).append(i)
+    return groups
+
+
+def _pair_by_key(
+    old_keys: Sequence[object],
+    new_keys: Sequence[object],
+    old_free: list[int],
+    new_free: list[int],
+    pairs: dict[int, int],
+) -> tuple[list[int], list[int]]:
+    """Pair unmatched slides with equal keys in order of appearance.
+    
+    :return: Old and new indices still unmatched afterwards.
+    """
+    groups = _group_by_key(old_keys, old_free)
+    unmatched_new = []
+    for j in new_free:
+        candidates = groups.get(new_keys[j])
+        if candidates:
+            pairs[candidates.pop()] = j
+        else:
+            unmatched_new.append(j)
+    matched = set(pairs)
+    return [i for i in old_free if i not in matched], unmatched_new
+
+
+def _stable(new_indices: list[int]) -> set[int]:
+    """Positions in new_indices forming a longest increasing subsequence.
+    
+    Matched slides on it keep their relative order; the others moved.
+    """
+    tails: list[int] = []  # Smallest tail value of increasing runs by length
+    tail_at: list[int] = []  # Position of each tail in new_indices
+    previous = [-1] * len(new_indices)
+    for position, value in enumerate(new_indices):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_at.append(position)
+        else:
+            tails[length] = value
+            tail_at[length] = position
+        previous[position] = tail_at[length - 1] if length else -1
+    
+    stable = set()
+    position = tail_at[-1] if tail_at else -1
+    while position >= 0:
+        stable.add(position)
+        position = previous[position]
+    return stable
+
+
+def diff_slides(old: Sequence['Slide'], new: Sequence['Slide']) -> DeckDiff:
+    """🔍 Compute the changes from one slide list to another.
+    
+    Slides are matched in three passes, each on what the earlier ones left:
+    same name and content, then same content (renamed, e.g. shifted
+    auto-generated names), then same name (modified). Identical Slide
+    objects are not fingerprinted again.
+    
+    :param old: Slides before the change.
+    :param new: Slides after the change.
+    :return: The DeckDiff.
+    """
+    old_prints: list[str | None] = [None] * len(old)
+    new_prints: list[str | None] = [None] * len(new)
+    shared = {id(slide): i for i, slide in enumerate(old)}
+    for j, slide in enumerate(new):
+        i = shared.get(id(slide))
+        if i is not None and old_prints[i] is None:
+            # Same object: same content, whatever it is
+            old_prints[i] = new_prints[j] = f'id:{id(slide)}'
+    old_prints = [p or slide_fingerprint(s) for p, s in zip(old_prints, old)]
+    new_prints = [p or slide_fingerprint(s) for p, s in zip(new_prints, new)]
+    
+    pairs: dict[int, int] = {}
+    old_free, new_free = list(range(len(old))), list(range(len(new)))
+    old_keys = [(s.name, p) for s, p in zip(old, old_prints)]
+    new_keys = [(s.name, p) for s, p in zip(new, new_prints)]
+    old_free, new_free = _pair_by_key(old_keys, new_keys, old_free, new_free, pairs)
+    old_free, new_free = _pair_by_key(old_prints, new_prints, old_free, new_free, pairs)
+    old_names = [s.name for s in old]
+    new_names = [s.name for s in new]
+    old_free, new_free = _pair_by_key(old_names, new_names, old_free, new_free, pairs)
+    
+    result = DeckDiff(added=new_free, removed=old_free)
+    ordered = sorted(pairs.items())
+    stable = _stable([j for _, j in ordered])
+    for position, (i, j) in enumerate(ordered):
+        if position not in stable:
+            result.moved.append((i, j))
+        if old_prints[i] != new_prints[j]:
+            result.modified.append((i, j))
+        if old_names[i] != new_names[j]:
+            result.renamed.append((i, j))
+    return result
@@ -1,32 +1,418 @@
 """👁️ FileWatcher - Watch files for changes and trigger hot-reload."""
 
 import asyncio
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from abc import ABC, abstractmethod
+from collections import Counter
+from functools import partial
 from pathlib import Path
 from typing import Callable
 
 
+class WatchBackend(ABC):
+    """🔌 Base class for change detection backends used by FileWatcher.
+    
+    A backend only reports *candidate* paths. FileWatcher does the mtime
+    bookkeeping for watched files and dispatches callbacks.
+    """
+    
+    @abstractmethod
+    def add_file(self, path: Path) -> None:
+        """Start tracking a single file.
+        
+        :param path: Resolved path of an existing file.
+        """
+    
+    @abstractmethod
+    def add_directory(self, path: Path, recursive: bool = True) -> None:
+        """Start tracking all files inside a directory.
+        
+        :param path: Resolved path of an existing directory.
+        :param recursive: Also track files in subdirectories.
+        """
+    
+    def remove_file(self, path: Path) -> None:
+        """Stop tracking a file added with add_file()."""
+    
+    def remove_directory(self, path: Path) -> None:
+        """Stop tracking a directory added with add_directory()."""
+    
+    @abstractmethod
+    async def wait_for_changes(self) -> set[Path]:
+        """Wait until at least one tracked path changed.
+        
+        :return: Changed paths, or an empty set if the backend was closed.
+        """
+    
+    def drain(self) -> set[Path]:
+        """Return changes that arrived since the last call without waiting."""
+        return set()
+    
+    def close(self) -> None:
+        """Release backend resources and wake up pending waiters."""
+
+
+class PollingBackend(WatchBackend):
+    """⏲️ Portable backend that compares mtimes every `check_interval` seconds."""
+    
+    def __init__(self, check_interval: float = 0.5):
+        """Initialize the polling backend.
+        
+        :param check_interval: How often to check for changes (seconds).
+        """
+        self.check_interval = check_interval
+        self._files: dict[Path, float] = {}
+        self._directories: dict[Path, bool] = {}  # path -> recursive
+        self._snapshots: dict[Path, dict[Path, float]] = {}
+        self._closed = asyncio.Event()
+    
+    def add_file(self, path: Path) -> None:
+        if path not in self._files:
+            self._files[path] = path.stat().st_mtime
+    
+    def add_directory(self, path: Path, recursive: bool = True) -> None:
+        self._directories[path] = recursive
+        self._snapshots[path] = self._scan(path, recursive)
+    
+    def remove_file(self, path: Path) -> None:
+        self._files.pop(path, None)
+    
+    def remove_directory(self, path: Path) -> None:
+        self._directories.pop(path, None)
+        self._snapshots.pop(path, None)
+    
+    @staticmethod
+    def _scan(directory: Path, recursive: bool) -> dict[Path, float]:
+        """Collect mtimes of all files in a directory."""
+        entries = directory.rglob('*') if recursive else directory.iterdir()
+        snapshot = {}
+        for entry in entries:
+            try:
+                if entry.is_file():
+                    snapshot[entry] = entry.stat().st_mtime
+            except OSError:
+                continue
+        return snapshot
+    
+    def _poll(self) -> set[Path]:
+        """Check all tracked paths once."""
+        changed: set[Path] = set()
+        for path, last_mtime in list(self._files.items()):
+            try:
+                current_mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            if current_mtime != last_mtime:
+                self._files[path] = current_mtime
+                changed.add(path)
+        for directory, recursive in self._directories.items():
+            if not directory.exists():
+                continue
+            old = self._snapshots[directory]
+            new = self._scan(directory, recursive)
+            changed.update(p for p, mtime in new.items() if old.get(p) != mtime)
+            changed.update(p for p in old if p not in new)
+            self._snapshots[directory] = new
+        return changed
+    
+    async def wait_for_changes(self) -> set[Path]:
+        while not self._closed.is_set():
+            try:
+                await asyncio.wait_for(self._closed.wait(), timeout=self.check_interval)
+            except asyncio.TimeoutError:
+                pass
+            if self._closed.is_set():
+                break
+            changed = self._poll()
+            if changed:
+                return changed
+        return set()
+    
+    def close(self) -> None:
+        self._closed.set()
+
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_IN_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+)
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    """Load libc if it provides the inotify API."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, 'inotify_init1'):
+        return None
+    return libc
+
+
+class InotifyBackend(WatchBackend):
+    """⚡ Event-driven backend using Linux inotify.
+    
+    Watches the parent directory of each file, so editors that save by
+    writing a temporary file and renaming it are detected as well.
+    Idle cost is zero: the event loop only wakes up when the kernel
+    reports a change.
+    """
+    
+    def __init__(self):
+        """Initialize the inotify instance.
+        
+        :raises OSError: If inotify is unavailable or the instance limit is reached.
+        """
+        self._libc = _load_libc()
+        if self._libc is None:
+            raise OSError('inotify is not available on this platform')
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f'inotify_init1 failed: {os.strerror(errno)}')
+        self._wd_to_dir: dict[int, Path] = {}
+        self._dir_to_wd: dict[Path, int] = {}
+        self._files: set[Path] = set()
+        self._directories: dict[Path, bool] = {}  # path -> recursive
+        self._pending: set[Path] = set()
+        self._event = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closed = False
+    
+    def _add_watch(self, directory: Path) -> None:
+        """Register an inotify watch for a directory (once)."""
+        if directory in self._dir_to_wd:
+            return
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _IN_WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f'inotify_add_watch failed for {directory}: {os.strerror(errno)}')
+        self._wd_to_dir[wd] = directory
+        self._dir_to_wd[directory] = wd
+    
+    def add_file(self, path: Path) -> None:
+        self._files.add(path)
+        self._add_watch(path.parent)
+    
+    def add_directory(self, path: Path, recursive: bool = True) -> None:
+        self._directories[path] = recursive
+        self._add_watch(path)
+        if recursive:
+            for sub in path.rglob('*'):
+                if sub.is_dir():
+                    self._add_watch(sub)
+    
+    def remove_file(self, path: Path) -> None:
+        self._files.discard(path)
+        self._release_watch(path.parent)
+    
+    def remove_directory(self, path: Path) -> None:
+        self._directories.pop(path, None)
+        for directory in [d for d in self._dir_to_wd if d.is_relative_to(path)]:
+            self._release_watch(directory)
+    
+    def _release_watch(self, directory: Path) -> None:
+        """Remove the inotify watch of a directory no tracked path needs anymore."""
+        wd = self._dir_to_wd.get(directory)
+        if wd is None or self._closed:
+            return
+        if any(path.parent == directory for path in self._files):
+            return
+        for watched, recursive in self._directories.items():
+            if directory == watched or (recursive and directory.is_relative_to(watched)):
+                return
+        self._libc.inotify_rm_watch(self._fd, wd)
+        del self._dir_to_wd[directory]
+        del self._wd_to_dir[wd]
+    
+    def _is_tracked(self, path: Path, directory: Path) -> bool:
+        """Check whether an event path belongs to a watched file or directory."""
+        if path in self._files:
+            return True
+        for watched, recursive in self._directories.items():
+            if directory == watched or (recursive and directory.is_relative_to(watched)):
+                return True
+        return False
+    
+    def _on_readable(self) -> None:
+        """Read and decode all queued inotify events."""
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            except OSError:
+                return
+            if not data:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                directory = self._wd_to_dir.get(wd)
+                if directory is None:
+                    continue
+                if mask & _IN_IGNORED:
+                    del self._wd_to_dir[wd]
+                    self._dir_to_wd.pop(directory, None)
+                    continue
+                if not name:
+                    continue
+                path = directory / os.fsdecode(name)
+                if mask & _IN_ISDIR:
+                    # Follow newly created subdirectories of recursive watches
+                    if mask & (_IN_CREATE | _IN_MOVED_TO) and self._is_tracked(path, directory):
+                        try:
+                            self.add_directory(path, recursive=True)
+                        except OSError:
+                            pass
+                    continue
+                if self._is_tracked(path, directory):
+                    self._pending.add(path)
+        if self._pending:
+            self._event.set()
+    
+    async def wait_for_changes(self) -> set[Path]:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            self._loop.add_reader(self._fd, self._on_readable)
+        while not self._pending and not self._closed:
+            self._event.clear()
+            await self._event.wait()
+        return self.drain()
+    
+    def drain(self) -> set[Path]:
+        changed, self._pending = self._pending, set()
+        return changed
+    
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self._fd)
+        os.close(self._fd)
+        self._event.set()
+
+
+def create_backend(kind: str = 'auto', check_interval: float = 0.5) -> WatchBackend:
+    """🏭 Create a change detection backend.
+    
+    :param kind: 'auto' (inotify when available, else polling), 'inotify' or 'polling'.
+    :param check_interval: Poll interval for the polling backend (seconds).
+    :return: A new backend instance.
+    :raises ValueError: If the backend kind is unknown.
+    :raises OSError: If 'inotify' was requested explicitly but is unavailable.
+    """
+    if kind == 'polling':
+        return PollingBackend(check_interval)
+    if kind == 'inotify':
+        return InotifyBackend()
+    if kind == 'auto':
+        try:
+            return InotifyBackend()
+        except OSError:
+            # Unsupported platform or inotify instance limit reached
+            return PollingBackend(check_interval)
+    raise ValueError(f"Unknown watch backend: '{kind}'")
+
+
 class FileWatcher:
     """Watch files for changes and trigger callbacks.
     
-    Each DeckViewer instance has its own FileWatcher.
-    Components register files via the viewer's `register_watched_file()` method.
+    All DeckViewer instances share one process-wide watcher (get_instance()),
+    so the number of open clients never costs more than one inotify instance.
+    Each viewer subscribes a callback and filters the changes by the files of
+    its own deck. Components register files via the viewer's
+    `register_watched_file()` method.
+    
+    Change detection is delegated to a pluggable backend: inotify on Linux,
+    mtime polling everywhere else. Rapid successive writes (e.g. an editor
+    saving via temp file + rename) are coalesced into a single callback
+    per path.
+    
+    Paths are reference counted: each watch() is balanced by an unwatch(),
+    and a path is only dropped once nobody watches it anymore.
     
     Example:
         >>> watcher = FileWatcher()
         >>> watcher.watch(Path('slides.md'))
+        >>> watcher.watch_directory(Path('media'))
         >>> watcher.on_change(lambda p: print(f'Changed: {p}'))
         >>> await watcher.start()
     """
     
-    def __init__(self, check_interval: float = 0.5):
+    _instance: 'FileWatcher | None' = None
+    
+    def __init__(
+        self,
+        check_interval: float = 0.5,
+        backend: str | WatchBackend | Callable[[], WatchBackend] = 'auto',
+        debounce: float = 0.05,
+    ):
         """Initialize the file watcher.
         
-        :param check_interval: How often to check for changes (seconds).
+        :param check_interval: How often to check for changes when polling (seconds).
+        :param backend: Backend kind ('auto', 'inotify', 'polling'), a function
+            creating a backend, or a backend instance. stop() closes the
+            backend; kinds and functions create a new one on restart, a
+            watcher built from an instance cannot be started again.
+        :param debounce: Time window for coalescing bursts of events (seconds).
         """
         self.check_interval = check_interval
+        self.debounce = debounce
+        if isinstance(backend, WatchBackend):
+            self._backend_factory: Callable[[], WatchBackend] | None = None
+            self._backend = backend
+        else:
+            if isinstance(backend, str):
+                backend = partial(create_backend, backend, check_interval)
+            self._backend_factory = backend
+            self._backend = backend()
+        self._backend_closed = False
         self._files: dict[Path, float] = {}  # path -> last mtime
+        self._directories: dict[Path, bool] = {}  # path -> recursive
+        self._refs: Counter[Path] = Counter()  # watch() calls not yet balanced by unwatch()
         self._callbacks: list[Callable[[Path], None]] = []
         self._running = False
+        self._task: asyncio.Task | None = None
+    
+    @classmethod
+    def get_instance(cls) -> 'FileWatcher':
+        """🔍 Get the process-wide watcher shared by all viewers."""
+        if cls._instance is None:
+            cls._instance = FileWatcher()
+        return cls._instance
+    
+    @property
+    def backend(self) -> WatchBackend:
+        """The active change detection backend."""
+        return self._backend
+    
+    @property
+    def is_running(self) -> bool:
+        """Whether the watch loop is active."""
+        return self._running
     
     def watch(self, path: Path | str) -> None:
         """Add a file to watch.
@@ -34,8 +420,50 @@ class FileWatcher:
         :param path: Path to the file to watch.
         """
         path = Path(path).resolve()
+        self._refs[path] += 1
         if path.exists() and path not in self._files:
             self._files[path] = path.stat().st_mtime
+            if not self._backend_closed:
+                self._backend.add_file(path)
+    
+    def watch_directory(self, path: Path | str, recursive: bool = True) -> None:
+        """Add a directory to watch. Any file change inside triggers callbacks.
+        
+        :param path: Path to the directory to watch.
+        :param recursive: Also watch subdirectories.
+        """
+        path = Path(path).resolve()
+        self._refs[path] += 1
+        if path.is_dir() and path not in self._directories:
+            self._directories[path] = recursive
+            if not self._backend_closed:
+                self._backend.add_directory(path, recursive)
+    
+    def unwatch(self, path: Path | str) -> None:
+        """➖ Undo one watch() of a file; it is dropped once nobody watches it.
+        
+        :param path: Path passed to watch().
+        """
+        path = Path(path).resolve()
+        if self._release(path) and self._files.pop(path, None) is not None and not self._backend_closed:
+            self._backend.remove_file(path)
+    
+    def unwatch_directory(self, path: Path | str) -> None:
+        """➖ Undo one watch_directory(); it is dropped once nobody watches it.
+        
+        :param path: Path passed to watch_directory().
+        """
+        path = Path(path).resolve()
+        if self._release(path) and self._directories.pop(path, None) is not None and not self._backend_closed:
+            self._backend.remove_directory(path)
+    
+    def _release(self, path: Path) -> bool:
+        """Drop one reference to a path; True if it was the last one."""
+        if self._refs[path] > 1:
+            self._refs[path] -= 1
+            return False
+        del self._refs[path]
+        return True
     
     def on_change(self, callback: Callable[[Path], None]) -> None:
         """Register a callback for file changes.
@@ -44,19 +472,99 @@ class FileWatcher:
         """
         self._callbacks.append(callback)
     
+    def subscribe(self, callback: Callable[[Path], None]) -> Callable[[], None]:
+        """➕ Register a callback and start watching in the running event loop.
+        
+        Unsubscribing the last callback stops the watcher and forgets all
+        watched paths; the next subscription starts it again.
+        
+        :param callback: Function called with each changed path; must be cheap.
+        :return: Function that unsubscribes the callback again.
+        :raises RuntimeError: If the watcher was stopped and its backend
+            instance cannot be recreated.
+        """
+        if not self._running:
+            self._reopen_backend()
+        self._callbacks.append(callback)
+        if not self._running:
+            self._running = True
+            self._task = asyncio.get_running_loop().create_task(self.start(), name='stagdeck-file-watcher')
+        
+        def unsubscribe() -> None:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+            if not self._callbacks and self._running:
+                self.stop()
+                self._files.clear()
+                self._directories.clear()
+                self._refs.clear()
+        
+        return unsubscribe
+    
+    def _reopen_backend(self) -> None:
+        """Recreate a closed backend and re-register all watched paths.
+        
+        :raises RuntimeError: If the backend was passed as an instance.
+        """
+        if not self._backend_closed:
+            return
+        if self._backend_factory is None:
+            raise RuntimeError(
+                'FileWatcher was stopped and its backend instance is closed; '
+                'pass a backend kind or factory to restart watching'
+            )
+        self._backend = self._backend_factory()
+        self._backend_closed = False
+        for path in self._files:
+            self._backend.add_file(path)
+        for path, recursive in self._directories.items():
+            self._backend.add_directory(path, recursive)
+    
+    def _has_changed(self, path: Path) -> bool:
+        """Update mtime bookkeeping and check if a watched file really changed."""
+        if path not in self._files:
+            # File inside a watched directory, unless that was unwatched since
+            return any(
+                path.is_relative_to(directory) if recursive else path.parent == directory
+                for directory, recursive in self._directories.items()
+            )
+        try:
+            current_mtime = path.stat().st_mtime
+        except OSError:
+            return False
+        if current_mtime == self._files[path]:
+            return False
+        self._files[path] = current_mtime
+        return True
+    
     async def start(self) -> None:
-        """Start watching files for changes."""
+        """Start watching files for changes.
+        
+        :raises RuntimeError: If the watcher was stopped and its backend
+            instance cannot be recreated.
+        """
+        self._reopen_backend()
         self._running = True
-        while self._running:
-            await asyncio.sleep(self.check_interval)
-            for path, last_mtime in list(self._files.items()):
-                if path.exists():
-                    current_mtime = path.stat().st_mtime
-                    if current_mtime > last_mtime:
-                        self._files[path] = current_mtime
-                        for callback in self._callbacks:
-                            callback(path)
+        backend = self._backend
+        # A loop whose backend was replaced (stop() and restart) just ends
+        while self._running and self._backend is backend:
+            changed = await backend.wait_for_changes()
+            if not self._running or self._backend is not backend or not changed:
+                break
+            if self.debounce > 0:
+                # Coalesce bursts of events into one callback per path
+                await asyncio.sleep(self.debounce)
+                changed |= backend.drain()
+                if not self._running or self._backend is not backend:
+                    break
+            for path in sorted(changed):
+                if self._has_changed(path):
+                    for callback in list(self._callbacks):
+                        callback(path)
     
     def stop(self) -> None:
         """Stop watching files."""
         self._running = False
+        if not self._backend_closed:
+            self._backend_closed = True
+            self._backend.close()
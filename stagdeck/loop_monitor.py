@@ -0,0 +1,126 @@
+"""⏱️ Event-loop lag monitor - detects handlers that block the NiceGUI loop."""
+
+import asyncio
+import warnings
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+
+class LoopLagMonitor:
+    """⏱️ Heartbeat task that measures how late the event loop wakes up.
+    
+    Every `interval` seconds the monitor sleeps and checks how much later than
+    requested it was resumed. A lag above `threshold` means some code held the
+    loop (e.g. a synchronous deck factory) and every connected client froze
+    for that long; it is reported with warnings.warn(), naming the page
+    handlers that were running at the time.
+    
+    Example:
+        >>> monitor = LoopLagMonitor.get_instance()
+        >>> app.on_startup(monitor.start)
+        >>> with monitor.track('/'):  # inside a page handler
+        ...     ...
+    
+    :ivar threshold: Lag in seconds above which a stall is reported.
+    :ivar interval: Heartbeat interval in seconds.
+    :ivar last_lag: Most recently measured lag in seconds.
+    :ivar max_lag: Largest lag measured since start.
+    :ivar stalls: Number of reported stalls.
+    """
+    
+    _instance: 'LoopLagMonitor | None' = None
+    
+    def __init__(self, threshold: float = 0.25, interval: float = 0.1) -> None:
+        """
+        Create a monitor (not started yet).
+        
+        :param threshold: Lag in seconds above which a stall is reported.
+        :param interval: Heartbeat interval in seconds.
+        """
+        self.threshold = threshold
+        self.interval = interval
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+        self._active: Counter[str] = Counter()
+        self._listeners: list[Callable[[float], None]] = []
+        self._task: asyncio.Task | None = None
+    
+    @classmethod
+    def get_instance(cls) -> 'LoopLagMonitor':
+        """🔍 Get the shared monitor instance."""
+        if cls._instance is None:
+            cls._instance = LoopLagMonitor()
+        return cls._instance
+    
+    @property
+    def is_running(self) -> bool:
+        """Whether the heartbeat task is active."""
+        return self._task is not None and not self._task.done()
+    
+    def start(self) -> None:
+        """▶️ Start the heartbeat on the running event loop (idempotent)."""
+        if self.is_running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run(), name='stagdeck-loop-monitor')
+    
+    def stop(self) -> None:
+        """⏹️ Stop the heartbeat."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+    
+    def add_listener(self, callback: Callable[[float], None]) -> None:
+        """➕ Call a function with every lag measurement (in seconds).
+        
+        :param callback: Called right after the loop resumed; must be cheap.
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+    
+    def remove_listener(self, callback: Callable[[float], None]) -> None:
+        """➖ Stop calling a lag listener."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+    
+    @contextmanager
+    def track(self, label: str) -> Iterator[None]:
+        """Mark a handler as running, so stalls can be attributed to it.
+        
+        :param label: Name reported in stall warnings (e.g. the page path).
+        """
+        self._active[label] += 1
+        try:
+            yield
+        finally:
+            self._active[label] -= 1
+            if not self._active[label]:
+                del self._active[label]
+    
+    async def _run(self) -> None:
+        """Heartbeat loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(loop.time() - expected)
+    
+    def record(self, lag: float) -> None:
+        """Record one lag measurement and warn if it exceeds the threshold.
+        
+        :param lag: Measured lag in seconds.
+        """
+        lag = max(0.0, lag)
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        for listener in self._listeners:
+            listener(lag)
+        if lag <= self.threshold:
+            return
+        self.stalls += 1
+        active = f" while handling {', '.join(sorted(self._active))}" if self._active else ''
+        warnings.warn(
+            f'Event loop blocked for {lag * 1000:.0f} ms{active}; '
+            f'move slow work to async code or a thread'
+        )
@@ -0,0 +1,263 @@
+"""🔬 Build profiler - finds slides and builders that block the event loop."""
+
+import argparse
+import json
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from nicegui import Client
+
+
+PROFILE_URL = '/stagdeck/profile'
+SORT_KEYS = ('total', 'max', 'mean', 'cpu', 'elements', 'lag', 'builds', 'slide')
+
+
+@dataclass
+class SlideBuildStats:
+    """📊 Aggregated build statistics of one slide step.
+    
+    :ivar slide: Slide index in the deck.
+    :ivar name: Slide name.
+    :ivar step: Step index.
+    :ivar builds: Number of measured builds.
+    :ivar total: Total wall time in seconds.
+    :ivar max: Slowest build in seconds.
+    :ivar cpu: Total CPU time in seconds (time the event loop was held).
+    :ivar elements: UI elements created by the last build.
+    :ivar lag: Largest event-loop lag observed while the step was built.
+    """
+    slide: int
+    name: str
+    step: int
+    builds: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    cpu: float = 0.0
+    elements: int = 0
+    lag: float = 0.0
+    
+    @property
+    def mean(self) -> float:
+        """Average wall time per build in seconds."""
+        return self.total / self.builds if self.builds else 0.0
+    
+    def to_dict(self) -> dict:
+        """Export as JSON-serializable dictionary (including the mean)."""
+        return {**asdict(self), 'mean': self.mean}
+
+
+class BuildProfiler:
+    """🔬 Records how long each slide step takes to build.
+    
+    While enabled, DeckViewer measures every slide build: wall time, CPU time
+    on the event-loop thread, number of UI elements created and the
+    event-loop lag reported by the LoopLagMonitor during the build. Results
+    are aggregated per (slide, step) and available as a sortable report via
+    report(), the profiling endpoint or the command line.
+    
+    Example:
+        >>> profiler = BuildProfiler.get_instance()
+        >>> profiler.enable()
+        >>> # ... click through the deck ...
+        >>> print(profiler.format_report(sort_by='max', limit=10))
+    
+    :ivar enabled: Whether builds are measured.
+    """
+    
+    _instance: 'BuildProfiler | None' = None
+    
+    def __init__(self, history: int = 256) -> None:
+        """
+        Create a profiler (disabled).
+        
+        :param history: Number of recent builds kept for attributing loop lag.
+        """
+        self.enabled = False
+        self._stats: dict[tuple[int, str, int], SlideBuildStats] = {}
+        self._recent: deque[tuple[SlideBuildStats, float, float]] = deque(maxlen=history)
+    
+    @classmethod
+    def get_instance(cls) -> 'BuildProfiler':
+        """🔍 Get the shared profiler instance."""
+        if cls._instance is None:
+            cls._instance = BuildProfiler()
+        return cls._instance
+    
+    def enable(self) -> None:
+        """▶️ Start measuring builds and listening to the loop-lag monitor."""
+        from .loop_monitor import LoopLagMonitor
+        
+        self.enabled = True
+        LoopLagMonitor.get_instance().add_listener(self._on_lag)
+    
+    def disable(self) -> None:
+        """⏹️ Stop measuring builds (recorded statistics are kept)."""
+        from .loop_monitor import LoopLagMonitor
+        
+        self.enabled = False
+        LoopLagMonitor.get_instance().remove_listener(self._on_lag)
+    
+    def reset(self) -> None:
+        """🧹 Drop all recorded statistics."""
+        self._stats.clear()
+        self._recent.clear()
+    
+    @contextmanager
+    def measure(self, slide: int, name: str, step: int, client: 'Client | None' = None) -> Iterator[None]:
+        """⏱️ Measure one slide build (no-op while disabled).
+        
+        :param slide: Slide index.
+        :param name: Slide name.
+        :param step: Step index.
+        :param client: Client the elements are created in, for counting them.
+        """
+        if not self.enabled:
+            yield
+            return
+        first_id = client.next_element_id if client is not None else 0
+        start = time.monotonic()
+        start_cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            end = time.monotonic()
+            key = (slide, name, step)
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = SlideBuildStats(slide, name, step)
+            duration = end - start
+            stats.builds += 1
+            stats.total += duration
+            stats.max = max(stats.max, duration)
+            stats.cpu += time.thread_time() - start_cpu
+            stats.elements = client.next_element_id - first_id if client is not None else 0
+            self._recent.append((stats, start, end))
+    
+    def _on_lag(self, lag: float) -> None:
+        """Attribute a loop stall to the builds that overlapped it."""
+        if not self.enabled or lag <= 0:
+            return
+        now = time.monotonic()
+        for stats, start, end in reversed(self._recent):
+            if end < now - lag:
+                break
+            if start <= now:
+                stats.lag = max(stats.lag, lag)
+    
+    def report(self, sort_by: str = 'total', limit: int | None = None) -> list[dict]:
+        """📋 Get the aggregated statistics, slowest first.
+        
+        :param sort_by: One of SORT_KEYS ('slide' sorts by deck position).
+        :param limit: Maximum number of rows (None = all).
+        :return: List of dictionaries (see SlideBuildStats).
+        :raises ValueError: If sort_by is unknown.
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key '{sort_by}', use one of {', '.join(SORT_KEYS)}")
+        rows = [stats.to_dict() for stats in self._stats.values()]
+        if sort_by == 'slide':
+            rows.sort(key=lambda row: (row['slide'], row['step']))
+        else:
+            rows.sort(key=lambda row: row[sort_by], reverse=True)
+        return rows[:limit] if limit is not None else rows
+    
+    def format_report(self, sort_by: str = 'total', limit: int | None = None) -> str:
+        """📋 Format the report as a text table (times in milliseconds)."""
+        return format_rows(self.report(sort_by, limit))
+
+
+def format_rows(rows: list[dict]) -> str:
+    """Format report rows as a text table (times in milliseconds)."""
+    header = f"{'slide':>5} {'step':>4} {'name':<24} {'builds':>6} {'total':>9} {'mean':>8} " \
+             f"{'max':>8} {'cpu':>8} {'lag':>8} {'elements':>8}"
+    lines = [header, '-' * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['slide']:>5} {row['step']:>4} {row['name'][:24]:<24} {row['builds']:>6} "
+            f"{row['total'] * 1000:>9.1f} {row['mean'] * 1000:>8.1f} {row['max'] * 1000:>8.1f} "
+            f"{row['cpu'] * 1000:>8.1f} {row['lag'] * 1000:>8.1f} {row['elements']:>8}"
+        )
+    return '\n'.join(lines)
+
+
+def setup_profiler_endpoint(path: str = PROFILE_URL) -> BuildProfiler:
+    """Enable the build profiler and serve its report (once per path).
+    
+    Query parameters:
+        - sort: One of 'total', 'max', 'mean', 'cpu', 'elements', 'lag', 'builds', 'slide'
+        - limit: Maximum number of rows
+        - format: 'json' (default) or 'text'
+        - reset: 'true' to clear the statistics after reading
+    
+    :param path: URL path of the report.
+    :return: The shared BuildProfiler.
+    
+    Example:
+        >>> setup_profiler_endpoint()
+        >>> # GET /stagdeck/profile?sort=max&limit=20&format=text
+        >>> # or: python -m stagdeck.profiler http://localhost:8080 --sort max
+    """
+    from fastapi.responses import JSONResponse, PlainTextResponse, Response
+    from nicegui import app
+    
+    profiler = BuildProfiler.get_instance()
+    profiler.enable()
+    if any(getattr(route, 'path', None) == path for route in app.routes):
+        return profiler
+    
+    @app.get(path, include_in_schema=False)
+    async def profile_report(sort: str = 'total', limit: int | None = None,
+                             format: str = 'json', reset: bool = False) -> Response:
+        try:
+            rows = profiler.report(sort, limit)
+        except ValueError as e:
+            return PlainTextResponse(str(e), status_code=400)
+        if reset:
+            profiler.reset()
+        if format == 'text':
+            return PlainTextResponse(format_rows(rows))
+        return JSONResponse(rows)
+    
+    return profiler
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line: dump the build profile of a running StagDeck server."""
+    import urllib.parse
+    import urllib.request
+    
+    parser = argparse.ArgumentParser(
+        prog='python -m stagdeck.profiler',
+        description='Dump per-slide build times of a running StagDeck server.',
+    )
+    parser.add_argument('url', nargs='?', default='http://localhost:8080', help='Server base URL')
+    parser.add_argument('--path', default=PROFILE_URL, help='Profile endpoint path')
+    parser.add_argument('--sort', default='total', choices=SORT_KEYS, help='Sort column')
+    parser.add_argument('--limit', type=int, default=None, help='Maximum number of rows')
+    parser.add_argument('--json', action='store_true', help='Print raw JSON instead of a table')
+    parser.add_argument('--reset', action='store_true', help='Clear the statistics after reading')
+    args = parser.parse_args(argv)
+    
+    query = {'sort': args.sort}
+    if args.limit is not None:
+        query['limit'] = str(args.limit)
+    if args.reset:
+        query['reset'] = 'true'
+    url = f"{args.url.rstrip('/')}{args.path}?{urllib.parse.urlencode(query)}"
+    try:
+        with urllib.request.urlopen(url) as response:
+            rows = json.load(response)
+    except OSError as e:
+        print(f'Cannot read profile from {url}: {e}', file=sys.stderr)
+        return 1
+    print(json.dumps(rows, indent=2) if args.json else format_rows(rows))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,25 +1,136 @@
 """📋 Deck registry for managing multiple presentation decks."""
 
-from typing import Callable
+import asyncio
+import inspect
+import os
+import sys
+import threading
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Awaitable, Callable
 
 from .slide_deck import SlideDeck
 
+if TYPE_CHECKING:
+    from .file_watcher import FileWatcher
+
+
+DeckFactory = Callable[[], SlideDeck] | Callable[[], Awaitable[SlideDeck]]
+
+
+def _file_mtimes(paths: set[Path]) -> dict[Path, int]:
+    """Snapshot modification times (ns); missing files map to -1."""
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = path.stat().st_mtime_ns
+        except OSError:
+            mtimes[path] = -1
+    return mtimes
+
+
+def _folder_signature(folder: Path) -> tuple[int, int]:
+    """Summarize a media folder as (file count, newest mtime in ns)."""
+    count = 0
+    newest = 0
+    for root, _, files in os.walk(folder):
+        for name in files:
+            try:
+                mtime = os.stat(os.path.join(root, name)).st_mtime_ns
+            except OSError:
+                continue
+            count += 1
+            newest = max(newest, mtime)
+    return count, newest
+
+
+def _estimate_size(obj: object, seen: set[int] | None = None) -> int:
+    """Estimate the memory held by an object graph in bytes.
+    
+    Follows containers, instance dicts and slots; every object is counted once.
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool, type(None), Path)):
+        return size
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += _estimate_size(key, seen) + _estimate_size(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += _estimate_size(item, seen)
+    else:
+        if hasattr(obj, '__dict__'):
+            size += _estimate_size(vars(obj), seen)
+        for slot in getattr(type(obj), '__slots__', ()):
+            if hasattr(obj, slot):
+                size += _estimate_size(getattr(obj, slot), seen)
+    return size
+
+
+@dataclass
+class _CachedDeck:
+    """A built deck plus the dependency snapshot it was built from.
+    
+    :ivar deck: The built deck (never handed out; callers get clones).
+    :ivar files: Modification times of source and theme files.
+    :ivar media: Signature of each media folder.
+    :ivar size: Estimated memory footprint in bytes.
+    :ivar watched: Whether a FileWatcher reports changes of the dependencies,
+        so the snapshot does not need to be checked on every get().
+    """
+    deck: SlideDeck
+    files: dict[Path, int]
+    media: dict[Path, tuple[int, int]]
+    size: int
+    watched: bool = False
+    
+    def is_current(self) -> bool:
+        """Check that no dependency changed since the deck was built."""
+        if _file_mtimes(set(self.files)) != self.files:
+            return False
+        return all(_folder_signature(folder) == signature for folder, signature in self.media.items())
+    
+    def depends_on(self, path: Path) -> bool:
+        """Check whether a changed path is one of the deck's dependencies."""
+        return path in self.files or any(path.is_relative_to(folder) for folder in self.media)
+
 
 class DeckRegistry:
     """📋 Central registry for managing multiple presentation decks.
     
     Allows registering multiple decks and switching between them via URL.
     
+    Built decks are cached, so switching decks does not rebuild them. A cached
+    deck is rebuilt when one of its markdown source files, theme files or media
+    files changed. The cache is a memory-bounded LRU across all decks; each
+    get() returns a clone, so viewers can reload or modify their copy freely.
+    
     Attributes:
         _decks: Dictionary mapping deck names to deck factories.
         _default: Name of the default deck.
+        _cache: LRU of built decks by name.
+        max_cache_bytes: Estimated memory budget of the deck cache (0 disables it).
     """
     
     _instance: 'DeckRegistry | None' = None
     
-    def __init__(self) -> None:
-        self._decks: dict[str, Callable[[], SlideDeck]] = {}
+    DEFAULT_MAX_CACHE_BYTES = 256 * 1024 * 1024
+    
+    def __init__(self, max_cache_bytes: int = DEFAULT_MAX_CACHE_BYTES) -> None:
+        self._decks: dict[str, DeckFactory] = {}
         self._default: str = ''
+        self._cache: OrderedDict[str, _CachedDeck] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[SlideDeck]] = {}
+        self._lock = threading.RLock()
+        self._watcher: 'FileWatcher | None' = None
+        self._unsubscribe_watcher: Callable[[], None] | None = None
+        self.max_cache_bytes = max_cache_bytes
     
     @classmethod
     def get_instance(cls) -> 'DeckRegistry':
@@ -31,20 +142,21 @@ class DeckRegistry:
     def register(
         self,
         name: str,
-        factory: Callable[[], SlideDeck],
+        factory: DeckFactory,
         default: bool = False,
     ) -> 'DeckRegistry':
         """➕ Register a deck factory.
         
         Args:
             name: Unique name for the deck.
-            factory: Callable that creates and returns a SlideDeck.
+            factory: Callable or async callable that creates and returns a SlideDeck.
             default: If True, set this as the default deck.
-            
+        
         Returns:
             Self for chaining.
         """
         self._decks[name] = factory
+        self.invalidate(name)
         if default or not self._default:
             self._default = name
         return self
@@ -52,17 +164,242 @@ class DeckRegistry:
     def get(self, name: str | None = None) -> SlideDeck | None:
         """🔍 Get a deck by name.
         
+        Runs the factory in the calling thread; inside the event loop prefer
+        get_async(), which builds off the loop.
+        
         Args:
             name: Deck name, or None to get the default deck.
-            
+        
         Returns:
-            The SlideDeck instance, or None if not found.
+            A SlideDeck clone of the cached build, or None if not found.
+        
+        Raises:
+            TypeError: If the deck's factory is async.
         """
         deck_name = name if name else self._default
         factory = self._decks.get(deck_name)
         if factory is None:
             return None
-        return factory()
+        if inspect.iscoroutinefunction(factory):
+            raise TypeError(f"Deck '{deck_name}' has an async factory, use get_async()")
+        return self._load(deck_name).clone()
+    
+    async def get_async(self, name: str | None = None) -> SlideDeck | None:
+        """🔍 Get a deck by name without blocking the event loop.
+        
+        Async factories are awaited, sync factories and dependency checks run
+        in a worker thread. Concurrent requests for the same deck share one
+        build.
+        
+        Args:
+            name: Deck name, or None to get the default deck.
+        
+        Returns:
+            A SlideDeck clone of the cached build, or None if not found.
+        """
+        deck_name = name if name else self._default
+        if deck_name not in self._decks:
+            return None
+        future = self._inflight.get(deck_name)
+        if future is not None:
+            return (await asyncio.shield(future)).clone()
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[deck_name] = future
+        try:
+            deck = await self._load_async(deck_name)
+            await self._watch_entry(deck_name)
+            future.set_result(deck)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else waits
+            raise
+        finally:
+            del self._inflight[deck_name]
+        return deck.clone()
+    
+    def _cached(self, name: str) -> SlideDeck | None:
+        """Return the cached build if its dependencies are unchanged.
+        
+        Watched entries are dropped by the watcher when a dependency changes,
+        the others are checked against their snapshot.
+        """
+        entry = self._cache.get(name)
+        if entry is None or not (entry.watched or entry.is_current()):
+            return None
+        with self._lock:
+            if name in self._cache:
+                self._cache.move_to_end(name)
+        return entry.deck
+    
+    def _load(self, name: str) -> SlideDeck:
+        """Return the cached build of a sync factory, building it if stale."""
+        deck = self._cached(name)
+        if deck is None:
+            from .theme import get_theme_loader
+            
+            with get_theme_loader().record_files() as theme_files:
+                deck = self._decks[name]()
+            self._store(name, deck, theme_files)
+        return deck
+    
+    async def _load_async(self, name: str) -> SlideDeck:
+        """Return the cached build of any factory without blocking the loop."""
+        factory = self._decks[name]
+        if not inspect.iscoroutinefunction(factory):
+            return await asyncio.to_thread(self._load, name)
+        
+        deck = await asyncio.to_thread(self._cached, name)
+        if deck is None:
+            from .theme import get_theme_loader
+            
+            with get_theme_loader().record_files() as theme_files:
+                deck = await factory()
+            await asyncio.to_thread(self._store, name, deck, theme_files)
+        return deck
+    
+    def _store(self, name: str, deck: SlideDeck, theme_files: set[Path]) -> None:
+        """Snapshot a freshly built deck's dependencies and cache it.
+        
+        Decks are not cached if caching is disabled or they exceed the budget.
+        """
+        with self._lock:
+            self._cache.pop(name, None)
+        if self.max_cache_bytes <= 0:
+            return
+        entry = _CachedDeck(
+            deck=deck,
+            files=_file_mtimes({Path(p).resolve() for p in deck.source_files} | theme_files),
+            media={folder: _folder_signature(folder) for folder in deck.media_folders.values()},
+            size=_estimate_size(deck.slides) + _estimate_size(deck._markdown_sources),
+        )
+        if entry.size > self.max_cache_bytes:
+            warnings.warn(
+                f"Deck '{name}' (~{entry.size // 1024} KiB) exceeds the registry cache "
+                f"budget and is not cached"
+            )
+            return
+        with self._lock:
+            if self._decks.get(name) is None:
+                return  # Unregistered while building
+            self._cache[name] = entry
+            self._cache.move_to_end(name)
+            # Drop least recently used decks until the cache fits its budget
+            while self._cache and self.cache_size > self.max_cache_bytes:
+                self._cache.popitem(last=False)
+    
+    def watch_dependencies(self, watcher: 'FileWatcher | None' = None) -> None:
+        """👁️ Invalidate cached decks from file change events.
+        
+        Source, theme and media files of decks built by get_async() are
+        registered with the watcher, and a change drops the decks depending
+        on it. Cached decks are then returned without touching the file
+        system. Must be called while the event loop is running, e.g. from
+        app.on_startup(registry.watch_dependencies).
+        
+        Args:
+            watcher: Watcher to use, defaults to the process-wide FileWatcher.
+        """
+        if self._watcher is not None:
+            return
+        from .file_watcher import FileWatcher
+        
+        self._watcher = watcher or FileWatcher.get_instance()
+        self._unsubscribe_watcher = self._watcher.subscribe(self._on_dependency_change)
+    
+    def stop_watching(self) -> None:
+        """⏹️ Stop watching; cached decks are checked on every get() again."""
+        if self._unsubscribe_watcher is not None:
+            self._unsubscribe_watcher()
+        self._watcher = self._unsubscribe_watcher = None
+        with self._lock:
+            for entry in self._cache.values():
+                entry.watched = False
+    
+    async def _watch_entry(self, name: str) -> None:
+        """Register a cached deck's dependencies with the watcher.
+        
+        The snapshot is checked once afterwards, catching changes made while
+        the deck was being built.
+        """
+        entry = self._cache.get(name)
+        if self._watcher is None or entry is None or entry.watched:
+            return
+        for path in entry.files:
+            self._watcher.watch(path)
+        for folder in entry.media:
+            self._watcher.watch_directory(folder)
+        if await asyncio.to_thread(entry.is_current):
+            entry.watched = self._watcher is not None
+        else:
+            self._drop(name, entry)
+    
+    def _on_dependency_change(self, path: Path) -> None:
+        """Drop the cached decks depending on a changed file."""
+        for name, entry in list(self._cache.items()):
+            if entry.depends_on(path):
+                self._drop(name, entry)
+    
+    def _drop(self, name: str, entry: _CachedDeck) -> None:
+        """Remove a cache entry unless it was already replaced by a newer build."""
+        with self._lock:
+            if self._cache.get(name) is entry:
+                del self._cache[name]
+    
+    @property
+    def cache_size(self) -> int:
+        """Estimated memory held by cached decks in bytes."""
+        return sum(entry.size for entry in list(self._cache.values()))
+    
+    @property
+    def cached_names(self) -> list[str]:
+        """Names of the currently cached decks, least recently used first."""
+        return list(self._cache.keys())
+    
+    def invalidate(self, name: str | None = None) -> None:
+        """🧹 Drop cached builds so the next get() rebuilds them.
+        
+        Args:
+            name: Deck to drop, or None to drop all.
+        """
+        with self._lock:
+            if name is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(name, None)
+    
+    async def build_all(self) -> int:
+        """🔥 Build and cache every registered deck that is not cached yet.
+        
+        Decks are built one after another off the event loop, so this can run
+        in the background while the server already serves requests. A failing
+        deck is reported and skipped.
+        
+        Returns:
+            Number of decks built.
+        """
+        built = 0
+        for name in list(self._decks):
+            if name not in self._decks or await asyncio.to_thread(self._cached, name) is not None:
+                continue
+            try:
+                await self.get_async(name)
+            except Exception as e:
+                warnings.warn(f"Background build of deck '{name}' failed: {e}")
+                continue
+            built += name in self._cache
+        return built
+    
+    def start_background_build(self) -> asyncio.Task:
+        """🔥 Build all registered decks in a background task.
+        
+        Must be called while the event loop is running, e.g. from
+        app.on_startup(registry.start_background_build).
+        
+        Returns:
+            The background task.
+        """
+        return asyncio.get_running_loop().create_task(self.build_all(), name='stagdeck-deck-build')
     
     def get_default(self) -> SlideDeck | None:
         """Get the default deck."""
@@ -91,6 +428,7 @@ class DeckRegistry:
     def clear(self) -> None:
         """Clear all registered decks."""
         self._decks.clear()
+        self.invalidate()
         self._default = ''
 
 
@@ -100,14 +438,14 @@ registry = DeckRegistry.get_instance()
 
 def register_deck(
     name: str,
-    factory: Callable[[], SlideDeck],
+    factory: DeckFactory,
     default: bool = False,
 ) -> None:
     """Register a deck factory in the global registry.
     
     Args:
         name: Unique name for the deck.
-        factory: Callable that creates and returns a SlideDeck.
+        factory: Callable or async callable that creates and returns a SlideDeck.
         default: If True, set this as the default deck.
     """
     registry.register(name, factory, default)
@@ -118,8 +456,27 @@ def get_deck(name: str | None = None) -> SlideDeck | None:
     
     Args:
         name: Deck name, or None to get the default deck.
-        
+    
     Returns:
         The SlideDeck instance, or None if not found.
     """
     return registry.get(name)
+
+
+async def build_deck(factory: DeckFactory) -> SlideDeck:
+    """Call a deck factory without blocking the event loop.
+    
+    Async factories are awaited, sync factories run in a worker thread.
+    
+    Args:
+        factory: Callable or async callable that creates and returns a SlideDeck.
+    
+    Returns:
+        The created SlideDeck.
+    """
+    if inspect.iscoroutinefunction(factory):
+        return await factory()
+    deck = await asyncio.to_thread(factory)
+    if inspect.isawaitable(deck):
+        deck = await deck
+    return deck
@@ -1,13 +1,17 @@
 """🎴 Slide component for presentations."""
 
 from dataclasses import dataclass, field
-from typing import Callable, TYPE_CHECKING, Any
+from typing import Callable, TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
+    from .components.content_elements import MediaView
     from .theme import LayoutStyle, ThemeOverrides, ThemeContext
     from .slide_deck import SlideDeck
 
 
+# Fields a deck's timeline is computed from
+_TIMING_FIELDS = frozenset({'steps', 'step_durations', 'transition_duration'})
+
 @dataclass
 class SlideRegion:
     """📦 A region within a multi-region slide.
@@ -64,7 +68,7 @@ class Slide:
     subtitle: str = ''
     notes: str = ''
     # Runtime context (set during build, not persisted)
-    _build_context: dict = field(default_factory=dict, repr=False)
+    _build_context: dict | None = field(default=None, repr=False)
     background_color: str = ''
     background_modifiers: str = ''  # Raw modifier string for ImageView
     background_position: str = ''  # 'left', 'right', 'top', 'bottom', or '' for full
@@ -76,6 +80,17 @@ class Slide:
     step_durations: list[float] | None = None
     transition_duration: float = 0.0
     data: dict[str, Any] = field(default_factory=dict)  # Parsed/resolved content for elements
+    # Named 'slide_<position>' by the deck (no explicit or [name: ...] name)
+    _auto_named: bool = field(default=False, repr=False, compare=False)
+    
+    # Bumped whenever a slide's steps or durations are assigned, so decks
+    # know that their cached timeline may be stale
+    timing_version: ClassVar[int] = 0
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _TIMING_FIELDS:
+            Slide.timing_version += 1
+        object.__setattr__(self, name, value)
     
     def get_sizing_content(self) -> str:
         """Get content used for layout sizing (final_content or content)."""
@@ -172,6 +187,23 @@ class Slide:
         """
         return self.get_style(master_slide).to_tailwind(element)
     
+    def get_media(self) -> list['MediaView']:
+        """🖼️ Get the background media of this slide and its regions.
+        
+        Used to preload media before the slide is shown.
+        
+        :return: MediaView per background image/video, in display order.
+        """
+        from .components.content_elements import MediaView
+        
+        media = []
+        if self.background_color.startswith('url('):
+            media.append(MediaView.from_string(self.background_color, self.background_modifiers))
+        for region in self.regions:
+            if region.image:
+                media.append(MediaView.from_string(region.image, region.modifiers))
+        return media
+    
     async def build(
         self,
         step: int = 0,
@@ -381,7 +413,7 @@ class Slide:
         from .components.slide_layout import (
             _get_background_style, _has_background_image, DEFAULT_CONFIG
         )
-        from .components.content_elements import MediaView
+        from .components.content_elements import DEFAULT_BLUR_RADIUS, MediaView
         
         style = self.get_style(master_slide, deck)
         config = DEFAULT_CONFIG
@@ -398,7 +430,7 @@ class Slide:
         # Get theme defaults
         overlay_style = style.get('overlay')
         theme_overlay_opacity = getattr(overlay_style, 'opacity', 0.5) if overlay_style else 0.5
-        theme_blur_radius = 4
+        theme_blur_radius = DEFAULT_BLUR_RADIUS
         
         split_bg_style = style.get('split_background')
         split_bg_color = split_bg_style.color if split_bg_style.color else '#1a1a2e'
@@ -512,7 +544,7 @@ class Slide:
         
         Args:
             step: The step index (0-based).
-            
+        
         Returns:
             Step name, or auto-generated name if not specified.
         """
@@ -526,7 +558,7 @@ class Slide:
         Args:
             step: The step index (0-based).
             default_duration: Default duration to use if not specified.
-            
+        
         Returns:
             Duration in seconds for the step.
         """
@@ -541,7 +573,7 @@ class Slide:
         
         Args:
             default_step_duration: Default duration per step if not specified.
-            
+        
         Returns:
             Total duration in seconds.
         """
@@ -1,14 +1,24 @@
 """📊 SlideDeck - Data model for presentation decks."""
 
+import copy
+import difflib
+import mmap
+import os
 import re
-from dataclasses import dataclass, field
+import sys
+import warnings
+from collections import Counter
+from dataclasses import dataclass, field, fields, replace
+from functools import partial, wraps
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 from .slide import Slide, SlideRegion
 
 if TYPE_CHECKING:
+    from .deck_diff import DeckDiff
     from .theme import LayoutStyle, Theme, ThemeContext, ThemeOverrides
+    from .timeline import Timeline
 
 
 def _parse_page_selection(pages: str | list[int] | None, total: int) -> list[int]:
@@ -47,6 +57,445 @@ def _parse_page_selection(pages: str | list[int] | None, total: int) -> list[int
     return sorted(set(indices))
 
 
+def _split_markdown_slides(content: str) -> list[str]:
+    """Split a markdown document into per-slide markdown chunks.
+    
+    :param content: Full markdown file content.
+    :return: Non-empty, stripped slide chunks.
+    """
+    from .components.markdown_parser import SLIDE_SEPARATOR
+    
+    # Split by separator (must be on its own line)
+    slides_md = re.split(rf'^{re.escape(SLIDE_SEPARATOR)}\s*$', content, flags=re.MULTILINE)
+    return [s.strip() for s in slides_md if s.strip()]
+
+
+def _intern(value: str) -> str:
+    """Intern a short string repeated across slides (layouts, backgrounds, modifiers)."""
+    return sys.intern(value) if value else value
+
+
+# Matches where a [name: ...] line could be; slides without one are named without parsing
+_NAME_HINT = re.compile(r'\[name:', re.IGNORECASE)
+
+
+def _decode_chunk(data: bytes) -> str:
+    """Decode a raw slide chunk like Path.read_text() would (universal newlines)."""
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n').strip()
+
+
+class _MarkdownIndex:
+    """Offset index of the slide chunks in a markdown file.
+    
+    Built with one scan over the memory-mapped file, which is unmapped again
+    right after. Only offsets and hashes are kept; a chunk's text is read
+    from the file when its slide is first accessed.
+    
+    :ivar path: The markdown file.
+    :ivar spans: (start, end) byte offsets of each non-empty chunk.
+    :ivar hashes: Markdown hash of each chunk (as ParseCache.digest()).
+    :ivar named: Whether each chunk may contain a [name: ...] line.
+    """
+    
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.spans: list[tuple[int, int]] = []
+        self.hashes: list[str] = []
+        self.named: list[bool] = []
+        self._stat: tuple[int, int, int] | None = None
+        self._scan()
+    
+    @staticmethod
+    def _stat_key(stat: os.stat_result) -> tuple[int, int, int]:
+        return stat.st_size, stat.st_mtime_ns, stat.st_ino
+    
+    @staticmethod
+    def _bounds(data: mmap.mmap | bytes) -> list[int]:
+        """Start and end offsets of the chunks between separator lines."""
+        from .components.markdown_parser import SLIDE_SEPARATOR
+        
+        separator = re.compile(rb'^' + re.escape(SLIDE_SEPARATOR.encode()) + rb'\s*$', re.MULTILINE)
+        bounds = [0]
+        for match in separator.finditer(data):
+            bounds += [match.start(), match.end()]
+        bounds.append(len(data))
+        return bounds
+    
+    def _scan(self) -> None:
+        """Map the file and index its chunks."""
+        from .components.markdown_parser import ParseCache
+        
+        with open(self.path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            self._stat = self._stat_key(stat)
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b''
+        
+        self.spans, self.hashes, self.named = [], [], []
+        try:
+            bounds = self._bounds(data)
+            for start, end in zip(bounds[::2], bounds[1::2]):
+                text = _decode_chunk(data[start:end])
+                if text:
+                    self.spans.append((start, end))
+                    self.hashes.append(ParseCache.digest(text))
+                    self.named.append(_NAME_HINT.search(text) is not None)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+    
+    def text(self, position: int, digest: str) -> str:
+        """Get the markdown of one chunk.
+        
+        If the file was rewritten since it was indexed, it is indexed again
+        and the chunk is looked up by its hash. A chunk that no longer exists
+        (or an unreadable file) gives a warning and a stale stand-in: the
+        chunk now at the same position, or an empty slide. The stand-in is
+        replaced once the deck reloads the source.
+        
+        :param position: Chunk position at indexing time.
+        :param digest: Hash of the chunk at indexing time.
+        """
+        try:
+            if self._stat_key(self.path.stat()) != self._stat:
+                self._scan()
+            # Chunks move when the file is rewritten; find this one by its hash
+            if position >= len(self.hashes) or self.hashes[position] != digest:
+                if digest in self.hashes:
+                    position = self.hashes.index(digest)
+                else:
+                    warnings.warn(f'Slide source changed in {self.path} before slide {position + 1} was loaded')
+                    if position >= len(self.spans):
+                        return ''
+            start, end = self.spans[position]
+            with open(self.path, 'rb') as file:
+                file.seek(start)
+                return _decode_chunk(file.read(end - start))
+        except OSError as e:
+            warnings.warn(f'Could not load slide {position + 1} from {self.path}: {e}')
+            return ''
+
+
+class _LazySlide(Slide):
+    """Slide from a markdown chunk that is parsed on first use.
+    
+    Step settings, and the name unless the chunk has a [name: ...] line, are
+    known without parsing, so counting steps or summing durations does not
+    parse anything. Reading any other field builds the slide once and copies
+    its fields onto this object; fields set before that are kept.
+    """
+    
+    def __init__(self, load: Callable[[], Slide], **known: Any) -> None:
+        self.__dict__.update(known, _load=load)
+    
+    def _materialize(self) -> None:
+        """Build the slide and fill in all fields not set yet."""
+        load = self.__dict__.get('_load')
+        if load is None:
+            return
+        slide = load()
+        for slide_field in fields(slide):
+            self.__dict__.setdefault(slide_field.name, getattr(slide, slide_field.name))
+        self.__dict__.pop('_load', None)
+
+
+class _ParsedField:
+    """Field of a _LazySlide: the instance value wins, a miss parses the slide.
+    
+    A non-data descriptor, so once materialized reads go straight to the
+    instance dict.
+    """
+    
+    def __init__(self, name: str) -> None:
+        self.name = name
+    
+    def __get__(self, slide: _LazySlide | None, owner: type | None = None) -> Any:
+        if slide is None:
+            return self
+        slide._materialize()
+        return slide.__dict__[self.name]
+
+
+for _field in fields(Slide):
+    setattr(_LazySlide, _field.name, _ParsedField(_field.name))
+
+
+def _load_chunk(builder: 'SlideDeck', index: _MarkdownIndex, position: int, digest: str, auto_name: str) -> Slide:
+    """Build the slide of one indexed chunk (used by _LazySlide)."""
+    return builder._build_slide(index.text(position, digest), auto_name=auto_name)
+
+
+def _prepare_source(
+    path: Path,
+    pages: str | list[int] | None,
+) -> tuple[list[str] | None, list[tuple[str, bool, dict[str, Any]]]]:
+    """Worker of add_from_files(): do the expensive part of loading one file.
+    
+    The selected markdown chunks are parsed and returned to the calling
+    process together with the file's chunks, so it neither reads nor parses
+    the file again; PPTX files are converted (filling their image cache on
+    disk).
+    
+    :return: All markdown chunks of the file (None for PPTX) and (markdown
+        hash, is multi-region, parse result) per selected chunk.
+    """
+    from .components.markdown_parser import ParseCache
+    
+    if path.suffix.lower() == '.pptx':
+        from .utils.pptx_loader import convert_pptx_to_images
+        convert_pptx_to_images(path)
+        return None, []
+    
+    chunks = _split_markdown_slides(path.read_text(encoding='utf-8'))
+    cache = ParseCache.get_instance()
+    results = []
+    for idx in _parse_page_selection(pages, len(chunks)):
+        multi_region, result = cache.parse(chunks[idx])
+        results.append((ParseCache.digest(chunks[idx]), multi_region, result))
+    return chunks, results
+
+
+# Markdown to load before add_from_files() starts a process pool by itself
+_POOL_MIN_BYTES = 512 * 1024
+
+
+def _pool_work(path: Path) -> int:
+    """Estimate the work of loading a file for add_from_files(), in markdown bytes.
+    
+    PPTX files not converted yet count as a pool's worth of work on their own.
+    """
+    if path.suffix.lower() == '.pptx':
+        from .utils.pptx_loader import _get_cache_dir
+        return 0 if (_get_cache_dir(path) / '.meta.json').exists() else _POOL_MIN_BYTES
+    return path.stat().st_size
+
+
+def _name_known(slide: Slide) -> bool:
+    """Whether a slide's name can be read without parsing it."""
+    return not isinstance(slide, _LazySlide) or 'name' in slide.__dict__
+
+
+class SlideList(list):
+    """📋 The slide list of a deck, with a name index.
+    
+    Behaves exactly like a list. Once built (on the first lookup), the name
+    index is updated by every mutation: appends cost O(1), inserts and
+    deletions shift the positions behind them. Lookups are O(1), unknown
+    names included. Slides renamed in place (slide.name = ...) are found
+    under their new name after reindex(). Duplicate names are reported once
+    with a warning; lookups then return the first slide of that name.
+    """
+    
+    def __init__(self, slides: Iterable[Slide] = ()) -> None:
+        super().__init__(slides)
+        self.version = 0
+        self._names: dict[str, int] | None = None
+        self._counts: dict[str, int] = {}
+        self._duplicates: list[str] = []
+        self._warned: set[str] = set()
+        self._quiet = False  # Hold back duplicate warnings (see _warn_duplicates())
+    
+    def __copy__(self) -> 'SlideList':
+        return SlideList(self)
+    
+    def index_of(self, name: str) -> int | None:
+        """🔍 Get the position of the first slide with a name.
+        
+        :param name: Slide name.
+        :return: Index, or None if no slide has that name.
+        """
+        names = self._names if self._names is not None else self.reindex()
+        index = names.get(name)
+        if index is not None and self[index].name != name:
+            # The slide was renamed in place
+            index = self.reindex().get(name)
+        return index
+    
+    @property
+    def duplicate_names(self) -> list[str]:
+        """Names used by more than one slide."""
+        if self._names is None:
+            self.reindex()
+        return list(self._duplicates)
+    
+    def reindex(self) -> dict[str, int]:
+        """🔄 Rebuild the name index from scratch, e.g. after renaming slides in place.
+        
+        :return: Position of the first slide of each name.
+        """
+        self._names, self._counts, self._duplicates = {}, {}, []
+        self._add_names(0, len(self))
+        return self._names
+    
+    def _add_names(self, start: int, stop: int) -> None:
+        """Index the slides at start:stop (positions behind them are current)."""
+        names, counts = self._names, self._counts
+        for i in range(start, stop):
+            name = self[i].name
+            counts[name] = counts.get(name, 0) + 1
+            first = names.get(name)
+            if first is None or first > i:
+                names[name] = i
+            if counts[name] == 2:
+                self._duplicates.append(name)
+                if not self._quiet:
+                    self._warn_duplicate(name, *sorted((first, i)))
+    
+    def _warn_duplicate(self, name: str, earlier: int, later: int) -> None:
+        """Warn about a duplicate name, once per name."""
+        if name not in self._warned:
+            self._warned.add(name)
+            warnings.warn(
+                f"Duplicate slide name '{name}' (slides {earlier} and {later}); "
+                f"name lookups use the first one"
+            )
+    
+    def _warn_duplicates(self) -> None:
+        """Warn about duplicate names indexed while warnings were held back.
+        
+        Used after edits that may pass through names used twice on their way
+        to unique ones, such as renumbering slides.
+        """
+        if self._names is None:
+            return  # Warned when the index is built on the next lookup
+        for name in self._duplicates:
+            if name not in self._warned:
+                earlier, later = [i for i, slide in enumerate(self) if slide.name == name][:2]
+                self._warn_duplicate(name, earlier, later)
+    
+    def _splice(self, start: int, removed: list[Slide], added: int) -> None:
+        """Update the index after the slides `removed` at start were replaced by `added` slides."""
+        names, counts = self._names, self._counts
+        if names is None:
+            return
+        removed_names = [slide.name for slide in removed]
+        if (not all(_name_known(slide) for slide in self[start:start + added])
+                or any(counts.get(name, 0) < n for name, n in Counter(removed_names).items())):
+            # Unparsed names, or slides renamed in place: index on next lookup
+            self._names = None
+            return
+        
+        stop = start + len(removed)
+        delta = added - len(removed)
+        if delta and stop < len(self) - delta:
+            for name, i in names.items():
+                if i >= stop:
+                    names[name] = i + delta
+        for name in removed_names:
+            counts[name] -= 1
+            if counts[name] == 1:
+                self._duplicates.remove(name)
+        lost = []
+        for name in dict.fromkeys(removed_names):
+            if not counts[name]:
+                del counts[name], names[name]
+            elif start <= names[name] < stop:
+                lost.append(name)
+                del names[name]
+        self._add_names(start, start + added)
+        for name in lost:
+            if name not in names:
+                # The first slide of a duplicate name went; the next one follows later
+                names[name] = next(i for i in range(start + added, len(self)) if self[i].name == name)
+    
+    def _normalize(self, index: int) -> int:
+        """Resolve a (possibly negative) item index, raising IndexError if out of range."""
+        return range(len(self))[index]
+    
+    def append(self, slide: Slide) -> None:
+        self.version += 1
+        super().append(slide)
+        self._splice(len(self) - 1, [], 1)
+    
+    def extend(self, slides: Iterable[Slide]) -> None:
+        self.version += 1
+        start = len(self)
+        super().extend(slides)
+        self._splice(start, [], len(self) - start)
+    
+    def __iadd__(self, slides: Iterable[Slide]) -> 'SlideList':
+        self.extend(slides)
+        return self
+    
+    def insert(self, index: int, slide: Slide) -> None:
+        self.version += 1
+        start = min(max(index + len(self) if index < 0 else index, 0), len(self))
+        super().insert(start, slide)
+        self._splice(start, [], 1)
+    
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self.version += 1
+        if not isinstance(index, slice):
+            start = self._normalize(index)
+            removed = [self[start]]
+            super().__setitem__(start, value)
+            self._splice(start, removed, 1)
+            return
+        start, stop, step = index.indices(len(self))
+        if step != 1:
+            super().__setitem__(index, value)
+            self._names = None
+            return
+        stop = max(start, stop)
+        removed = list.__getitem__(self, slice(start, stop))
+        value = list(value)
+        super().__setitem__(slice(start, stop), value)
+        self._splice(start, removed, len(value))
+    
+    def __delitem__(self, index: Any) -> None:
+        self.version += 1
+        if not isinstance(index, slice):
+            start = self._normalize(index)
+            removed = [self[start]]
+            super().__delitem__(start)
+            self._splice(start, removed, 0)
+            return
+        start, stop, step = index.indices(len(self))
+        if step != 1:
+            super().__delitem__(index)
+            self._names = None
+            return
+        stop = max(start, stop)
+        removed = list.__getitem__(self, slice(start, stop))
+        super().__delitem__(slice(start, stop))
+        self._splice(start, removed, 0)
+    
+    def pop(self, index: int = -1) -> Slide:
+        position = self._normalize(index)
+        slide = self[position]
+        del self[position]
+        return slide
+    
+    def remove(self, slide: Slide) -> None:
+        del self[self.index(slide)]
+
+
+def _reindexing(method: Callable) -> Callable:
+    """Wrap a reordering list method to drop the name index."""
+    @wraps(method)
+    def mutate(self: SlideList, *args: Any, **kwargs: Any) -> Any:
+        self._names = None
+        self.version += 1
+        return method(self, *args, **kwargs)
+    return mutate
+
+
+for _method in ('clear', 'sort', 'reverse', '__imul__'):
+    setattr(SlideList, _method, _reindexing(getattr(list, _method)))
+
+
+@dataclass
+class _MarkdownSource:
+    """Bookkeeping for one add_from_file() call on a markdown file.
+    
+    :ivar pages: Page selection passed to add_from_file().
+    :ivar hashes: Markdown hash of each selected chunk, in file order.
+    :ivar slides: Slide created for each chunk (may have been replaced in the deck since).
+    """
+    pages: str | list[int] | None
+    hashes: list[str]
+    slides: list[Slide]
+
+
 @dataclass
 class SlideDeck:
     """📚 Collection of slides forming a presentation.
@@ -55,7 +504,7 @@ class SlideDeck:
     
     :ivar title: The presentation title.
     :ivar master: Reference to a master deck for layouts (optional).
-    :ivar slides: List of Slide objects.
+    :ivar slides: Slides in order (a list that keeps a name index, see SlideList).
     :ivar width: Slide width in pixels (default 1920).
     :ivar height: Slide height in pixels (default 1080).
     :ivar default_background: Default background for all slides (color, gradient, or image URL).
@@ -72,7 +521,7 @@ class SlideDeck:
     """
     title: str = 'Presentation'
     master: 'SlideDeck | None' = None
-    slides: list[Slide] = field(default_factory=list)
+    slides: SlideList = field(default_factory=SlideList)
     width: int = 1920
     height: int = 1080
     default_background: str = ''
@@ -84,6 +533,17 @@ class SlideDeck:
     theme_context: 'ThemeContext | None' = None
     media_folders: dict[str, Path] = field(default_factory=dict)
     source_files: list[Path] = field(default_factory=list)
+    _markdown_sources: dict[Path, list[_MarkdownSource]] = field(default_factory=dict, repr=False, compare=False)
+    _timeline: 'Timeline | None' = field(default=None, repr=False, compare=False)
+    _timeline_version: tuple[int, int] = field(default=(-1, -1), repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Keep the slide list indexed by name, whatever list is assigned
+        if name == 'slides' and not isinstance(value, SlideList):
+            value = SlideList(value)
+        if name in ('slides', 'default_step_duration'):
+            super().__setattr__('_timeline', None)
+        super().__setattr__(name, value)
     
     @property
     def aspect_ratio(self) -> float:
@@ -98,15 +558,59 @@ class SlideDeck:
     @property
     def total_steps(self) -> int:
         """🔢 Get total number of steps across all slides."""
-        return sum(slide.steps for slide in self.slides)
+        return self.timeline.total_steps
+    
+    @property
+    def duplicate_names(self) -> list[str]:
+        """⚠️ Get slide names used by more than one slide."""
+        return self.slides.duplicate_names
     
     @property
     def total_duration(self) -> float:
         """⏱️ Get total duration of the presentation in seconds."""
-        return sum(
-            slide.get_total_duration(self.default_step_duration)
-            for slide in self.slides
-        )
+        return self.timeline.total_duration
+    
+    @property
+    def timeline(self) -> 'Timeline':
+        """⏱️ Get the cumulative timeline of slide and step durations.
+        
+        Cached until the slide list or default_step_duration changes, or any
+        slide's steps, step_durations or transition_duration is assigned.
+        Only mutating a step_durations list in place (durations[1] = 2.0)
+        goes unnoticed; call invalidate_timeline() after that.
+        """
+        from .timeline import Timeline
+        
+        timeline = self._timeline
+        version = (self.slides.version, Slide.timing_version)
+        if timeline is None or self._timeline_version != version:
+            timeline = Timeline(self.slides, self.default_step_duration)
+            self._timeline = timeline
+            self._timeline_version = version
+        return timeline
+    
+    def invalidate_timeline(self) -> None:
+        """🔄 Drop the cached timeline (after mutating a slide's step_durations list in place)."""
+        self._timeline = None
+    
+    def clone(self) -> 'SlideDeck':
+        """📋 Create a copy that can be navigated, reloaded and extended independently.
+        
+        Slide objects, theme context and master are shared with the original;
+        the slide list and source bookkeeping are copied, so add(), replace()
+        and reload_source() on the clone never affect the original.
+        
+        :return: New SlideDeck.
+        """
+        clone = copy.copy(self)
+        clone.slides = SlideList(self.slides)
+        clone.media_folders = dict(self.media_folders)
+        clone.source_files = list(self.source_files)
+        clone._markdown_sources = {
+            path: [replace(record, hashes=list(record.hashes), slides=list(record.slides)) for record in records]
+            for path, records in self._markdown_sources.items()
+        }
+        return clone
     
     def add_slide(self, slide: Slide) -> 'SlideDeck':
         """➕ Add a slide to the deck. Returns self for chaining."""
@@ -227,6 +731,55 @@ class SlideDeck:
         :param kwargs: Additional data for layout elements.
         :return: Self for chaining.
         """
+        self.slides.append(self._build_slide(
+            markdown,
+            name=name,
+            layout=layout,
+            title=title,
+            content=content,
+            subtitle=subtitle,
+            notes=notes,
+            background=background,
+            background_color=background_color,
+            style=style,
+            theme_overrides=theme_overrides,
+            steps=steps,
+            step_names=step_names,
+            step_durations=step_durations,
+            transition_duration=transition_duration,
+            **kwargs,
+        ))
+        return self
+    
+    def _build_slide(
+        self,
+        markdown: str = '',
+        *,
+        name: str = '',
+        layout: str = '',
+        title: str = '',
+        content: str = '',
+        subtitle: str = '',
+        notes: str = '',
+        background: str = '',
+        background_color: str = '',
+        style: 'LayoutStyle | None' = None,
+        theme_overrides: 'ThemeOverrides | None' = None,
+        steps: int = 1,
+        step_names: list[str] | None = None,
+        step_durations: list[float] | None = None,
+        transition_duration: float | None = None,
+        auto_name: str = '',
+        **kwargs,
+    ) -> Slide:
+        """🏗️ Create a Slide from markdown or explicit parameters without adding it.
+        
+        Accepts the same parameters as add().
+        
+        :param auto_name: Name to use when neither `name` nor markdown provide one
+            (default: 'slide_<n>' based on the current slide count).
+        :return: The new Slide.
+        """
         # Parse markdown if provided
         parsed_title = ''
         parsed_subtitle = ''
@@ -240,21 +793,17 @@ class SlideDeck:
         parsed_style_overrides: dict[str, Any] = {}  # Collected from markdown
         
         if markdown:
-            from .components.markdown_parser import MarkdownParser
-            parser = MarkdownParser()
-            
-            # Use multi-region parser to detect if this is a multi-region slide
-            multi = parser.parse_multi_region_markdown(markdown)
-            parsed_notes = multi.get('notes', '')
-            parsed_direction = multi.get('direction', 'horizontal')
-            regions_data = multi.get('regions', [])
+            from .components.markdown_parser import ParseCache
             
-            # Get name from multi-region parse (applies to all cases)
-            parsed_name = multi.get('name', '')
+            # Parsed once per distinct slide text, shared across deck builds
+            multi_region, parsed = ParseCache.get_instance().parse(markdown)
             
-            if len(regions_data) > 1:
-                # Multi-region slide
-                for r in regions_data:
+            if multi_region:
+                multi = parsed
+                parsed_notes = multi['notes']
+                parsed_direction = multi['direction']
+                parsed_name = multi['name']
+                for r in multi['regions']:
                     # Build region theme context from overrides
                     region_theme = None
                     overlay = r.get('overlay_opacity')
@@ -269,32 +818,32 @@ class SlideDeck:
                             region_theme.slide_overrides.set('blur', blur)
                     
                     parsed_regions.append(SlideRegion(
-                        image=r.get('image', ''),
-                        modifiers=r.get('modifiers', ''),
+                        image=_intern(r.get('image', '')),
+                        modifiers=_intern(r.get('modifiers', '')),
                         content=r.get('content', ''),
                         title=r.get('title', ''),
                         subtitle=r.get('subtitle', ''),
-                        position=r.get('position', ''),
+                        position=_intern(r.get('position', '')),
                         theme_context=region_theme,
                     ))
             else:
-                # Single-region slide - use standard parsing for backward compat
-                parsed = parser.parse_slide_markdown(markdown)
-                parsed_title = parsed.get('title', '')
-                parsed_subtitle = parsed.get('subtitle', '')
-                parsed_content = parsed.get('content', '')
-                parsed_background = parsed.get('background', '')
-                parsed_background_modifiers = parsed.get('background_modifiers', '')
-                parsed_background_position = parsed.get('background_position', '')
-                parsed_notes = parsed.get('notes', '')
-                parsed_name = parsed.get('name', '')
+                parsed_title = parsed['title']
+                parsed_subtitle = parsed['subtitle']
+                parsed_content = parsed['content']
+                parsed_background = parsed['background']
+                parsed_background_modifiers = parsed['background_modifiers']
+                parsed_background_position = parsed['background_position']
+                parsed_notes = parsed['notes']
+                parsed_name = parsed['name']
+                if parsed_background_position in ('top', 'bottom'):
+                    parsed_direction = 'vertical'
                 
                 # Collect style overrides from parsed markdown
-                if parsed.get('overlay_opacity') is not None:
+                if parsed['overlay_opacity'] is not None:
                     parsed_style_overrides['overlay'] = parsed['overlay_opacity']
-                if parsed.get('blur_radius') is not None:
+                if parsed['blur_radius'] is not None:
                     parsed_style_overrides['blur'] = parsed['blur_radius']
-                if parsed.get('text_style'):
+                if parsed['text_style']:
                     parsed_style_overrides.update(parsed['text_style'])
         else:
             parsed_name = ''
@@ -309,7 +858,8 @@ class SlideDeck:
         final_background = background or background_color or parsed_background
         
         # Name: explicit > parsed from [name: ...] > auto-generated
-        slide_name = name if name else (parsed_name if parsed_name else f'slide_{len(self.slides)}')
+        slide_name = name or parsed_name or auto_name or f'slide_{len(self.slides)}'
+        auto_named = not (name or parsed_name)
         slide_layout = layout if layout else self.default_layout
         
         # Build data dict from explicit params and kwargs
@@ -336,19 +886,20 @@ class SlideDeck:
             if theme_overrides:
                 slide_theme.push_slide_overrides(theme_overrides)
         
-        # Store parsed overrides in data for layout rendering
-        data['_style_overrides'] = parsed_style_overrides
+        # Store parsed overrides in data for layout rendering (readers default to {})
+        if parsed_style_overrides:
+            data['_style_overrides'] = parsed_style_overrides
         
-        self.slides.append(Slide(
+        return Slide(
             name=slide_name,
-            layout=slide_layout,
+            layout=_intern(slide_layout),
             title=final_title,
             content=final_content,
             subtitle=final_subtitle,
             notes=final_notes,
-            background_color=final_background,
-            background_modifiers=parsed_background_modifiers,
-            background_position=parsed_background_position,
+            background_color=_intern(final_background),
+            background_modifiers=_intern(parsed_background_modifiers),
+            background_position=_intern(parsed_background_position),
             regions=parsed_regions,
             region_direction=parsed_direction,
             theme_context=slide_theme,
@@ -357,8 +908,8 @@ class SlideDeck:
             step_durations=step_durations,
             transition_duration=transition_duration if transition_duration is not None else self.default_transition_duration,
             data=data,
-        ))
-        return self
+            _auto_named=auto_named,
+        )
     
     def add_from_file(
         self,
@@ -369,6 +920,7 @@ class SlideDeck:
         after: str = '',
         name_prefix: str = 'pptx',
         url_prefix: str = '/pptx_slides',
+        lazy: bool = False,
     ) -> 'SlideDeck':
         """📄 Load slides from a markdown or PPTX file.
         
@@ -394,16 +946,38 @@ class SlideDeck:
         deck.add_from_file('charts.md', before='conclusion')
         ```
         
+        Markdown files with a snapshot next to them (see
+        stagdeck.snapshot.compile_snapshot) skip parsing of unchanged slides.
+        
+        For decks with thousands of slides use `lazy=True`: the file is
+        memory-mapped and indexed in one scan, and each slide is parsed only
+        when it is first accessed (navigation, rendering, name lookup).
+        
         :param path: Path to the markdown or PPTX file.
         :param pages: Page selection - None for all, or "1,3-5" or [1,3,4,5] (1-based).
         :param before: Insert before the slide with this name.
         :param after: Insert after the slide with this name.
         :param name_prefix: Prefix for PPTX slide names (e.g., 'pptx' -> 'pptx_001').
         :param url_prefix: URL prefix for serving PPTX images.
+        :param lazy: Parse markdown slides on first access (ignored for PPTX).
         :return: Self for chaining.
         :raises FileNotFoundError: If file doesn't exist.
         :raises ValueError: If both before and after are specified.
         """
+        return self._add_file(path, pages, before, after, name_prefix, url_prefix, lazy)
+    
+    def _add_file(
+        self,
+        path: str | Path,
+        pages: str | list[int] | None = None,
+        before: str = '',
+        after: str = '',
+        name_prefix: str = 'pptx',
+        url_prefix: str = '/pptx_slides',
+        lazy: bool = False,
+        chunks: list[str] | None = None,
+    ) -> 'SlideDeck':
+        """Implement add_from_file(), optionally with the markdown already split into chunks."""
         if before and after:
             raise ValueError("Cannot specify both 'before' and 'after'")
         
@@ -427,43 +1001,302 @@ class SlideDeck:
         if path.suffix.lower() == '.pptx':
             self._add_from_pptx(path, pages, name_prefix, url_prefix)
         else:
-            self._add_from_markdown(path, pages)
+            self._add_from_markdown(path, pages, lazy, chunks)
         
         # Move new slides to insertion point if needed
         if insert_idx is not None:
             new_slides = self.slides[count_before:]
             del self.slides[count_before:]
-            for i, slide in enumerate(new_slides):
-                self.slides.insert(insert_idx + i, slide)
+            self.splice(insert_idx, new_slides)
+        
+        return self
+    
+    def add_from_files(
+        self,
+        sources: Iterable[str | Path | dict[str, Any]],
+        *,
+        workers: int | None = None,
+    ) -> 'SlideDeck':
+        """📚 Load slides from several markdown or PPTX files, optionally in parallel.
+        
+        In a process pool, files are read, split and parsed (PPTX: converted);
+        only the selected pages are parsed, and the chunks and parse results
+        are handed back to this process. The slides are then added in the
+        declared order exactly as by consecutive add_from_file() calls, so
+        insertion positions and hot-reload source tracking behave the same.
+        
+        By default (workers=None) a pool of one process per CPU is used when
+        it pays off: for more than one file with at least 512 KiB of markdown
+        (or PPTX files not converted yet) in total, and only when called from
+        the main thread of the main process. Deck factories of App.run() run
+        in worker threads, so they load in-process unless workers is given.
+        Spawned processes re-import the main module, so scripts that pass
+        workers explicitly should do so behind `if __name__ == '__main__':`.
+        
+        Example usage:
+        ```python
+        deck.add_from_files([
+            'intro.md',
+            {'path': 'charts.pptx', 'pages': '2-4'},
+            {'path': 'extra.md', 'after': 'intro'},
+        ])
+        ```
+        
+        :param sources: Paths, or dicts of add_from_file() arguments including 'path'.
+        :param workers: Number of worker processes (1 = no pool, None = automatic).
+        :return: Self for chaining.
+        :raises FileNotFoundError: If a file doesn't exist.
+        :raises ValueError: If a source specifies both before and after.
+        """
+        import multiprocessing
+        import threading
+        from .components.markdown_parser import ParseCache
+        
+        options = [dict(source) if isinstance(source, dict) else {'path': source} for source in sources]
+        # Lazy sources are not parsed up front by definition
+        tasks: dict[tuple[Path, str], tuple[Path, str | list[int] | None]] = {}
+        for option in options:
+            path = Path(option['path']).resolve()
+            if not option.get('lazy') and path.exists():
+                pages = option.get('pages')
+                tasks.setdefault((path, repr(pages)), (path, pages))
+        if workers is None:
+            automatic = (
+                threading.current_thread() is threading.main_thread()
+                and multiprocessing.parent_process() is None
+                and sum(_pool_work(path) for path in dict.fromkeys(path for path, _ in tasks.values()))
+                >= _POOL_MIN_BYTES
+            )
+            workers = (os.cpu_count() or 1) if automatic else 1
         
+        # Markdown chunks split by the workers, by file
+        prepared: dict[Path, list[str]] = {}
+        if workers > 1 and len(tasks) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            cache = ParseCache.get_instance()
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+                futures = {path: pool.submit(_prepare_source, path, pages) for path, pages in tasks.values()}
+                results = {path: future.result() for path, future in futures.items() if future.exception() is None}
+            # Failed sources are loaded (and raise) below as usual
+            cache.reserve(len(self.slides) + sum(len(parsed) for _, parsed in results.values()))
+            for path, (chunks, parsed) in results.items():
+                if chunks is not None:
+                    prepared[path] = chunks
+                for digest, multi_region, result in parsed:
+                    cache.put(digest, multi_region, result)
+        
+        for option in options:
+            chunks = None if option.get('lazy') else prepared.get(Path(option['path']).resolve())
+            self._add_file(**option, chunks=chunks)
         return self
     
     def _add_from_markdown(
         self,
         path: Path,
         pages: str | list[int] | None,
+        lazy: bool = False,
+        chunks: list[str] | None = None,
     ) -> 'SlideDeck':
-        """Load slides from a markdown file."""
-        from .components.markdown_parser import SLIDE_SEPARATOR
+        """Load slides from a markdown file (or its chunks, if already split)."""
+        from .components.markdown_parser import ParseCache
+        from .snapshot import load_snapshot
         
         # Track source file for hot-reload
         if path not in self.source_files:
             self.source_files.append(path)
         
-        content = path.read_text(encoding='utf-8')
-        
-        # Split by separator (must be on its own line)
-        slides_md = re.split(rf'^{re.escape(SLIDE_SEPARATOR)}\s*$', content, flags=re.MULTILINE)
-        slides_md = [s.strip() for s in slides_md if s.strip()]
+        if lazy:
+            return self._add_lazy_markdown(path, pages)
+        slides_md = chunks if chunks is not None else _split_markdown_slides(path.read_text(encoding='utf-8'))
         
         # Apply page selection
         indices = _parse_page_selection(pages, len(slides_md))
+        ParseCache.get_instance().reserve(len(self.slides) + len(indices))
+        hashes = [ParseCache.digest(slides_md[idx]) for idx in indices]
+        # Precompiled parse results (compile_snapshot) for unchanged slides
+        load_snapshot(path, digests=hashes)
         
+        record = _MarkdownSource(pages=pages, hashes=hashes, slides=[])
         for idx in indices:
             self.add(slides_md[idx])
+            record.slides.append(self.slides[-1])
+        self._markdown_sources.setdefault(path, []).append(record)
+        
+        return self
+    
+    def _add_lazy_markdown(self, path: Path, pages: str | list[int] | None) -> 'SlideDeck':
+        """Add unparsed slides for the chunks of a markdown file."""
+        from .snapshot import load_snapshot
+        
+        index = _MarkdownIndex(path)
+        indices = _parse_page_selection(pages, len(index.hashes))
+        load_snapshot(path, digests=[index.hashes[idx] for idx in indices])
+        # Slides are built with the deck settings of now, like eagerly added ones,
+        # by a deck that holds only these (not this deck's slides and sources)
+        builder = SlideDeck(
+            default_layout=self.default_layout,
+            default_transition_duration=self.default_transition_duration,
+            theme_context=self.theme_context,
+        )
+        
+        record = _MarkdownSource(pages=pages, hashes=[], slides=[])
+        for idx in indices:
+            auto_name = f'slide_{len(self.slides)}'
+            known: dict[str, Any] = dict(
+                steps=1,
+                step_names=None,
+                step_durations=None,
+                transition_duration=self.default_transition_duration,
+            )
+            if not index.named[idx]:
+                known.update(name=auto_name, _auto_named=True)
+            digest = index.hashes[idx]
+            slide = _LazySlide(partial(_load_chunk, builder, index, idx, digest, auto_name), **known)
+            self.slides.append(slide)
+            record.hashes.append(digest)
+            record.slides.append(slide)
+        self._markdown_sources.setdefault(path, []).append(record)
         
         return self
     
+    def reload_source(self, path: str | Path) -> list[Slide] | None:
+        """🔄 Re-read one markdown source file and patch only the changed slides.
+        
+        The file is re-split and every chunk's markdown is hashed. Chunks whose
+        hash is unchanged keep their existing Slide objects; changed chunks are
+        re-parsed and swapped into the deck in place, and added/removed chunks
+        are inserted/removed around their neighbours. Slides that were replaced
+        via replace() keep their Python content. Slides without an explicit
+        name are renamed 'slide_<position>' where their position changed, as
+        a fresh build of the deck would name them.
+        
+        :param path: A markdown file previously loaded via add_from_file().
+        :return: The newly built or renamed slides now in the deck (empty if
+            nothing changed), or None if the file is not a markdown source of
+            this deck.
+        :raises OSError: If the file can no longer be read.
+        """
+        path = Path(path).resolve()
+        records = self._markdown_sources.get(path)
+        if not records:
+            return None
+        
+        chunks = _split_markdown_slides(path.read_text(encoding='utf-8'))
+        # Auto names are only unique again once renumbered at the end
+        self.slides._quiet = True
+        try:
+            rebuilt = self._reload_records(records, chunks)
+        finally:
+            self.slides._quiet = False
+        self.slides._warn_duplicates()
+        return rebuilt
+    
+    def _reload_records(self, records: list[_MarkdownSource], chunks: list[str]) -> list[Slide]:
+        """Patch the slides of a source's records to its new chunks (see reload_source())."""
+        from .components.markdown_parser import ParseCache
+        
+        rebuilt: list[Slide] = []
+        # First deck position whose slide was rebuilt, inserted or removed
+        first_change = len(self.slides)
+        for record in records:
+            selected = [chunks[i] for i in _parse_page_selection(record.pages, len(chunks))]
+            new_hashes = [ParseCache.digest(md) for md in selected]
+            if new_hashes == record.hashes:
+                continue
+            
+            new_slides: list[Slide] = []
+            matcher = difflib.SequenceMatcher(a=record.hashes, b=new_hashes, autojunk=False)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                old_run = record.slides[i1:i2]
+                if tag == 'equal':
+                    new_slides.extend(old_run)
+                    continue
+                if tag == 'replace' and i2 - i1 == j2 - j1:
+                    # Same shape: rebuild each changed slide in place
+                    for old_slide, md in zip(old_run, selected[j1:j2]):
+                        slide = self._build_slide(md, auto_name=old_slide.name)
+                        new_slides.append(slide)
+                        position = self._position_of(old_slide)
+                        if position is not None:
+                            self.slides[position] = slide
+                            rebuilt.append(slide)
+                            first_change = min(first_change, position)
+                    continue
+                # Structural change: drop the old run and insert the new one
+                anchor = self._source_anchor(record.slides, i1, i2)
+                for old_slide in old_run:
+                    position = self._position_of(old_slide)
+                    if position is not None:
+                        del self.slides[position]
+                run = [
+                    self._build_slide(md, auto_name=f'slide_{anchor + offset}')
+                    for offset, md in enumerate(selected[j1:j2])
+                ]
+                self.splice(anchor, run)
+                new_slides.extend(run)
+                rebuilt.extend(run)
+                first_change = min(first_change, anchor)
+            
+            record.hashes = new_hashes
+            record.slides = new_slides
+        
+        return rebuilt + self._renumber_auto_names(first_change)
+    
+    def _position_of(self, slide: Slide) -> int | None:
+        """Find the deck position of a specific Slide object (by identity)."""
+        index = self.slides.index_of(slide.name)
+        if index is not None and self.slides[index] is slide:
+            return index
+        for i, candidate in enumerate(self.slides):
+            if candidate is slide:
+                return i
+        return None
+    
+    def _source_anchor(self, source_slides: list[Slide], start: int, end: int) -> int:
+        """Deck index where slides for source chunks [start, end) belong.
+        
+        Computed as if the old slides of that range were already removed.
+        """
+        for slide in source_slides[start:end]:
+            position = self._position_of(slide)
+            if position is not None:
+                return position
+        for slide in reversed(source_slides[:start]):
+            position = self._position_of(slide)
+            if position is not None:
+                return position + 1
+        for slide in source_slides[end:]:
+            position = self._position_of(slide)
+            if position is not None:
+                return position
+        return len(self.slides)
+    
+    def _renumber_auto_names(self, start: int) -> list[Slide]:
+        """Rename auto-named slides from a position on to 'slide_<position>'.
+        
+        Slides may be shared with clones of this deck, so a renamed slide is
+        a copy that replaces the original here and in the source records.
+        
+        :param start: First deck position to check.
+        :return: The renamed copies.
+        """
+        renamed: dict[int, Slide] = {}
+        for position in range(start, len(self.slides)):
+            slide = self.slides[position]
+            name = f'slide_{position}'
+            # Lazy slides with a [name: ...] line are not parsed just for this
+            if not _name_known(slide) or slide.name == name or not slide._auto_named:
+                continue
+            renamed[id(slide)] = copy.copy(slide)
+            renamed[id(slide)].name = name
+            self.slides[position] = renamed[id(slide)]
+        if renamed:
+            for records in self._markdown_sources.values():
+                for record in records:
+                    record.slides = [renamed.get(id(slide), slide) for slide in record.slides]
+        return list(renamed.values())
+    
     def _add_from_pptx(
         self,
         path: Path,
@@ -542,14 +1375,37 @@ class SlideDeck:
         # Calculate insertion index
         insert_idx = target_idx if before else target_idx + 1
         
-        # Add slide to end first (reuse add() logic)
-        self.add(markdown, **kwargs)
+        self.splice(insert_idx, [self._build_slide(markdown, **kwargs)])
+        return self
+    
+    def splice(self, index: int, slides: Iterable[Slide], delete: int = 0) -> list[Slide]:
+        """✂️ Remove and/or insert a run of slides in one operation.
         
-        # Move from end to insertion point
-        slide = self.slides.pop()
-        self.slides.insert(insert_idx, slide)
+        Inserting k slides moves the following slides once (O(n + k)) instead
+        of k single inserts (O(n·k)), and the name index is rebuilt once.
         
-        return self
+        Example:
+        ```python
+        # Insert a run of slides after 'intro'
+        deck.splice(deck.get_slide_index('intro') + 1, new_slides)
+        
+        # Swap two slides at position 3 for one
+        removed = deck.splice(3, [summary], delete=2)
+        ```
+        
+        :param index: Position to remove from and insert at (negative counts from the end).
+        :param slides: Slides to insert.
+        :param delete: Number of slides to remove at the position first.
+        :return: The removed slides.
+        :raises ValueError: If delete is negative.
+        """
+        if delete < 0:
+            raise ValueError(f'delete must not be negative, got {delete}')
+        start = slice(index, None).indices(len(self.slides))[0]
+        end = min(start + delete, len(self.slides))
+        removed = self.slides[start:end]
+        self.slides[start:end] = list(slides)
+        return removed
     
     def replace(
         self,
@@ -583,17 +1439,10 @@ class SlideDeck:
         if target_idx is None:
             raise ValueError(f"Slide not found: '{name}'")
         
-        # Add new slide to end (reuse add() logic)
         # Preserve the name unless explicitly overridden
         if 'name' not in kwargs:
             kwargs['name'] = name
-        self.add(markdown, **kwargs)
-        
-        # Remove old slide and move new one to its position
-        del self.slides[target_idx]
-        slide = self.slides.pop()
-        self.slides.insert(target_idx, slide)
-        
+        self.splice(target_idx, [self._build_slide(markdown, **kwargs)], delete=1)
         return self
     
     def get_layout(self, layout_name: str) -> Slide | None:
@@ -614,30 +1463,46 @@ class SlideDeck:
     
     def get_slide_by_name(self, name: str) -> Slide | None:
         """🔍 Find a slide by its name."""
-        for slide in self.slides:
-            if slide.name == name:
-                return slide
-        return None
+        index = self.slides.index_of(name)
+        return self.slides[index] if index is not None else None
     
     def get_slide_index(self, name: str) -> int | None:
         """🔍 Get the index of a slide by its name."""
-        for i, slide in enumerate(self.slides):
-            if slide.name == name:
-                return i
-        return None
+        return self.slides.index_of(name)
     
     def get_duration_at(self, slide_index: int, step: int = 0) -> float:
-        """⏱️ Get elapsed duration up to a specific slide and step."""
-        elapsed = 0.0
-        for i, slide in enumerate(self.slides):
-            if i < slide_index:
-                elapsed += slide.get_total_duration(self.default_step_duration)
-            elif i == slide_index:
-                elapsed += slide.transition_duration
-                for s in range(step):
-                    elapsed += slide.get_step_duration(s, self.default_step_duration)
-                break
-        return elapsed
+        """⏱️ Get elapsed duration up to a specific slide and step.
+        
+        Reflects slides edited in place, see the timeline property.
+        """
+        return self.timeline.duration_at(slide_index, step)
+    
+    def get_position_at(self, elapsed: float) -> tuple[int, int]:
+        """📍 Get the (slide index, step) shown after an elapsed duration.
+        
+        Reflects slides edited in place, see the timeline property.
+        """
+        return self.timeline.position_at(elapsed)
+    
+    def diff(self, other: 'SlideDeck') -> 'DeckDiff':
+        """🔍 Compare this deck's slides with another deck's.
+        
+        Slides are matched by name and content fingerprint, so hot reload,
+        render caches and clients can patch only what changed. Slides shared
+        by both decks (e.g. after clone() and reload_source()) are not
+        fingerprinted.
+        
+        Example:
+            >>> changes = old_deck.diff(new_deck)
+            >>> [new_deck.slides[new].name for old, new in changes.modified]
+            ['agenda']
+        
+        :param other: The deck after the change.
+        :return: DeckDiff with old indices in this deck and new indices in other.
+        """
+        from .deck_diff import diff_slides
+        
+        return diff_slides(self.slides, other.slides)
     
     # =========================================================================
     # 🎨 Theme Management
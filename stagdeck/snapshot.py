@@ -0,0 +1,156 @@
+"""📦 Deck snapshots - precompiled markdown parse results for fast startup."""
+
+import json
+import os
+import struct
+import sys
+import zlib
+from pathlib import Path
+from typing import Any, Iterable
+
+from .components.markdown_parser import PARSER_VERSION, ParseCache
+
+
+SNAPSHOT_MAGIC = b'STAGSNAP'
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_SUFFIX = '.snapshot'
+
+# Magic, snapshot format, parser version
+_HEADER = struct.Struct('>8sHH')
+
+def snapshot_path(source: str | Path) -> Path:
+    """📍 Get the snapshot file belonging to a markdown source.
+    
+    :param source: Markdown file.
+    :return: Path next to the source (e.g. 'talk.md' -> 'talk.md.snapshot').
+    """
+    source = Path(source)
+    return source.with_name(source.name + SNAPSHOT_SUFFIX)
+
+
+def encode_snapshot(entries: dict[str, tuple[bool, dict[str, Any]]]) -> bytes:
+    """Serialize parse results (digest -> (multi-region, result)) to snapshot bytes.
+    
+    The payload is zlib-compressed JSON behind a fixed binary header; unlike
+    pickle, loading a snapshot can never execute code.
+    """
+    payload = {
+        'slides': [
+            {'hash': digest, 'multi_region': multi_region, 'result': result}
+            for digest, (multi_region, result) in entries.items()
+        ],
+    }
+    data = json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, PARSER_VERSION) + zlib.compress(data, 6)
+
+
+def decode_snapshot(data: bytes) -> dict[str, tuple[bool, dict[str, Any]]] | None:
+    """Deserialize snapshot bytes.
+    
+    :return: Parse results by markdown digest, or None if the data is not a
+        snapshot of this format and parser version (or is corrupted).
+    """
+    if len(data) < _HEADER.size:
+        return None
+    magic, snapshot_format, parser_version = _HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC or snapshot_format != SNAPSHOT_FORMAT or parser_version != PARSER_VERSION:
+        return None
+    try:
+        payload = json.loads(zlib.decompress(data[_HEADER.size:]))
+        return {
+            slide['hash']: (bool(slide['multi_region']), slide['result'])
+            for slide in payload['slides']
+        }
+    except (zlib.error, ValueError, KeyError, TypeError):
+        return None
+
+
+def load_snapshot(
+    source: str | Path,
+    cache: ParseCache | None = None,
+    digests: Iterable[str] | None = None,
+) -> int:
+    """📥 Load a source's snapshot into the parse cache.
+    
+    Only results for slides that are not cached yet are inserted. Stale
+    entries are harmless: they are keyed by the hash of the slide text, so
+    edited slides simply miss and are parsed again. The snapshot is not kept
+    in memory; the parse cache holds what was inserted.
+    
+    :param source: Markdown file.
+    :param cache: Parse cache to fill (default: the shared one).
+    :param digests: Hashes of the slides about to be built. Only these are
+        inserted, and if all of them are cached already the snapshot is not
+        read at all. None inserts every slide of the snapshot.
+    :return: Number of slides inserted (0 if there is no usable snapshot).
+    """
+    cache = cache or ParseCache.get_instance()
+    if digests is not None:
+        digests = [digest for digest in digests if cache.peek(digest) is None]
+        if not digests:
+            return 0
+    try:
+        entries = decode_snapshot(snapshot_path(Path(source).resolve()).read_bytes())
+    except OSError:
+        return 0
+    if not entries:
+        return 0
+    inserted = 0
+    for digest in entries if digests is None else digests:
+        if digest in entries and cache.peek(digest) is None:
+            multi_region, result = entries[digest]
+            cache.put(digest, multi_region, result)
+            inserted += 1
+    return inserted
+
+
+def compile_snapshot(source: str | Path) -> Path:
+    """🛠️ Parse a markdown source and write its snapshot next to it.
+    
+    add_from_file() picks the snapshot up automatically, so slides whose text
+    is unchanged are not parsed again on later process starts.
+    
+    :param source: Markdown file.
+    :return: Path of the written snapshot.
+    :raises OSError: If the source cannot be read or the snapshot not written.
+    """
+    from .slide_deck import _split_markdown_slides
+    
+    source = Path(source)
+    cache = ParseCache.get_instance()
+    entries = {}
+    for markdown in _split_markdown_slides(source.read_text(encoding='utf-8')):
+        entries[ParseCache.digest(markdown)] = cache.parse(markdown)
+    
+    target = snapshot_path(source)
+    temp = target.with_name(target.name + '.tmp')
+    temp.write_bytes(encode_snapshot(entries))
+    os.replace(temp, target)  # Readers never see a partial snapshot
+    return target
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line: compile snapshots for markdown decks."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog='python -m stagdeck.snapshot',
+        description='Precompile markdown decks into snapshots for fast startup.',
+    )
+    parser.add_argument('sources', nargs='+', type=Path, help='Markdown files')
+    args = parser.parse_args(argv)
+    
+    status = 0
+    for source in args.sources:
+        try:
+            target = compile_snapshot(source)
+        except OSError as e:
+            print(f'{source}: {e}', file=sys.stderr)
+            status = 1
+            continue
+        print(f'{source} -> {target}')
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
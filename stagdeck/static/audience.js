@@ -0,0 +1,28 @@
+/**
+ * 🖼️ StagDeck Audience Script
+ * 
+ * Follows the presenter through a Server-Sent Events stream and shows
+ * pre-rendered slide images. Images are decoded off-screen before they are
+ * swapped in, so slide changes never flash an empty frame.
+ */
+
+(function() {
+    const script = document.currentScript;
+    const streamUrl = script.dataset.stream;
+    const img = document.getElementById('stagdeck-audience');
+    let latest = null;
+    
+    function show(src) {
+        latest = src;
+        const next = new Image();
+        next.src = src;
+        next.decode().catch(() => {}).then(() => {
+            // Skip stale images if the presenter moved on meanwhile
+            if (latest === src) img.src = src;
+        });
+    }
+    
+    // EventSource reconnects by itself after network hiccups
+    const source = new EventSource(streamUrl);
+    source.onmessage = (event) => show(JSON.parse(event.data).src);
+})();
@@ -0,0 +1,60 @@
+/**
+ * 🔗 StagDeck Frame State Script
+ * 
+ * The server stores navigation state as data attributes on `.slide-frame`,
+ * so it arrives in the same update message as the slide itself:
+ *   - data-slide / data-step: mirrored into the URL (history.replaceState)
+ *   - data-preload: JSON list of upcoming media, passed to stagdeckPreload()
+ * Only these attributes are observed; slide content changes are ignored.
+ */
+
+(function() {
+    const ATTRIBUTES = ['data-slide', 'data-step', 'data-preload'];
+    let lastPreload = null;
+    
+    function syncUrl(frame) {
+        const slide = frame.dataset.slide;
+        if (slide === undefined) return;
+        const url = new URL(window.location);
+        url.searchParams.set('slide', slide);
+        url.searchParams.set('step', frame.dataset.step || '');
+        if (url.href !== window.location.href) {
+            window.history.replaceState({}, '', url);
+        }
+    }
+    
+    function syncPreload(frame) {
+        const preload = frame.dataset.preload;
+        if (!preload || preload === lastPreload || !window.stagdeckPreload) return;
+        lastPreload = preload;
+        try {
+            window.stagdeckPreload(JSON.parse(preload));
+        } catch (e) {
+            console.warn('StagDeck: invalid preload hints', e);
+        }
+    }
+    
+    function sync(frame) {
+        syncUrl(frame);
+        syncPreload(frame);
+    }
+    
+    function attach() {
+        const frame = document.querySelector('.slide-frame');
+        if (!frame) return false;
+        new MutationObserver(() => sync(frame)).observe(frame, {
+            attributes: true,
+            attributeFilter: ATTRIBUTES,
+        });
+        sync(frame);
+        return true;
+    }
+    
+    // Wait until NiceGUI has mounted the viewer, then stop watching the DOM
+    if (!attach()) {
+        const mountObserver = new MutationObserver(() => {
+            if (attach()) mountObserver.disconnect();
+        });
+        mountObserver.observe(document.documentElement, { childList: true, subtree: true });
+    }
+})();
@@ -0,0 +1,51 @@
+/**
+ * 📥 StagDeck Media Preloading
+ * 
+ * Fetches and decodes the media of upcoming slides before they are shown.
+ * Decoded images are kept referenced in a small LRU so the browser keeps
+ * them in its decode cache and the next slide paints at once.
+ */
+
+(function() {
+    const MAX_ENTRIES = 24;
+    const cache = new Map();  // url -> Image or video element
+    
+    function remember(url, element) {
+        cache.delete(url);
+        cache.set(url, element);
+        while (cache.size > MAX_ENTRIES) {
+            const oldest = cache.keys().next().value;
+            const video = cache.get(oldest);
+            // Release buffered video data
+            if (video instanceof HTMLVideoElement) video.removeAttribute('src');
+            cache.delete(oldest);
+        }
+    }
+    
+    function preloadImage(url) {
+        const img = new Image();
+        img.decoding = 'async';
+        img.src = url;
+        img.decode().catch(() => {});
+        remember(url, img);
+    }
+    
+    function preloadVideo(url) {
+        const video = document.createElement('video');
+        video.preload = 'auto';
+        video.muted = true;
+        video.src = url;
+        remember(url, video);
+    }
+    
+    window.stagdeckPreload = function(items) {
+        for (const item of items) {
+            if (cache.has(item.url)) {
+                remember(item.url, cache.get(item.url));
+                continue;
+            }
+            if (item.kind === 'video') preloadVideo(item.url);
+            else preloadImage(item.url);
+        }
+    };
+})();
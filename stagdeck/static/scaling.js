@@ -2,51 +2,106 @@
  * 🎬 StagDeck Slide Scaling Script
  * 
  * Handles responsive scaling of slides to fit the viewport.
+ * 
+ * A ResizeObserver on `.slide-wrapper` reports size changes without forcing
+ * layout; updates are batched into one requestAnimationFrame and styles are
+ * only written when the scale actually changes. Slide rebuilds inside the
+ * frame therefore never trigger a measurement.
  */
 
-function updateSlideScale() {
-    const wrapper = document.querySelector('.slide-wrapper');
-    const frame = document.querySelector('.slide-frame');
-    if (!wrapper || !frame) return;
+(function() {
+    let wrapper = null;
+    let frame = null;
+    let wrapperWidth = 0;
+    let wrapperHeight = 0;
+    let lastScale = null;
+    let lastSize = '';
+    let frameRequested = false;
     
-    const isFullscreen = !!document.fullscreenElement;
-    const padding = isFullscreen ? 0 : 48;
+    function applyScale() {
+        frameRequested = false;
+        if (!frame || !frame.isConnected) return;
+        
+        const isFullscreen = !!document.fullscreenElement;
+        const padding = isFullscreen ? 0 : 48;
+        const availableWidth = wrapperWidth - padding;
+        const availableHeight = wrapperHeight - padding;
+        
+        // Get slide dimensions from data attributes (native resolution)
+        const slideWidth = parseInt(frame.dataset.width) || 1920;
+        const slideHeight = parseInt(frame.dataset.height) || 1080;
+        
+        // Calculate uniform scale to fit while maintaining aspect ratio
+        const scaleX = availableWidth / slideWidth;
+        const scaleY = availableHeight / slideHeight;
+        const maxScale = isFullscreen ? Infinity : 1;
+        const scale = Math.max(0, Math.min(scaleX, scaleY, maxScale));
+        
+        // Skip style writes when nothing changed
+        const size = slideWidth + 'x' + slideHeight;
+        if (scale === lastScale && size === lastSize) return;
+        lastScale = scale;
+        lastSize = size;
+        
+        // Force the frame to native dimensions and apply uniform scale
+        frame.style.width = slideWidth + 'px';
+        frame.style.height = slideHeight + 'px';
+        frame.style.transform = `scale(${scale})`;
+        
+        // Show frame after scaling is applied (prevents FOUC)
+        frame.classList.add('scaled');
+    }
     
-    const wrapperRect = wrapper.getBoundingClientRect();
-    const availableWidth = wrapperRect.width - padding;
-    const availableHeight = wrapperRect.height - padding;
+    function scheduleScale() {
+        if (frameRequested) return;
+        frameRequested = true;
+        requestAnimationFrame(applyScale);
+    }
     
-    // Get slide dimensions from data attributes (native resolution)
-    const slideWidth = parseInt(frame.dataset.width) || 1920;
-    const slideHeight = parseInt(frame.dataset.height) || 1080;
+    const resizeObserver = new ResizeObserver((entries) => {
+        const entry = entries[entries.length - 1];
+        const box = entry.borderBoxSize && entry.borderBoxSize[0];
+        wrapperWidth = box ? box.inlineSize : entry.contentRect.width;
+        wrapperHeight = box ? box.blockSize : entry.contentRect.height;
+        scheduleScale();
+    });
     
-    // Calculate uniform scale to fit while maintaining aspect ratio
-    const scaleX = availableWidth / slideWidth;
-    const scaleY = availableHeight / slideHeight;
-    const maxScale = isFullscreen ? Infinity : 1;
-    const scale = Math.min(scaleX, scaleY, maxScale);
+    function attach() {
+        const foundWrapper = document.querySelector('.slide-wrapper');
+        const foundFrame = document.querySelector('.slide-frame');
+        if (!foundWrapper || !foundFrame) return false;
+        
+        if (foundWrapper !== wrapper) {
+            if (wrapper) resizeObserver.unobserve(wrapper);
+            wrapper = foundWrapper;
+            resizeObserver.observe(wrapper);  // Fires once initially
+        }
+        if (foundFrame !== frame) {
+            frame = foundFrame;
+            lastScale = null;
+        }
+        return true;
+    }
     
-    // Force the frame to native dimensions and apply uniform scale
-    frame.style.width = slideWidth + 'px';
-    frame.style.height = slideHeight + 'px';
-    frame.style.transform = `scale(${scale})`;
+    // Fullscreen changes the padding; the resize itself is reported by the observer
+    document.addEventListener('fullscreenchange', () => {
+        lastScale = null;
+        scheduleScale();
+    });
     
-    // Show frame after scaling is applied (prevents FOUC)
-    frame.classList.add('scaled');
-}
-
-// Initialize scaling
-window.addEventListener('resize', updateSlideScale);
-document.addEventListener('fullscreenchange', updateSlideScale);
-
-// Initial scale after DOM is ready
-setTimeout(updateSlideScale, 100);
-
-// Watch for DOM changes
-const observer = new MutationObserver(updateSlideScale);
-setTimeout(() => {
-    const wrapper = document.querySelector('.slide-wrapper');
-    if (wrapper) {
-        observer.observe(wrapper, { childList: true, subtree: true });
+    // Wait until NiceGUI has mounted the viewer, then stop watching the DOM
+    if (!attach()) {
+        const mountObserver = new MutationObserver(() => {
+            if (attach()) mountObserver.disconnect();
+        });
+        mountObserver.observe(document.documentElement, { childList: true, subtree: true });
     }
-}, 100);
+    
+    // Manual trigger, e.g. after changing data-width/data-height
+    window.updateSlideScale = () => {
+        if (attach()) {
+            lastScale = null;
+            scheduleScale();
+        }
+    };
+})();
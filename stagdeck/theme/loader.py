@@ -1,8 +1,10 @@
 """🎨 Theme loader with inheritance and security constraints."""
 
 import json
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from ..utils.paths import PathSecurityError, is_safe_filename
 
@@ -32,7 +34,28 @@ class ThemeLoader:
             'default': self.PACKAGE_THEMES_DIR,
         }
         self._max_inheritance_depth = 5
-        self._loading_stack: list[str] = []  # Circular reference detection
+        # Per context, so decks built concurrently in worker threads or tasks
+        # neither see each other's chains nor record each other's files
+        self._loading_stack: ContextVar[tuple[str, ...]] = ContextVar('theme_loading_stack', default=())
+        self._recorders: ContextVar[tuple[set[Path], ...]] = ContextVar('theme_recorders', default=())
+    
+    @contextmanager
+    def record_files(self) -> Iterator[set[Path]]:
+        """Collect the theme files read while the context is active.
+        
+        Used to find the theme files a deck depends on (including parents
+        pulled in via "extends"), e.g. for cache invalidation. Only files read
+        in the current context are recorded: in this thread or task and in
+        worker threads started from it via asyncio.to_thread().
+        
+        :return: Set that receives the absolute path of every theme file read.
+        """
+        files: set[Path] = set()
+        token = self._recorders.set(self._recorders.get() + (files,))
+        try:
+            yield files
+        finally:
+            self._recorders.reset(token)
     
     def add_search_path(self, symbol: str, path: str | Path) -> None:
         """Register a symbol for theme path resolution.
@@ -158,10 +181,11 @@ class ThemeLoader:
         :return: Merged theme data.
         """
         path_str = str(path)
+        loading_stack = self._loading_stack.get()
         
         # Check circular reference
-        if path_str in self._loading_stack:
-            chain = ' -> '.join(self._loading_stack + [path_str])
+        if path_str in loading_stack:
+            chain = ' -> '.join(loading_stack + (path_str,))
             raise ThemeLoadError(f"Circular theme inheritance detected: {chain}")
         
         # Check max depth
@@ -170,10 +194,12 @@ class ThemeLoader:
                 f"Theme inheritance depth exceeds maximum ({self._max_inheritance_depth})"
             )
         
-        self._loading_stack.append(path_str)
+        token = self._loading_stack.set(loading_stack + (path_str,))
         
         try:
             # Load this theme's data
+            for files in self._recorders.get():
+                files.add(path)
             with open(path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
@@ -188,9 +214,9 @@ class ThemeLoader:
                 data = self._deep_merge(parent_data, data)
             
             return data
-            
+        
         finally:
-            self._loading_stack.pop()
+            self._loading_stack.reset(token)
     
     def _deep_merge(
         self,
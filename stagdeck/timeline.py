@@ -0,0 +1,97 @@
+"""⏱️ Timeline - cumulative slide and step durations of a deck."""
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from .slide import Slide
+
+
+class Timeline:
+    """⏱️ Prefix sums of the slide and step durations of a deck.
+    
+    Built in one pass over the slides, it answers "elapsed time at slide i,
+    step s" in O(1) and "slide and step at elapsed time t" in O(log n).
+    A slide's transition counts as the beginning of its first step.
+    
+    Example:
+        >>> timeline = deck.timeline
+        >>> timeline.duration_at(3, 1)
+        >>> timeline.position_at(90.0)
+        (4, 2)
+    
+    :ivar default_step_duration: Duration of steps without an explicit one.
+    :ivar slide_starts: Elapsed time when each slide's transition starts,
+        followed by the total duration.
+    :ivar total_steps: Number of steps across all slides.
+    """
+    
+    def __init__(self, slides: Sequence['Slide'], default_step_duration: float) -> None:
+        """
+        Build the timeline.
+        
+        :param slides: Slides in presentation order.
+        :param default_step_duration: Duration of steps without an explicit one.
+        """
+        self.default_step_duration = default_step_duration
+        self.slide_starts: list[float] = [0.0]
+        self._slides = list(slides)
+        # Elapsed time after each step of each slide, preceded by the time
+        # after the slide's transition; slide i occupies the entries from
+        # _offsets[i] up to _offsets[i + 1]
+        self._step_ends: list[float] = []
+        self._offsets: list[int] = []
+        # Start time and (slide, step) of every step, for position lookups
+        self._starts: list[float] = []
+        self._positions: list[tuple[int, int]] = []
+        
+        elapsed = 0.0
+        for index, slide in enumerate(self._slides):
+            self._offsets.append(len(self._step_ends))
+            start = elapsed
+            elapsed += slide.transition_duration
+            self._step_ends.append(elapsed)
+            for step in range(slide.steps):
+                self._starts.append(start if step == 0 else elapsed)
+                self._positions.append((index, step))
+                elapsed += slide.get_step_duration(step, default_step_duration)
+                self._step_ends.append(elapsed)
+            self.slide_starts.append(elapsed)
+        self._offsets.append(len(self._step_ends))
+        self.total_steps = len(self._positions)
+    
+    @property
+    def total_duration(self) -> float:
+        """Duration of the whole presentation in seconds."""
+        return self.slide_starts[-1]
+    
+    def duration_at(self, slide_index: int, step: int = 0) -> float:
+        """⏱️ Get the elapsed time when a step starts (after the slide's transition).
+        
+        :param slide_index: Slide index (past the end = total duration).
+        :param step: Step index within the slide.
+        :return: Elapsed time in seconds.
+        """
+        if slide_index < 0:
+            return 0.0
+        if slide_index >= len(self._slides):
+            return self.total_duration
+        slide = self._slides[slide_index]
+        offset = self._offsets[slide_index]
+        step = max(step, 0)
+        last = min(step, self._offsets[slide_index + 1] - offset - 1)
+        elapsed = self._step_ends[offset + last]
+        for extra in range(last, step):
+            elapsed += slide.get_step_duration(extra, self.default_step_duration)
+        return elapsed
+    
+    def position_at(self, elapsed: float) -> tuple[int, int]:
+        """📍 Get the slide and step shown at an elapsed time.
+        
+        :param elapsed: Seconds since the start (clamped to the presentation).
+        :return: Tuple of (slide index, step); (0, 0) for an empty deck.
+        """
+        if not self._positions:
+            return 0, 0
+        index = max(bisect_right(self._starts, elapsed) - 1, 0)
+        return self._positions[index]
@@ -1,5 +1,7 @@
 """🎬 DeckViewer - UI component for presenting slide decks."""
 
+import asyncio
+import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
 
@@ -9,7 +11,12 @@ from .slide import Slide
 from .slide_deck import SlideDeck
 
 if TYPE_CHECKING:
+    from nicegui import Client
+    
+    from .audience import RenderCache
+    from .broadcast import BroadcastSession
     from .file_watcher import FileWatcher
+    from .registry import DeckFactory
 
 
 class DeckViewer:
@@ -23,13 +30,17 @@ class DeckViewer:
     """
     
     _static_assets_initialized: bool = False
+    OVERVIEW_PAGE_SIZE: int = 24
+    THUMBNAIL_WIDTH: int = 384
     
     def __init__(
         self,
         deck: SlideDeck,
         current_index: int = 0,
         current_step: int = 0,
-        deck_factory: Callable[[], SlideDeck] | None = None,
+        deck_factory: 'DeckFactory | None' = None,
+        preload_slides: int = 2,
+        thumbnails: 'RenderCache | None' = None,
     ) -> None:
         """
         Initialize the viewer.
@@ -37,7 +48,9 @@ class DeckViewer:
         :param deck: The SlideDeck to display.
         :param current_index: Starting slide index.
         :param current_step: Starting step index.
-        :param deck_factory: Optional factory for hot-reload support.
+        :param deck_factory: Optional sync or async factory for hot-reload support.
+        :param preload_slides: Number of upcoming slides whose media is preloaded.
+        :param thumbnails: Optional render cache with slide thumbnails for the overview.
         """
         self.deck = deck
         self.current_index = current_index
@@ -45,7 +58,23 @@ class DeckViewer:
         self._slide_frame: ui.element | None = None
         self._slide_counter: ui.label | None = None
         self._deck_factory = deck_factory
+        self.preload_slides = preload_slides
+        self._preloaded_urls: set[str] = set()
         self._file_watcher: 'FileWatcher | None' = None
+        self._watched_files: set[Path] = set()
+        self._unsubscribe_watcher: Callable[[], None] | None = None
+        self._client: 'Client | None' = None
+        self._pending_changes: list[Path] = []
+        self._reload_task: asyncio.Task | None = None
+        self._build_task: asyncio.Task | None = None
+        self._broadcast: 'BroadcastSession | None' = None
+        self._audience_cache: 'RenderCache | None' = None
+        self._unsubscribe_broadcast: Callable[[], None] | None = None
+        self.thumbnails = thumbnails
+        self._overview_dialog: ui.dialog | None = None
+        self._overview_grid: ui.element | None = None
+        self._overview_pagination: ui.pagination | None = None
+        self._overview_page: int | None = None
     
     @property
     def current_slide(self) -> Slide | None:
@@ -160,63 +189,302 @@ class DeckViewer:
         await self.go_to_slide(index, step)
         return True
     
-    async def reload(self) -> None:
+    async def reload(self, changed_path: Path | str | None = None) -> None:
         """🔄 Reload the deck from source files and refresh the view.
         
-        Used for hot-reload when markdown files change.
+        Used for hot-reload when watched files change. If `changed_path` is a
+        markdown source of the deck, only that file is re-split and only slides
+        whose markdown changed are rebuilt (see SlideDeck.reload_source); the
+        view is rebuilt only if the current slide itself changed. Other watched
+        files (e.g. media) just refresh the current slide. Without a path the
+        whole deck is recreated via the deck factory.
         Preserves the current slide position if possible.
+        
+        :param changed_path: The file that changed, if known.
         """
-        if self._deck_factory is None:
+        current = self.current_slide
+        current_name = current.name if current else None
+        current_step = self.current_step
+        
+        if changed_path is not None:
+            try:
+                rebuilt = self.deck.reload_source(changed_path)
+            except OSError:
+                return  # File vanished mid-save, the next change event catches up
+            if rebuilt is None:
+                # Not a markdown source (e.g. media) - refresh current slide
+                self._clear_render_caches()
+                await self._update_view()
+                return
+            if rebuilt:
+                self._clear_render_caches()
+            position = self.deck._position_of(current) if current is not None else None
+            if position is None and current is not None:
+                # A renamed copy shares the slide's content (see reload_source)
+                position = next(
+                    (self.deck._position_of(slide) for slide in rebuilt if vars(slide).get('data') is current.data),
+                    None,
+                )
+            if position is not None:
+                # Current slide untouched - keep the view, only fix the counter
+                self.current_index = position
+                self._update_counter()
+                return
+        else:
+            if self._deck_factory is None:
+                return
+            from .registry import build_deck
+            self.deck = await build_deck(self._deck_factory)
+            self._clear_render_caches()
+        
+        self._restore_position(current_name, current_step)
+        await self._update_view()
+    
+    def _clear_render_caches(self) -> None:
+        """Drop pre-rendered images of the old deck (thumbnails, audience images)."""
+        for cache in (self.thumbnails, self._audience_cache):
+            if cache is not None:
+                cache.clear()
+    
+    def enable_hot_reload(self) -> None:
+        """🔥 Watch the deck's source files and push reloads into this client.
+        
+        Must be called from within the page handler, so the viewer knows which
+        client to update. All viewers share the process-wide FileWatcher; its
+        change events are pushed straight into the client's context - no
+        per-client polling timer or watcher is needed. The subscription is
+        dropped automatically when the client is deleted.
+        """
+        from .file_watcher import FileWatcher
+        
+        if self._file_watcher is not None or not self.deck.source_files:
             return
         
-        # Remember current position
-        current_name = self.current_slide.name if self.current_slide else None
-        current_step = self.current_step
+        self._client = ui.context.client
+        watcher = FileWatcher.get_instance()
+        self._file_watcher = watcher
+        self._unsubscribe_watcher = watcher.subscribe(self._on_watched_change)
+        for source_file in self.deck.source_files:
+            self._watch_file(source_file)
+        self._client.on_delete(self.release)
+    
+    def _watch_file(self, path: Path) -> None:
+        """Watch a file for this viewer (needs enable_hot_reload())."""
+        path = Path(path).resolve()
+        if path not in self._watched_files:
+            self._watched_files.add(path)
+            self._file_watcher.watch(path)
+    
+    def _on_watched_change(self, path: Path) -> None:
+        """Forward changes of the shared watcher that concern this deck."""
+        if path in self._watched_files:
+            self.notify_file_changed(path)
+    
+    def release(self) -> None:
+        """🧹 Stop hot-reload/broadcast and drop references held for the client.
+        
+        Called automatically when the client is deleted (tab closed and not
+        reconnected). Safe to call more than once.
+        """
+        if self._file_watcher is not None:
+            for path in self._watched_files:
+                self._file_watcher.unwatch(path)
+        if self._unsubscribe_watcher is not None:
+            self._unsubscribe_watcher()
+            self._unsubscribe_watcher = None
+        self._file_watcher = None
+        self._watched_files.clear()
+        for task in (self._reload_task, self._build_task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._reload_task = None
+        self._build_task = None
+        self._pending_changes.clear()
+        if self._unsubscribe_broadcast is not None:
+            self._unsubscribe_broadcast()
+            self._unsubscribe_broadcast = None
+        self._broadcast = None
+        self._audience_cache = None
+        if self._client is not None and getattr(self._client, '_stagdeck_viewer', None) is self:
+            del self._client._stagdeck_viewer
+        self._client = None
+    
+    def notify_file_changed(self, path: Path) -> None:
+        """📨 Queue a changed file and schedule a reload in the client context.
+        
+        Safe to call from outside any UI context (e.g. a FileWatcher callback).
+        Changes arriving while a reload is running are coalesced and handled
+        by the same task.
+        
+        :param path: The file that changed.
+        """
+        from nicegui import background_tasks
+        
+        if path not in self._pending_changes:
+            self._pending_changes.append(path)
+        if self._reload_task is None or self._reload_task.done():
+            self._reload_task = background_tasks.create(
+                self._process_file_changes(), name='stagdeck-hot-reload',
+            )
+    
+    async def _process_file_changes(self) -> None:
+        """Apply queued file changes inside the owning client's context."""
+        client = self._client
+        while self._pending_changes:
+            path = self._pending_changes.pop(0)
+            if client is None:
+                await self.reload(path)
+                continue
+            if client.is_deleted:
+                self._pending_changes.clear()
+                return
+            with client:
+                await self.reload(path)
+    
+    # 📡 Broadcast
+    
+    def present_to(self, session: 'BroadcastSession', cache: 'RenderCache | None' = None) -> None:
+        """📣 Publish this viewer's navigation to a broadcast session.
+        
+        :param session: Session the audience viewers follow.
+        :param cache: Render cache of the session's audience endpoint; cleared
+            whenever this viewer reloads a changed deck.
+        """
+        self._broadcast = session
+        self._audience_cache = cache
+        session.publish(self.current_index, self.current_step)
+    
+    def follow(self, session: 'BroadcastSession') -> None:
+        """👀 Follow the presenter of a broadcast session.
         
-        # Reload deck
-        self.deck = self._deck_factory()
+        Must be called from within the page handler. Jumps to the presenter's
+        current position (if any) and subscribes for future changes; the
+        subscription is dropped when the client is deleted.
         
-        # Try to restore position by slide name
-        if current_name:
-            index = self.deck.get_slide_index(current_name)
-            if index is not None:
+        :param session: Session to follow.
+        """
+        client = ui.context.client
+        if session.position is not None:
+            index, step = session.position
+            if 0 <= index < len(self.deck.slides):
                 self.current_index = index
-                slide = self.deck.slides[index]
-                self.current_step = min(current_step, slide.steps - 1)
-            else:
-                # Slide was removed, clamp to valid range
-                self.current_index = min(self.current_index, len(self.deck.slides) - 1)
-                self.current_step = 0
-        
-        await self._update_view()
+                self.current_step = max(0, min(step, self.deck.slides[index].steps - 1))
+        
+        async def on_position(index: int, step: int) -> None:
+            if client.is_deleted:
+                return
+            with client:
+                await self.go_to_slide(index, step)
+        
+        if self._unsubscribe_broadcast is not None:
+            self._unsubscribe_broadcast()
+        self._unsubscribe_broadcast = session.subscribe(on_position)
+        if self._client is None:
+            self._client = client
+            client.on_delete(self.release)
+    
+    def _restore_position(self, slide_name: str | None, step: int) -> None:
+        """Move to the slide with the given name, or clamp to a valid position."""
+        if not slide_name:
+            return
+        index = self.deck.get_slide_index(slide_name)
+        if index is not None:
+            self.current_index = index
+            slide = self.deck.slides[index]
+            self.current_step = max(0, min(step, slide.steps - 1))
+        else:
+            # Slide was removed, clamp to valid range
+            self.current_index = max(0, min(self.current_index, len(self.deck.slides) - 1))
+            self.current_step = 0
     
     # 🎨 UI rendering methods
     
     async def _update_view(self) -> None:
-        """🔄 Update the slide view, counter, and URL."""
+        """🔄 Update the slide view, counter, and URL.
+        
+        Navigation is coalesced: a new update cancels a build that has not
+        finished yet, so rapid key presses jump straight to the final
+        (slide, step) and only that one is built. Returns once the view
+        shows the latest state (or immediately if superseded).
+        """
         if self._slide_frame is None:
             return
-        self._slide_frame.clear()
-        with self._slide_frame:
+        if self._build_task is not None and not self._build_task.done():
+            self._build_task.cancel()
+        task = self._build_task = asyncio.get_running_loop().create_task(self._build_view())
+        await asyncio.wait({task})
+        if not task.cancelled():
+            task.result()
+    
+    async def _build_view(self) -> None:
+        """Build the current slide and refresh counter, URL and hints."""
+        # Let already queued navigation events supersede this build first
+        await asyncio.sleep(0)
+        frame = self._slide_frame
+        frame.clear()
+        with frame:
             await self._build_slide_content()
-        if self._slide_counter:
-            slide = self.current_slide
-            if slide and slide.steps > 1:
-                self._slide_counter.text = f'{self.current_index + 1}.{self.current_step + 1} / {self.total_slides}'
-            else:
-                self._slide_counter.text = f'{self.current_index + 1} / {self.total_slides}'
-        self._update_url()
+            self._update_counter()
+            self._update_url()
+            self._preload_upcoming_media()
+        if self._broadcast is not None:
+            self._broadcast.publish(self.current_index, self.current_step)
+    
+    def _update_counter(self) -> None:
+        """🔢 Update the slide counter label."""
+        if self._slide_counter is None:
+            return
+        slide = self.current_slide
+        if slide and slide.steps > 1:
+            self._slide_counter.text = f'{self.current_index + 1}.{self.current_step + 1} / {self.total_slides}'
+        else:
+            self._slide_counter.text = f'{self.current_index + 1} / {self.total_slides}'
+    
+    def get_upcoming_media(self, count: int | None = None) -> list[tuple[str, str]]:
+        """🔮 Get the media URLs of the next slides, as the browser will request them.
+        
+        :param count: Number of upcoming slides (defaults to preload_slides).
+        :return: List of (kind, url) with kind 'image' or 'video', without duplicates.
+        """
+        from .components.content_elements import VideoView
+        
+        count = self.preload_slides if count is None else count
+        upcoming = self.deck.slides[self.current_index + 1:self.current_index + 1 + count]
+        media: list[tuple[str, str]] = []
+        for slide in upcoming:
+            for view in slide.get_media():
+                url = view.get_preload_url()
+                kind = 'video' if isinstance(view, VideoView) else 'image'
+                if url and (kind, url) not in media:
+                    media.append((kind, url))
+        return media
+    
+    def _preload_upcoming_media(self) -> None:
+        """📥 Attach preload hints for upcoming media not yet sent to this client.
+        
+        Stored in the frame's `data-preload` attribute, so the hints travel
+        with the slide update itself; static/frame_state.js picks them up.
+        """
+        if self.preload_slides <= 0 or self._slide_frame is None:
+            return
+        media = [(kind, url) for kind, url in self.get_upcoming_media() if url not in self._preloaded_urls]
+        if not media:
+            return
+        self._preloaded_urls.update(url for _, url in media)
+        items = [{'kind': kind, 'url': url} for kind, url in media]
+        self._slide_frame._props['data-preload'] = json.dumps(items)
     
     def _update_url(self) -> None:
-        """🔗 Update browser URL with current slide and step names."""
-        slide_name = self.current_slide_name
-        step_name = self.current_step_name
-        ui.run_javascript(f'''
-            const url = new URL(window.location);
-            url.searchParams.set('slide', '{slide_name}');
-            url.searchParams.set('step', '{step_name}');
-            window.history.replaceState({{}}, '', url);
-        ''')
+        """🔗 Store the current slide and step names on the slide frame.
+        
+        static/frame_state.js mirrors them into the browser URL, so no extra
+        JavaScript message is sent and names are never interpolated into code.
+        """
+        if self._slide_frame is None:
+            return
+        self._slide_frame._props['data-slide'] = self.current_slide_name
+        self._slide_frame._props['data-step'] = self.current_step_name
+        self._slide_frame.update()
     
     async def _build_slide_content(self) -> None:
         """🏗️ Build the current slide content."""
@@ -225,11 +493,15 @@ class DeckViewer:
             ui.label('📭 No slides').classes('text-2xl text-gray-400')
             return
         
+        from .profiler import BuildProfiler
+        
         # Get master layout if specified
         master_slide = self.deck.get_layout(slide.layout) if slide.layout else None
         
         # Let the slide build itself (with optional master layer and deck for style cascade)
-        await slide.build(step=self.current_step, master_slide=master_slide, deck=self.deck)
+        profiler = BuildProfiler.get_instance()
+        with profiler.measure(self.current_index, slide.name, self.current_step, ui.context.client):
+            await slide.build(step=self.current_step, master_slide=master_slide, deck=self.deck)
     
     # ⌨️ Event handlers
     
@@ -256,6 +528,91 @@ class DeckViewer:
                 await self.next_step()
             elif e.key == 'f':
                 await self._toggle_fullscreen()
+            elif e.key == 'o':
+                self.toggle_overview()
+    
+    # 🗂️ Overview
+    
+    @property
+    def thumbnail_size(self) -> tuple[int, int]:
+        """Thumbnail (width, height) matching the deck's aspect ratio."""
+        width = self.THUMBNAIL_WIDTH
+        return width, round(width * self.deck.height / self.deck.width)
+    
+    def _build_overview(self) -> None:
+        """🗂️ Create the (initially empty) overview dialog."""
+        self._register_thumbnails()
+        
+        with ui.dialog().props('maximized') as self._overview_dialog:
+            with ui.card().classes('overview-panel w-full h-full'):
+                with ui.row().classes('w-full items-center justify-between'):
+                    ui.label('Overview').classes('text-lg')
+                    self._overview_pagination = ui.pagination(
+                        1, 1, direction_links=True,
+                        on_change=lambda e: self._show_overview_page(e.value),
+                    )
+                    ui.button(icon='close', on_click=self._overview_dialog.close).props('flat')
+                self._overview_grid = ui.element('div').classes('overview-grid')
+    
+    def _register_thumbnails(self) -> None:
+        """Serve the thumbnail cache for the current deck and thumbnail size."""
+        if self.thumbnails is not None:
+            from .audience import setup_thumbnail_endpoint
+            setup_thumbnail_endpoint(self.thumbnails, deck=self.deck, sizes=[self.thumbnail_size])
+    
+    def toggle_overview(self) -> None:
+        """🗂️ Open the overview at the page of the current slide, or close it."""
+        if self._overview_dialog is None:
+            return
+        if self._overview_dialog.value:
+            self._overview_dialog.close()
+            return
+        self._overview_page = None  # Current slide and thumbnails may have changed
+        self._register_thumbnails()  # The deck may have been rebuilt since
+        size = self.OVERVIEW_PAGE_SIZE
+        pages = max(1, -(-len(self.deck.slides) // size))
+        page = self.current_index // size + 1
+        self._overview_pagination.max = pages
+        self._show_overview_page(page)
+        self._overview_pagination.set_value(page)
+        self._overview_dialog.open()
+    
+    def _show_overview_page(self, page: int) -> None:
+        """Fill the overview grid with one page of thumbnails."""
+        if self._overview_grid is None or page == self._overview_page:
+            return
+        self._overview_page = page
+        start = (page - 1) * self.OVERVIEW_PAGE_SIZE
+        self._overview_grid.clear()
+        with self._overview_grid:
+            for index in range(start, min(start + self.OVERVIEW_PAGE_SIZE, len(self.deck.slides))):
+                self._build_thumbnail(index)
+    
+    def _build_thumbnail(self, index: int) -> None:
+        """Build one overview tile: placeholder, plus lazy image if available.
+        
+        The image is only requested by the browser once the tile scrolls into
+        view (loading=lazy). Without a cached (or renderable) thumbnail the
+        placeholder with number and title stays visible.
+        """
+        slide = self.deck.slides[index]
+        classes = 'overview-thumb current' if index == self.current_index else 'overview-thumb'
+        with ui.element('div').classes(classes).on('click', lambda i=index: self._choose_from_overview(i)):
+            ui.label(str(index + 1)).classes('overview-number')
+            ui.label(slide.title or slide.name).classes('overview-title')
+            cache = self.thumbnails
+            width, height = self.thumbnail_size
+            if cache is not None and (cache.render is not None or cache.has(index, 0, width, height)):
+                from .audience import thumbnail_url
+                ui.element('img').classes('overview-image').props(
+                    f'src="{thumbnail_url(cache, index, width, height)}" loading=lazy decoding=async alt=""'
+                )
+    
+    async def _choose_from_overview(self, index: int) -> None:
+        """Close the overview and jump to the chosen slide."""
+        if self._overview_dialog is not None:
+            self._overview_dialog.close()
+        await self.go_to_slide(index)
     
     def _build_deck_menu(self) -> None:
         """📋 Build the deck switcher menu."""
@@ -280,18 +637,23 @@ class DeckViewer:
     @classmethod
     def _setup_static_assets(cls) -> None:
         """📦 Setup static CSS and JS assets (once per application)."""
-        from pathlib import Path
+        from .assets import AssetBundle
+        
+        cls._register_static_files()
+        
+        # Fingerprinted, precompressed and cached forever by the browser
+        bundle = AssetBundle.get_instance()
+        bundle.register()
+        ui.add_head_html(bundle.head_html('styles.css', 'scaling.js', 'preload.js', 'frame_state.js'))
+    
+    @classmethod
+    def _register_static_files(cls) -> None:
+        """📂 Serve the package's static folder at /stagdeck/static (once)."""
         from nicegui import app
         
-        # Always register static files (NiceGUI handles duplicates)
-        static_dir = Path(__file__).parent / 'static'
         if not cls._static_assets_initialized:
-            app.add_static_files('/stagdeck/static', static_dir)
+            app.add_static_files('/stagdeck/static', Path(__file__).parent / 'static')
             cls._static_assets_initialized = True
-        
-        # Add CSS and JS to head for this page
-        ui.add_head_html('<link rel="stylesheet" href="/stagdeck/static/styles.css">')
-        ui.add_head_html('<script src="/stagdeck/static/scaling.js"></script>')
     
     def _setup_media_folders(self) -> None:
         """📁 Register deck's media folders as static file routes."""
@@ -315,13 +677,15 @@ class DeckViewer:
         from starlette.responses import Response
         from pathlib import Path
         
+        from .components.content_elements import BLUR_ENDPOINT, DEFAULT_BLUR_RADIUS
+        
         # Only register once
         if hasattr(cls, '_blur_endpoint_registered') and cls._blur_endpoint_registered:
             return
         cls._blur_endpoint_registered = True
         
-        @app.get('/stagdeck/blur')
-        async def serve_blurred_image(path: str, radius: float = 4.0):
+        @app.get(BLUR_ENDPOINT)
+        async def serve_blurred_image(path: str, radius: float = DEFAULT_BLUR_RADIUS):
             """Serve a blurred version of an image."""
             from .utils.image_processing import apply_gaussian_blur
             
@@ -369,7 +733,7 @@ class DeckViewer:
         
         resolved = self._resolve_media_path(url_path)
         if resolved:
-            self._file_watcher.watch(resolved)
+            self._watch_file(resolved)
     
     @classmethod
     def get_current(cls) -> 'DeckViewer | None':
@@ -455,9 +819,11 @@ class DeckViewer:
                 self._slide_counter = ui.label().classes('text-lg')
                 with ui.row().classes('gap-2'):
                     ui.button(icon='arrow_forward', on_click=self.next_slide).props('flat')
+                    ui.button(icon='grid_view', on_click=self.toggle_overview).props('flat')
                     ui.button(icon='fullscreen', on_click=self._toggle_fullscreen).props('flat')
                     self._build_deck_menu()
         
+        self._build_overview()
         ui.keyboard(on_key=self._handle_key)
         await self._update_view()
     
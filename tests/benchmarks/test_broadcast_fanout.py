@@ -0,0 +1,67 @@
+"""Benchmark: presenter-to-audience fan-out latency for many local clients."""
+
+import asyncio
+import statistics
+import time
+
+import pytest
+from nicegui import ui
+from nicegui.testing import User
+
+from stagdeck import BroadcastSession, DeckViewer, SlideDeck
+
+
+CLIENTS = 500
+NAVIGATIONS = 5
+
+
+def _create_deck() -> SlideDeck:
+    deck = SlideDeck(title='Broadcast')
+    for i in range(10):
+        deck.add(title=f'Slide {i}', content=f'- point {i}a\n- point {i}b')
+    return deck
+
+
+@pytest.mark.benchmark
+async def test_broadcast_fanout_latency(user: User) -> None:
+    """Measure how long a published position takes to reach 500 followers."""
+    session = BroadcastSession('benchmark')
+    followers: list[DeckViewer] = []
+    arrived: dict[int, float] = {}
+    
+    @ui.page('/')
+    async def page():
+        viewer = DeckViewer(deck=_create_deck())
+        viewer.follow(session)
+        followers.append(viewer)
+        await viewer.build()
+    
+    for _ in range(CLIENTS):
+        await user.open('/')
+    assert session.subscriber_count == CLIENTS
+    
+    # Record per-follower arrival times without changing delivery behaviour
+    for number, viewer in enumerate(followers):
+        original = viewer.go_to_slide
+        
+        async def timed(index, step=0, _original=original, _number=number):
+            await _original(index, step)
+            arrived[_number] = time.perf_counter()
+        viewer.go_to_slide = timed
+    
+    latencies = []
+    for index in range(1, NAVIGATIONS + 1):
+        arrived.clear()
+        started = time.perf_counter()
+        session.publish(index)
+        while len(arrived) < CLIENTS:
+            await asyncio.sleep(0.001)
+        latencies.extend(t - started for t in arrived.values())
+        assert all(v.current_index == index for v in followers)
+    
+    latencies.sort()
+    p50 = statistics.median(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    summary = (f'fan-out to {CLIENTS} clients: p50 {p50 * 1000:.1f} ms, p99 {p99 * 1000:.1f} ms, '
+               f'max {latencies[-1] * 1000:.1f} ms')
+    assert p99 < 5.0, summary
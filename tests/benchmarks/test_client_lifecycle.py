@@ -0,0 +1,70 @@
+"""Soak test: hot-reload resources must not accumulate across page views."""
+
+import asyncio
+import gc
+import os
+from pathlib import Path
+
+import pytest
+from nicegui import ui
+from nicegui.testing import User
+
+from stagdeck import DeckViewer, SlideDeck
+
+
+CLIENTS = 1000
+
+
+def _rss_bytes() -> int | None:
+    """Current resident set size, or None where /proc is unavailable."""
+    statm = Path('/proc/self/statm')
+    if not statm.exists():
+        return None
+    return int(statm.read_text().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def _count_viewers() -> int:
+    """Number of DeckViewer objects still alive."""
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, DeckViewer))
+
+
+@pytest.mark.benchmark
+async def test_open_close_clients_keeps_tasks_and_rss_flat(user: User, tmp_path) -> None:
+    """Open and close many hot-reload clients; tasks and RSS must stay flat."""
+    md_file = tmp_path / 'slides.md'
+    md_file.write_text('# One\n\n---\n\n# Two')
+    
+    def create_deck():
+        deck = SlideDeck()
+        deck.add_from_file(md_file)
+        return deck
+    
+    @ui.page('/')
+    async def page():
+        viewer = DeckViewer(deck=create_deck(), deck_factory=create_deck)
+        viewer.enable_hot_reload()
+        await viewer.build()
+    
+    async def cycle(count: int) -> None:
+        for _ in range(count):
+            await user.open('/')
+            user.client.delete()
+        await asyncio.sleep(0.1)
+        gc.collect()
+    
+    # Warm up caches and lazily created objects before taking a baseline
+    await cycle(50)
+    tasks_before = len(asyncio.all_tasks())
+    viewers_before = _count_viewers()
+    rss_before = _rss_bytes()
+    
+    await cycle(CLIENTS)
+    tasks_after = len(asyncio.all_tasks())
+    viewers_after = _count_viewers()
+    rss_after = _rss_bytes()
+    
+    assert tasks_after <= tasks_before + 5, f'tasks: {tasks_before} -> {tasks_after}'
+    assert viewers_after <= viewers_before + 5, f'live viewers: {viewers_before} -> {viewers_after}'
+    if rss_before is not None:
+        assert rss_after - rss_before < 64 * 2**20, \
+            f'rss: {rss_before / 2**20:.1f} MiB -> {rss_after / 2**20:.1f} MiB'
@@ -0,0 +1,47 @@
+"""Benchmark: diffing a 1,000-slide deck against an edited rebuild."""
+
+import time
+
+import pytest
+
+from stagdeck import SlideDeck
+
+
+SLIDES = 1000
+
+
+def _markdown(edit: bool = False) -> list[str]:
+    slides = [f'# Slide {i}\n\n- point {i}\n- another point\n\n^ Notes for {i}' for i in range(SLIDES)]
+    if edit:
+        slides[10] += '\nEdited'
+        slides.insert(500, '# Inserted')
+        slides.append(slides.pop(100))
+    return slides
+
+
+def _deck(slides: list[str]) -> SlideDeck:
+    deck = SlideDeck()
+    for md in slides:
+        deck.add(md)
+    return deck
+
+
+@pytest.mark.benchmark
+def test_diff_rebuilt_deck() -> None:
+    """A full rebuild after a save is diffed well within a frame budget."""
+    old, new = _deck(_markdown()), _deck(_markdown(edit=True))
+    
+    start = time.perf_counter()
+    diff = old.diff(new)
+    elapsed = time.perf_counter() - start
+    
+    assert diff.added == [499]
+    assert diff.moved == [(100, SLIDES)]
+    assert [old.slides[i].title for i, _ in diff.modified] == ['Slide 10']
+    assert diff.removed == []
+    assert elapsed < 0.5, f'Diff of {SLIDES} slides: {elapsed * 1000:.1f} ms'
+    
+    start = time.perf_counter()
+    old.diff(old.clone())
+    elapsed = time.perf_counter() - start
+    assert elapsed < 0.1, f'Diff against a clone (shared slides): {elapsed * 1000:.2f} ms'
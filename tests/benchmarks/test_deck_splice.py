@@ -0,0 +1,73 @@
+"""Benchmark: inserting 1,000 PPTX pages into the middle of a large deck."""
+
+import time
+
+import pytest
+
+from stagdeck import SlideDeck
+from stagdeck.utils.pptx_loader import _get_cache_dir, _write_cache_meta
+
+
+DECK_SLIDES = 20000
+PPTX_PAGES = 1000
+
+
+@pytest.fixture
+def pptx_file(tmp_path):
+    """A PPTX file with a valid image cache, so LibreOffice is not needed."""
+    pptx = tmp_path / 'talk.pptx'
+    pptx.write_bytes(b'not really a presentation')
+    cache_dir = _get_cache_dir(pptx)
+    cache_dir.mkdir()
+    for page in range(1, PPTX_PAGES + 1):
+        (cache_dir / f'slide_{page:04d}.png').write_bytes(b'')
+    _write_cache_meta(cache_dir, pptx)
+    return pptx
+
+
+def _large_deck() -> SlideDeck:
+    deck = SlideDeck()
+    for i in range(DECK_SLIDES):
+        deck.add(title=f'Slide {i}', name=f's{i}')
+    return deck
+
+
+@pytest.mark.benchmark
+def test_insert_pptx_pages_into_large_deck(pptx_file) -> None:
+    """add_from_file(after=...) places all pages with one splice."""
+    middle = f's{DECK_SLIDES // 2}'
+    
+    deck = _large_deck()
+    start = time.perf_counter()
+    deck.add_from_file(pptx_file, after=middle)
+    elapsed = time.perf_counter() - start
+    
+    position = deck.get_slide_index(middle) + 1
+    assert deck.total_slides == DECK_SLIDES + PPTX_PAGES
+    assert [s.name for s in deck.slides[position:position + 2]] == ['pptx_001', 'pptx_002']
+    assert deck.get_slide_index(f's{DECK_SLIDES - 1}') == DECK_SLIDES + PPTX_PAGES - 1
+    assert elapsed < 1.0, f'{PPTX_PAGES} PPTX pages inserted into {DECK_SLIDES} slides in {elapsed * 1000:.0f} ms'
+
+
+@pytest.mark.benchmark
+def test_splice_vs_single_inserts() -> None:
+    """Moving a run into place: one splice versus one insert per slide."""
+    run = SlideDeck()
+    for i in range(PPTX_PAGES):
+        run.add(title=f'Page {i}', name=f'p{i}')
+    middle = DECK_SLIDES // 2
+    
+    deck = _large_deck()
+    start = time.perf_counter()
+    for i, slide in enumerate(run.slides):
+        deck.slides.insert(middle + i, slide)
+    single = time.perf_counter() - start
+    
+    spliced = _large_deck()
+    start = time.perf_counter()
+    spliced.splice(middle, run.slides)
+    bulk = time.perf_counter() - start
+    
+    assert [s.name for s in spliced.slides] == [s.name for s in deck.slides]
+    assert bulk < single, (f'Insert {PPTX_PAGES} into {DECK_SLIDES}: single inserts {single * 1000:.1f} ms, '
+                           f'splice {bulk * 1000:.2f} ms')
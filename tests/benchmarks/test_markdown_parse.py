@@ -0,0 +1,98 @@
+"""Benchmark: building a 5,000-slide markdown deck."""
+
+import time
+
+import pytest
+
+from stagdeck import SlideDeck
+from stagdeck.components import ParseCache, markdown_parser
+
+
+SLIDES = 5000
+
+SLIDE_TEMPLATES = [
+    '[name: s{i}]\n![background blur:4](/media/bg{i}.jpg)\n# Slide {i}\n## Subtitle {i}\n\n'
+    '- point a\n- point b\n- point c\n\n^ Notes for slide {i}',
+    '# Section {i}\n[.title:color: white]\n[.text:shadow: 1px 1px 2px black]\n\nSome paragraph text {i}.',
+    '![left](/media/a{i}.jpg)\n# Left {i}\nLeft content\n\n![right overlay:0.4](/media/b{i}.jpg)\n'
+    '# Right {i}\n## Details\nRight content\n^ Split notes',
+    '# Code {i}\n\n```python\nprint({i})\n```\n\n| a | b |\n|---|---|\n| 1 | 2 |',
+]
+
+
+def _deck_markdown() -> list[str]:
+    return [SLIDE_TEMPLATES[i % len(SLIDE_TEMPLATES)].format(i=i) for i in range(SLIDES)]
+
+
+@pytest.mark.benchmark
+def test_build_5000_slide_deck(monkeypatch) -> None:
+    """Every slide is tokenized exactly once while building the deck."""
+    slides = _deck_markdown()
+    calls = []
+    original = markdown_parser.tokenize_slide
+    
+    def counting_tokenize(markdown):
+        calls.append(1)
+        return original(markdown)
+    monkeypatch.setattr(markdown_parser, 'tokenize_slide', counting_tokenize)
+    monkeypatch.setattr(ParseCache, '_instance', ParseCache(max_entries=SLIDES))
+    
+    deck = SlideDeck()
+    start = time.perf_counter()
+    for markdown in slides:
+        deck.add(markdown)
+    elapsed = time.perf_counter() - start
+    
+    assert deck.total_slides == SLIDES
+    assert elapsed / SLIDES < 1e-3, (f'{SLIDES} slides built in {elapsed * 1000:.0f} ms '
+                                     f'({elapsed / SLIDES * 1e6:.0f} µs per slide)')
+    assert len(calls) == SLIDES
+    assert deck.slides[2].regions and not deck.slides[0].regions
+    
+    # A repeat build (next deck_factory() call) is served from the parse cache
+    start = time.perf_counter()
+    rebuilt = SlideDeck()
+    for markdown in slides:
+        rebuilt.add(markdown)
+    cached = time.perf_counter() - start
+    
+    assert len(calls) == SLIDES
+    assert ParseCache.get_instance().hits == SLIDES
+    assert cached < elapsed, f'Rebuilt from parse cache in {cached * 1000:.0f} ms, first build {elapsed * 1000:.0f} ms'
+
+
+@pytest.mark.benchmark
+def test_tokenize_5000_slides() -> None:
+    """Parser throughput as used by SlideDeck.add, without slide construction."""
+    slides = _deck_markdown()
+    start = time.perf_counter()
+    for markdown in slides:
+        ast = markdown_parser.SlideAST.parse(markdown)
+        ast.to_multi_region_dict() if ast.is_multi_region else ast.to_slide_dict()
+    elapsed = time.perf_counter() - start
+    
+    assert elapsed / SLIDES < 1e-3, f'{SLIDES} slides parsed in {elapsed * 1000:.0f} ms'
+
+
+@pytest.mark.benchmark
+def test_lazy_load_5000_slide_file(tmp_path, monkeypatch) -> None:
+    """Lazy loading indexes the file without parsing any slide."""
+    md_file = tmp_path / 'deck.md'
+    md_file.write_text('\n\n---\n\n'.join(_deck_markdown()), encoding='utf-8')
+    monkeypatch.setattr(ParseCache, '_instance', ParseCache(max_entries=SLIDES))
+    
+    start = time.perf_counter()
+    eager = SlideDeck().add_from_file(md_file)
+    eager_time = time.perf_counter() - start
+    
+    monkeypatch.setattr(ParseCache, '_instance', ParseCache(max_entries=SLIDES))
+    start = time.perf_counter()
+    lazy = SlideDeck().add_from_file(md_file, lazy=True)
+    lazy_time = time.perf_counter() - start
+    
+    assert lazy.total_slides == eager.total_slides == SLIDES
+    assert lazy_time < eager_time, (f'{SLIDES} slides from file: eager {eager_time * 1000:.0f} ms, '
+                                    f'lazy {lazy_time * 1000:.0f} ms')
+    assert lazy.total_steps == SLIDES
+    assert ParseCache.get_instance().misses == 0
+    assert lazy.slides[-1].title == eager.slides[-1].title
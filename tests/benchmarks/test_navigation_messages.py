@@ -0,0 +1,57 @@
+"""Benchmark: websocket messages and bytes sent per slide navigation."""
+
+import asyncio
+import json
+
+import pytest
+from nicegui import ui
+from nicegui.testing import User
+
+from stagdeck import DeckViewer, SlideDeck
+
+
+SLIDES = 30
+
+
+@pytest.mark.benchmark
+async def test_messages_and_bytes_per_navigation(user: User) -> None:
+    """Navigate through a deck and report messages/bytes per navigation."""
+    viewers = []
+    
+    @ui.page('/')
+    async def page():
+        deck = SlideDeck()
+        for i in range(SLIDES):
+            deck.add(title=f'Slide {i}', content=f'- point {i}a\n- point {i}b\n- point {i}c')
+        viewer = DeckViewer(deck=deck)
+        viewers.append(viewer)
+        await viewer.build()
+    
+    await user.open('/')
+    viewer = viewers[0]
+    outbox = user.client.outbox
+    sent: list[tuple[str, int]] = []
+    original_emit = outbox._emit
+    
+    async def recording_emit(message):
+        sent.append((message[1], len(json.dumps(message[2], default=str))))
+        await original_emit(message)
+    outbox._emit = recording_emit
+    
+    # Warm up: first navigation may load JS components
+    await viewer.next_slide()
+    await asyncio.sleep(0.05)
+    sent.clear()
+    
+    navigations = SLIDES - 2
+    for _ in range(navigations):
+        await viewer.next_slide()
+        await asyncio.sleep(0.02)  # Let the outbox flush each navigation separately
+    
+    # Component scripts are loaded once per client, whenever first needed
+    sent = [(kind, size) for kind, size in sent if kind != 'load_js_components']
+    messages = len(sent)
+    total_bytes = sum(size for _, size in sent)
+    kinds = sorted({kind for kind, _ in sent})
+    assert messages == navigations, (f'{messages / navigations:.2f} messages/navigation ({kinds}), '
+                                     f'{total_bytes / navigations:.0f} bytes/navigation')
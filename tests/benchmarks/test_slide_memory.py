@@ -0,0 +1,48 @@
+"""Benchmark: memory per slide of large generated decks."""
+
+import gc
+import tracemalloc
+
+import pytest
+
+from stagdeck import SlideDeck
+from stagdeck.components import ParseCache
+
+
+SLIDE_TEMPLATES = [
+    '![background blur:4](/media/bg{m}.jpg)\n# Slide {i}\n## Subtitle\n\n- point {i}\n- point b\n\n^ Notes {i}',
+    '# Section {i}\nSome paragraph text {i}.',
+    '![left](/media/a{m}.jpg)\n# Left {i}\nLeft content\n\n![right overlay:0.4](/media/b{m}.jpg)\n# Right {i}\nRight',
+    '[.title:color: white]\n# Styled {i}\nBody text',
+]
+
+
+def _bytes_per_slide(count: int, monkeypatch) -> float:
+    """Build a deck of generated slides and measure the memory it holds."""
+    slides = [SLIDE_TEMPLATES[i % len(SLIDE_TEMPLATES)].format(i=i, m=i % 10) for i in range(count)]
+    # Measure the deck only, not parse results kept for later builds
+    monkeypatch.setattr(ParseCache, '_instance', ParseCache(max_entries=1))
+    
+    gc.collect()
+    tracemalloc.start()
+    try:
+        deck = SlideDeck()
+        for markdown in slides:
+            deck.add(markdown)
+        gc.collect()
+        used, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    assert deck.total_slides == count
+    assert deck.slides[20].background_color is deck.slides[0].background_color  # Interned
+    return used / count
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('count', [10_000, 100_000])
+def test_memory_per_slide(count, monkeypatch) -> None:
+    """Memory grows linearly with a small constant per slide."""
+    per_slide = _bytes_per_slide(count, monkeypatch)
+    
+    assert per_slide < 4096, f'{count} slides: {per_slide:.0f} bytes per slide ({per_slide * count / 2**20:.1f} MiB)'
@@ -6,7 +6,12 @@ from stagdeck.components import (
     MarkdownParser,
     MarkdownDeckInfo,
     MarkdownSlideInfo,
+    PARSER_VERSION,
+    ParseCache,
+    SlideAST,
     SlideContentType,
+    TokenKind,
+    tokenize_slide,
 )
 
 
@@ -630,3 +635,109 @@ Just some content here.
 ''')
         assert result['background_position'] == 'bottom'
         assert result['background'] == 'url(image.jpg)'
+
+
+class TestSlideAST:
+    """Test the single-pass tokenizer and the results derived from it."""
+    
+    def test_each_line_classified_once(self):
+        """Every line becomes exactly one token of the right kind."""
+        tokens = tokenize_slide('''
+[name: intro]
+![left](a.jpg)
+# Title
+## Subtitle
+
+[.title:color: red]
+^ A note
+Body text
+''')
+        assert [t.kind for t in tokens] == [
+            TokenKind.NAME, TokenKind.IMAGE, TokenKind.H1, TokenKind.H2, TokenKind.BLANK,
+            TokenKind.STYLE, TokenKind.NOTE, TokenKind.TEXT,
+        ]
+        assert tokens[0].text == 'intro'
+        assert (tokens[1].alt, tokens[1].url) == ('left', 'a.jpg')
+        assert (tokens[5].alt, tokens[5].url, tokens[5].text) == ('title', 'color', 'red')
+    
+    def test_single_and_multi_results_share_one_parse(self):
+        """Both result shapes match the parser methods."""
+        markdown = '''
+![left](a.jpg)
+# Left
+![right](b.jpg)
+# Right
+^ Note
+'''
+        parser = MarkdownParser()
+        ast = SlideAST.parse(markdown)
+        
+        assert ast.is_multi_region
+        assert ast.to_multi_region_dict() == parser.parse_multi_region_markdown(markdown)
+        assert ast.to_slide_dict() == parser.parse_slide_markdown(markdown)
+    
+    def test_inline_images_do_not_start_regions(self):
+        """Inline images stay content and never count as regions."""
+        ast = SlideAST.parse('![](bg.jpg)\n# Title\n![inline](a.png)\n![inline](b.png)')
+        
+        assert not ast.is_multi_region
+        assert ast.to_slide_dict()['background'] == 'url(bg.jpg)'
+
+
+class TestParseCache:
+    """Test the shared slide parse cache."""
+    
+    def test_repeat_parse_is_a_hit(self):
+        """Identical markdown is parsed once and counted as hit afterwards."""
+        cache = ParseCache()
+        first = cache.parse('# Title\nBody')
+        second = cache.parse('# Title\nBody')
+        
+        assert first == second
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.parse('# Other')[1]['title'] == 'Other'
+        assert cache.misses == 2
+    
+    def test_results_are_copies(self):
+        """Mutating a returned result does not corrupt the cache."""
+        cache = ParseCache()
+        _, result = cache.parse('[.title:color: red]\n# Title')
+        result['text_style']['title']['color'] = 'blue'
+        
+        assert cache.parse('[.title:color: red]\n# Title')[1]['text_style'] == {'title': {'color': 'red'}}
+    
+    def test_multi_region_shape(self):
+        """Multi-region slides are flagged and cached in region shape."""
+        multi_region, result = ParseCache().parse('![left](a.jpg)\n# A\n![right](b.jpg)\n# B')
+        
+        assert multi_region
+        assert [r['title'] for r in result['regions']] == ['A', 'B']
+    
+    def test_key_includes_parser_version(self):
+        """Keys change with the parser version."""
+        assert ParseCache.key('# Title').startswith(f'{PARSER_VERSION}:')
+    
+    def test_lru_bound(self):
+        """The oldest entries are evicted beyond max_entries."""
+        cache = ParseCache(max_entries=2)
+        for i in range(3):
+            cache.parse(f'# Slide {i}')
+        cache.parse('# Slide 0')
+        
+        assert len(cache) == 2
+        assert cache.misses == 4
+
+    def test_grows_to_loaded_deck(self, tmp_path, monkeypatch):
+        """Loading a file larger than the cache grows it instead of evicting."""
+        from stagdeck import SlideDeck
+        
+        md_file = tmp_path / 'deck.md'
+        md_file.write_text('\n\n---\n\n'.join(f'# Slide {i}' for i in range(5)), encoding='utf-8')
+        monkeypatch.setattr(ParseCache, '_instance', ParseCache(max_entries=2))
+        cache = ParseCache.get_instance()
+        
+        SlideDeck().add_from_file(md_file)
+        SlideDeck().add_from_file(md_file)
+        
+        assert cache.max_entries == 5
+        assert cache.misses == 5 and cache.hits == 5
@@ -0,0 +1,78 @@
+"""Tests for the fingerprinted static asset bundle."""
+
+import gzip
+
+import httpx
+from nicegui import app, ui
+from nicegui.testing import User
+
+from stagdeck import DeckViewer, SlideDeck
+from stagdeck.assets import AssetBundle
+
+
+class TestAssetBundle:
+    """Test fingerprinting and precompression."""
+    
+    def test_fingerprint_follows_content(self, tmp_path):
+        """The URL changes exactly when the file content changes."""
+        (tmp_path / 'app.js').write_text('console.log(1);')
+        first = AssetBundle(tmp_path, url_prefix='/assets').url('app.js')
+        assert first == AssetBundle(tmp_path, url_prefix='/assets').url('app.js')
+        assert first.startswith('/assets/app.') and first.endswith('.js')
+        
+        (tmp_path / 'app.js').write_text('console.log(2);')
+        assert AssetBundle(tmp_path, url_prefix='/assets').url('app.js') != first
+    
+    def test_precompressed_variants(self, tmp_path):
+        """Compressible files get a gzip variant chosen by Accept-Encoding."""
+        (tmp_path / 'big.css').write_text('.slide { color: red; }\n' * 200)
+        (tmp_path / 'tiny.css').write_text('a{}')
+        bundle = AssetBundle(tmp_path)
+        big = bundle.get(bundle.url('big.css').rsplit('/', 1)[1])
+        
+        body, encoding = big.select('gzip, deflate')
+        assert encoding == 'gzip'
+        assert gzip.decompress(body) == big.content
+        assert big.select('identity') == (big.content, None)
+        assert big.select('gzip;q=0')[1] is None
+        
+        tiny = bundle.get(bundle.url('tiny.css').rsplit('/', 1)[1])
+        assert tiny.gzip is None
+        assert tiny.select('gzip') == (tiny.content, None)
+    
+    def test_head_html(self, tmp_path):
+        """CSS becomes a stylesheet link, JS a script tag."""
+        (tmp_path / 'a.css').write_text('a{}')
+        (tmp_path / 'b.js').write_text('1')
+        bundle = AssetBundle(tmp_path)
+        
+        html = bundle.head_html('a.css', 'b.js')
+        
+        assert f'<link rel="stylesheet" href="{bundle.url("a.css")}">' in html
+        assert f'<script src="{bundle.url("b.js")}"></script>' in html
+
+
+async def test_viewer_serves_immutable_assets(user: User) -> None:
+    """Viewer pages reference fingerprinted assets served with immutable caching."""
+    @ui.page('/')
+    async def page():
+        deck = SlideDeck()
+        deck.add(title='Hello')
+        await DeckViewer(deck=deck).build()
+    
+    await user.open('/')
+    bundle = AssetBundle.get_instance()
+    url = bundle.url('scaling.js')
+    etag = bundle.get(url.rsplit('/', 1)[1]).etag
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://test') as client:
+        response = await client.get(url, headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert response.headers['cache-control'] == 'public, max-age=31536000, immutable'
+        assert response.headers['content-encoding'] == 'gzip'
+        assert b'ResizeObserver' in response.content
+        
+        revalidated = await client.get(url, headers={'If-None-Match': etag})
+        assert revalidated.status_code == 304
+        
+        assert (await client.get('/stagdeck/assets/scaling.000000000000.js')).status_code == 404
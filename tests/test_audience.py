@@ -0,0 +1,224 @@
+"""Tests for the image-only audience endpoint and its render cache."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from nicegui import app
+from nicegui.testing import User
+
+from stagdeck import BroadcastSession, RenderCache, SlideDeck, setup_audience_endpoint
+
+
+def _fake_renderer(calls: list):
+    """Create a render function that records calls and returns fake PNG bytes."""
+    async def render(index, step, width, height):
+        calls.append((index, step))
+        await asyncio.sleep(0.01)
+        return f'png-{index}-{step}-{width}x{height}'.encode()
+    return render
+
+
+class TestRenderCache:
+    """Test RenderCache storage and single-flight rendering."""
+    
+    async def test_concurrent_misses_render_once(self):
+        """Many concurrent requests for an uncached image share one render."""
+        cache = RenderCache()
+        calls = []
+        render = _fake_renderer(calls)
+        
+        results = await asyncio.gather(*[
+            cache.get_or_render(0, 0, 1920, 1080, render) for _ in range(50)
+        ])
+        
+        assert calls == [(0, 0)]
+        assert set(results) == {b'png-0-0-1920x1080'}
+        assert cache.get(0, 0, 1920, 1080) == b'png-0-0-1920x1080'
+    
+    async def test_render_error_is_not_cached(self):
+        """A failed render propagates and is retried on the next request."""
+        cache = RenderCache()
+        
+        async def failing(index, step, width, height):
+            raise RuntimeError('no browser')
+        
+        try:
+            await cache.get_or_render(0, 0, 100, 100, failing)
+        except RuntimeError:
+            pass
+        assert cache.get(0, 0, 100, 100) is None
+        assert await cache.get_or_render(0, 0, 100, 100, _fake_renderer([])) == b'png-0-0-100x100'
+    
+    def test_lru_eviction(self):
+        """Least recently used images are evicted from memory."""
+        cache = RenderCache(max_entries=2)
+        cache.put(0, 0, 10, 10, b'a')
+        cache.put(1, 0, 10, 10, b'b')
+        cache.get(0, 0, 10, 10)
+        cache.put(2, 0, 10, 10, b'c')
+        
+        assert len(cache) == 2
+        assert cache.get(1, 0, 10, 10) is None
+        assert cache.get(0, 0, 10, 10) == b'a'
+    
+    def test_disk_persistence_and_clear(self, tmp_path):
+        """Images on disk survive a new cache instance; clear() removes them."""
+        RenderCache(directory=tmp_path).put(3, 1, 10, 10, b'png')
+        cache = RenderCache(directory=tmp_path)
+        
+        assert cache.get(3, 1, 10, 10) == b'png'
+        
+        cache.clear()
+        assert cache.get(3, 1, 10, 10) is None
+        assert cache.generation == 1
+        assert not list(tmp_path.glob('*.png'))
+    
+    async def test_disk_io_runs_in_worker_thread(self, tmp_path, monkeypatch):
+        """load() and store() keep disk reads and writes off the event loop."""
+        threads = []
+        to_thread = asyncio.to_thread
+        
+        async def recording(func, *args):
+            threads.append(func)
+            return await to_thread(func, *args)
+        
+        monkeypatch.setattr(asyncio, 'to_thread', recording)
+        await RenderCache(directory=tmp_path).get_or_render(0, 0, 10, 10, _fake_renderer([]))
+        cache = RenderCache(directory=tmp_path)
+        
+        assert await cache.load(0, 0, 10, 10) == b'png-0-0-10x10'
+        assert await cache.load(1, 0, 10, 10) is None
+        assert len(threads) == 4  # Miss lookup, write, two loads
+        assert cache.has(0, 0, 10, 10) and not cache.has(1, 0, 10, 10)
+    
+    async def test_prerender_renders_all_steps(self):
+        """prerender() renders every step of every uncached slide."""
+        deck = SlideDeck()
+        deck.add(title='One')
+        deck.add(title='Two', content='- a\n- b', steps=True)
+        cache = RenderCache()
+        cache.put(0, 0, 10, 10, b'cached')
+        calls = []
+        
+        rendered = await cache.prerender(deck, _fake_renderer(calls), 10, 10)
+        
+        assert rendered == len(calls) == deck.slides[1].steps
+        assert (0, 0) not in calls
+
+
+async def test_audience_routes(user: User) -> None:
+    """The audience page is static HTML and images fall back to live rendering."""
+    session = BroadcastSession('audience-test')
+    calls = []
+    deck = SlideDeck()
+    deck.add(title='One')
+    deck.add(title='Two', steps=2)
+    cache = setup_audience_endpoint(session, render=_fake_renderer(calls), width=320, height=180, deck=deck)
+    cache.put(0, 0, 320, 180, b'prerendered')
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://test') as client:
+        page = await client.get('/audience')
+        assert page.status_code == 200
+        assert '/stagdeck/assets/audience.' in page.text
+        assert 'data-stream="/audience/stream"' in page.text
+        
+        cached = await client.get('/audience/slide/0/0.png')
+        assert cached.content == b'prerendered'
+        assert 'immutable' in cached.headers['cache-control']
+        assert calls == []
+        
+        live = await client.get('/audience/slide/1/0.png')
+        assert live.content == b'png-1-0-320x180'
+        assert calls == [(1, 0)]
+        
+        for url in ('/audience/slide/2/0.png', '/audience/slide/1/2.png', '/audience/slide/-1/0.png'):
+            assert (await client.get(url)).status_code == 404
+        assert calls == [(1, 0)]
+
+
+async def test_audience_without_deck_serves_cache_only(user: User) -> None:
+    """Without a deck to validate against, misses are never rendered."""
+    calls = []
+    with pytest.warns(UserWarning, match='no deck'):
+        cache = setup_audience_endpoint(
+            BroadcastSession('cache-only'), path='/cached-audience', render=_fake_renderer(calls),
+        )
+    cache.put(0, 0, 1920, 1080, b'prerendered')
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://test') as client:
+        assert (await client.get('/cached-audience/slide/0/0.png')).content == b'prerendered'
+        assert (await client.get('/cached-audience/slide/1/0.png')).status_code == 404
+        assert calls == []
+
+
+async def test_audience_stream_follows_presenter(user: User) -> None:
+    """The SSE stream emits the current and every new presenter position."""
+    session = BroadcastSession('stream-test')
+    session.publish(2, 1)
+    setup_audience_endpoint(session)
+    route = next(r for r in app.routes if getattr(r, 'path', '') == '/audience/stream')
+    
+    class FakeRequest:
+        async def is_disconnected(self):
+            return False
+    
+    response = await route.endpoint(FakeRequest())
+    events = response.body_iterator
+    first = json.loads((await events.__anext__()).removeprefix('data: '))
+    assert first == {'slide': 2, 'step': 1, 'src': '/audience/slide/2/1.png?v=0'}
+    assert session.subscriber_count == 1
+    
+    session.publish(3, 0)
+    second = json.loads((await events.__anext__()).removeprefix('data: '))
+    assert second['slide'] == 3
+    
+    await events.aclose()
+    assert session.subscriber_count == 0
+
+
+async def test_thumbnail_endpoint(user: User) -> None:
+    """Thumbnails are served from the cache; misses 404 unless the cache can render."""
+    from stagdeck.audience import setup_thumbnail_endpoint, thumbnail_url
+    
+    deck = SlideDeck()
+    for title in ('One', 'Two'):
+        deck.add(title=title)
+    cache = RenderCache()
+    cache.put(0, 0, 384, 216, b'thumb')
+    setup_thumbnail_endpoint(cache, deck=deck, sizes=[(384, 216)])
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://test') as client:
+        assert (await client.get(thumbnail_url(cache, 0, 384, 216))).content == b'thumb'
+        assert (await client.get(thumbnail_url(cache, 1, 384, 216))).status_code == 404
+        
+        calls = []
+        cache.render = _fake_renderer(calls)
+        assert (await client.get(thumbnail_url(cache, 1, 384, 216))).content == b'png-1-0-384x216'
+
+        # Unknown sizes and slides never render
+        assert (await client.get(thumbnail_url(cache, 1, 4000, 4000))).status_code == 404
+        assert (await client.get(thumbnail_url(cache, 2, 384, 216))).status_code == 404
+        assert calls == [(1, 0)]
+
+
+async def test_thumbnail_endpoint_per_cache(user: User) -> None:
+    """Each cache is served under its own id, bound to its latest deck."""
+    from stagdeck.audience import setup_thumbnail_endpoint, thumbnail_url
+    
+    first, second = RenderCache(), RenderCache()
+    deck = SlideDeck()
+    deck.add(title='Only')
+    first.put(0, 0, 384, 216, b'first')
+    second.put(0, 0, 384, 216, b'second')
+    setup_thumbnail_endpoint(first, deck=deck, sizes=[(384, 216)])
+    setup_thumbnail_endpoint(second, deck=deck, sizes=[(384, 216)])
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://test') as client:
+        assert (await client.get(thumbnail_url(first, 0, 384, 216))).content == b'first'
+        assert (await client.get(thumbnail_url(second, 0, 384, 216))).content == b'second'
+        
+        rebuilt = SlideDeck()
+        setup_thumbnail_endpoint(second, deck=rebuilt)
+        assert (await client.get(thumbnail_url(second, 0, 384, 216))).status_code == 404
@@ -0,0 +1,111 @@
+"""Tests for BroadcastSession and presenter/audience viewers."""
+
+import asyncio
+
+from nicegui import ui
+from nicegui.testing import User
+
+from stagdeck import BroadcastSession, DeckViewer, SlideDeck
+
+
+class TestBroadcastSession:
+    """Test the pub/sub channel itself."""
+    
+    async def test_publish_reaches_all_subscribers(self):
+        """Every subscriber receives the published position."""
+        session = BroadcastSession('test')
+        received = [[], []]
+        session.subscribe(lambda i, s: received[0].append((i, s)))
+        
+        async def async_follower(index, step):
+            received[1].append((index, step))
+        session.subscribe(async_follower)
+        
+        session.publish(2, 1)
+        await asyncio.sleep(0.01)
+        
+        assert received == [[(2, 1)], [(2, 1)]]
+        assert session.position == (2, 1)
+    
+    async def test_slow_subscriber_gets_only_latest_position(self):
+        """Positions published while a follower is busy are coalesced."""
+        session = BroadcastSession('test')
+        release = asyncio.Event()
+        slow, fast = [], []
+        
+        async def slow_follower(index, step):
+            slow.append(index)
+            await release.wait()
+        session.subscribe(slow_follower)
+        session.subscribe(lambda i, s: fast.append(i))
+        
+        session.publish(1)
+        await asyncio.sleep(0.01)
+        for index in range(2, 6):
+            session.publish(index)
+            await asyncio.sleep(0)
+        release.set()
+        await asyncio.sleep(0.01)
+        
+        assert slow == [1, 5]
+        assert fast == [1, 2, 3, 4, 5]
+    
+    async def test_republish_same_position_is_noop(self):
+        """Publishing the current position again delivers nothing."""
+        session = BroadcastSession('test')
+        received = []
+        session.subscribe(lambda i, s: received.append(i))
+        
+        session.publish(1)
+        await asyncio.sleep(0.01)
+        session.publish(1)
+        await asyncio.sleep(0.01)
+        
+        assert received == [1]
+    
+    async def test_unsubscribe(self):
+        """Unsubscribed followers receive nothing."""
+        session = BroadcastSession('test')
+        received = []
+        unsubscribe = session.subscribe(lambda i, s: received.append(i))
+        unsubscribe()
+        
+        session.publish(3)
+        await asyncio.sleep(0.01)
+        
+        assert received == []
+        assert session.subscriber_count == 0
+    
+    def test_get_returns_shared_session(self):
+        """Sessions are shared by name."""
+        assert BroadcastSession.get('shared') is BroadcastSession.get('shared')
+        assert BroadcastSession.get('shared') is not BroadcastSession.get('other')
+
+
+async def test_audience_follows_presenter(user: User) -> None:
+    """An audience viewer follows the presenter's navigation."""
+    session = BroadcastSession('follow-test')
+    presenter = DeckViewer(deck=SlideDeck())
+    presenter.deck.add(title='First Slide')
+    presenter.deck.add(title='Second Slide')
+    presenter.present_to(session)
+    
+    @ui.page('/')
+    async def page():
+        deck = SlideDeck()
+        deck.add(title='First Slide')
+        deck.add(title='Second Slide')
+        viewer = DeckViewer(deck=deck)
+        viewer.follow(session)
+        await viewer.build()
+    
+    await user.open('/')
+    await user.should_see('1 / 2')
+    
+    await presenter.go_to_slide(1)  # No UI built: publish explicitly
+    session.publish(presenter.current_index, presenter.current_step)
+    await user.should_see('Second Slide')
+    await user.should_see('2 / 2')
+    
+    user.client.delete()
+    assert session.subscriber_count == 0
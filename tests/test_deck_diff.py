@@ -0,0 +1,73 @@
+"""Tests for structural deck diffs."""
+
+from stagdeck import SlideDeck
+from stagdeck.deck_diff import slide_fingerprint
+
+
+def _deck(*markdown: str) -> SlideDeck:
+    deck = SlideDeck()
+    for md in markdown:
+        deck.add(md)
+    return deck
+
+
+class TestDeckDiff:
+    """Test matching slides by name and fingerprint."""
+    
+    def test_identical_decks(self):
+        """Independently built equal decks have no changes."""
+        old = _deck('# A', '# B', '# C')
+        diff = old.diff(_deck('# A', '# B', '# C'))
+        assert not diff.changed
+        assert old.diff(old.clone()).changed is False
+    
+    def test_fingerprint_ignores_name(self):
+        """Fingerprints cover content but not the name."""
+        a, b, c = _deck('[name: x]\n# A', '[name: y]\n# A', '[name: x]\n# Other').slides
+        assert slide_fingerprint(a) == slide_fingerprint(b)
+        assert slide_fingerprint(a) != slide_fingerprint(c)
+    
+    def test_added_and_removed(self):
+        """Unmatched slides are added or removed; the rest keep their order."""
+        old = _deck('[name: a]\n# A', '[name: b]\n# B', '[name: c]\n# C')
+        new = _deck('[name: n]\n# New', '[name: a]\n# A', '[name: c]\n# C')
+        diff = old.diff(new)
+        assert diff.added == [0]
+        assert diff.removed == [1]
+        assert diff.moved == diff.modified == diff.renamed == []
+    
+    def test_modified(self):
+        """Slides with the same name but new content are modified."""
+        old = _deck('[name: a]\n# A', '[name: b]\n# B')
+        new = _deck('[name: a]\n# A', '[name: b]\n# B\nMore text')
+        assert old.diff(new).modified == [(1, 1)]
+    
+    def test_moved(self):
+        """Only the slides that left their relative order are moved."""
+        old = _deck('[name: a]\n# A', '[name: b]\n# B', '[name: c]\n# C', '[name: d]\n# D')
+        new = _deck('[name: b]\n# B', '[name: c]\n# C', '[name: a]\n# A', '[name: d]\n# D')
+        diff = old.diff(new)
+        assert diff.moved == [(0, 2)]
+        assert diff.modified == []
+    
+    def test_shifted_auto_names(self):
+        """Slides renamed by a shifted auto name are matched by content."""
+        old = _deck('# A', '# B')
+        new = _deck('# Intro', '# A', '# B')
+        diff = old.diff(new)
+        assert diff.added == [0]
+        assert diff.renamed == [(0, 1), (1, 2)]
+        assert diff.removed == diff.modified == diff.moved == []
+    
+    def test_reloaded_source(self, tmp_path):
+        """A deck compared with its reloaded clone shows the edited slide."""
+        path = tmp_path / 'talk.md'
+        path.write_text('# A\n\n---\n\n# B\n\n---\n\n# C', encoding='utf-8')
+        old = SlideDeck().add_from_file(path)
+        new = old.clone()
+        path.write_text('# A\n\n---\n\n# B2\n\n---\n\n# C', encoding='utf-8')
+        new.reload_source(path)
+        
+        diff = old.diff(new)
+        assert diff.modified == [(1, 1)]
+        assert diff.added == diff.removed == diff.moved == []
@@ -447,3 +447,239 @@ class TestFileWatcherReload:
                 await task
             except asyncio.CancelledError:
                 pass
+
+
+class TestWatchBackends:
+    """Test pluggable change detection backends."""
+    
+    def test_auto_prefers_inotify_on_linux(self):
+        """'auto' selects inotify where available, polling otherwise."""
+        import sys
+        from stagdeck.file_watcher import InotifyBackend, PollingBackend
+        
+        watcher = FileWatcher()
+        try:
+            if sys.platform.startswith('linux'):
+                assert isinstance(watcher.backend, InotifyBackend)
+            else:
+                assert isinstance(watcher.backend, PollingBackend)
+        finally:
+            watcher.stop()
+    
+    def test_unknown_backend_raises(self):
+        """Unknown backend names are rejected."""
+        with pytest.raises(ValueError):
+            FileWatcher(backend='carrier-pigeon')
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('backend', ['polling', 'auto'])
+    async def test_burst_of_writes_is_coalesced(self, tmp_path, backend):
+        """Rapid successive writes produce a single callback."""
+        test_file = tmp_path / 'test.md'
+        test_file.write_text('v0')
+        
+        watcher = FileWatcher(check_interval=0.1, backend=backend, debounce=0.1)
+        watcher.watch(test_file)
+        callback = Mock()
+        watcher.on_change(callback)
+        task = asyncio.create_task(watcher.start())
+        
+        try:
+            await asyncio.sleep(0.15)
+            for i in range(5):
+                test_file.write_text(f'v{i + 1}')
+            await asyncio.sleep(0.4)
+            
+            assert callback.call_count == 1
+        finally:
+            watcher.stop()
+            await task
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('backend', ['polling', 'auto'])
+    async def test_detects_atomic_rename_save(self, tmp_path, backend):
+        """Editors that save via temp file + rename are detected."""
+        test_file = tmp_path / 'test.md'
+        test_file.write_text('original')
+        
+        watcher = FileWatcher(check_interval=0.1, backend=backend)
+        watcher.watch(test_file)
+        callback = Mock()
+        watcher.on_change(callback)
+        task = asyncio.create_task(watcher.start())
+        
+        try:
+            await asyncio.sleep(0.15)
+            tmp_file = tmp_path / '.test.md.swp'
+            tmp_file.write_text('replaced')
+            tmp_file.replace(test_file)
+            await asyncio.sleep(0.3)
+            
+            assert callback.called
+            assert callback.call_args[0][0] == test_file.resolve()
+        finally:
+            watcher.stop()
+            await task
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('backend', ['polling', 'auto'])
+    async def test_watch_directory(self, tmp_path, backend):
+        """Files created or modified inside a watched directory are reported."""
+        media = tmp_path / 'media'
+        (media / 'sub').mkdir(parents=True)
+        image = media / 'sub' / 'photo.png'
+        image.write_bytes(b'v1')
+        
+        watcher = FileWatcher(check_interval=0.1, backend=backend)
+        watcher.watch_directory(media)
+        changed = []
+        watcher.on_change(changed.append)
+        task = asyncio.create_task(watcher.start())
+        
+        try:
+            await asyncio.sleep(0.15)
+            image.write_bytes(b'v2')
+            (media / 'new.png').write_bytes(b'new')
+            await asyncio.sleep(0.3)
+            
+            assert image.resolve() in changed
+            assert (media / 'new.png').resolve() in changed
+        finally:
+            watcher.stop()
+            await task
+    
+    @pytest.mark.asyncio
+    async def test_stop_releases_inotify_descriptor(self, tmp_path):
+        """stop() closes the inotify file descriptor and ends start()."""
+        from stagdeck.file_watcher import InotifyBackend
+        
+        test_file = tmp_path / 'test.md'
+        test_file.write_text('content')
+        watcher = FileWatcher()
+        if not isinstance(watcher.backend, InotifyBackend):
+            pytest.skip('inotify not available')
+        watcher.watch(test_file)
+        task = asyncio.create_task(watcher.start())
+        await asyncio.sleep(0.05)
+        
+        watcher.stop()
+        await asyncio.wait_for(task, timeout=1.0)
+        
+        assert watcher.backend._closed
+    
+    def test_backend_base_is_abstract(self):
+        """Backends must implement the tracking and waiting methods."""
+        from stagdeck.file_watcher import WatchBackend
+        
+        with pytest.raises(TypeError):
+            WatchBackend()
+
+
+class TestSharedWatcher:
+    """Test the process-wide watcher shared by viewers."""
+    
+    def test_get_instance_is_shared(self):
+        """get_instance() always returns the same watcher."""
+        assert FileWatcher.get_instance() is FileWatcher.get_instance()
+    
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_backend(self, tmp_path):
+        """Subscribers are served by one loop; the last one stops it."""
+        test_file = tmp_path / 'test.md'
+        test_file.write_text('v1')
+        watcher = FileWatcher(check_interval=0.1, backend='polling')
+        first, second = [], []
+        
+        unsubscribe_first = watcher.subscribe(first.append)
+        unsubscribe_second = watcher.subscribe(second.append)
+        watcher.watch(test_file)
+        task = watcher._task
+        await asyncio.sleep(0.15)
+        test_file.write_text('v2')
+        await asyncio.sleep(0.3)
+        
+        assert first == second == [test_file.resolve()]
+        unsubscribe_first()
+        assert watcher.is_running
+        unsubscribe_second()
+        assert not watcher.is_running
+        await asyncio.wait_for(task, timeout=1.0)
+        assert not watcher._files
+    
+    @pytest.mark.asyncio
+    async def test_resubscribe_restarts(self, tmp_path):
+        """A watcher stopped by its last subscriber starts again on a new one."""
+        test_file = tmp_path / 'test.md'
+        test_file.write_text('v1')
+        watcher = FileWatcher(check_interval=0.1, backend='polling')
+        watcher.subscribe(Mock())()
+        
+        changed = []
+        unsubscribe = watcher.subscribe(changed.append)
+        watcher.watch(test_file)
+        await asyncio.sleep(0.15)
+        test_file.write_text('v2')
+        await asyncio.sleep(0.3)
+        
+        assert changed == [test_file.resolve()]
+        unsubscribe()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('backend', ['polling', 'auto'])
+    async def test_unwatch_when_last_reference_is_gone(self, tmp_path, backend):
+        """A file watched twice is only dropped after the second unwatch()."""
+        test_file = tmp_path / 'test.md'
+        test_file.write_text('v1')
+        watcher = FileWatcher(check_interval=0.1, backend=backend)
+        changed = []
+        unsubscribe = watcher.subscribe(changed.append)
+        watcher.watch(test_file)
+        watcher.watch(test_file)
+        
+        watcher.unwatch(test_file)
+        assert test_file.resolve() in watcher._files
+        watcher.unwatch(test_file)
+        assert test_file.resolve() not in watcher._files
+        await asyncio.sleep(0.15)
+        test_file.write_text('v2')
+        await asyncio.sleep(0.3)
+        
+        assert changed == []
+        if hasattr(watcher.backend, '_dir_to_wd'):
+            assert not watcher.backend._dir_to_wd  # inotify watch removed as well
+        unsubscribe()
+    
+    def test_unwatch_directory(self, tmp_path):
+        """Unwatched directories are no longer tracked by the backend."""
+        watcher = FileWatcher(backend='polling')
+        watcher.watch_directory(tmp_path)
+        watcher.unwatch_directory(tmp_path)
+        
+        assert not watcher._directories
+        assert not watcher.backend._directories
+    
+    @pytest.mark.asyncio
+    async def test_backend_instance_cannot_restart(self):
+        """A stopped watcher built from a backend instance refuses to restart."""
+        from stagdeck.file_watcher import PollingBackend
+        
+        watcher = FileWatcher(backend=PollingBackend(0.1))
+        watcher.subscribe(Mock())()
+        
+        with pytest.raises(RuntimeError, match='backend instance'):
+            watcher.subscribe(Mock())
+        assert not watcher._callbacks
+    
+    @pytest.mark.asyncio
+    async def test_backend_factory_restarts(self):
+        """A backend factory creates a fresh backend for every restart."""
+        from stagdeck.file_watcher import PollingBackend
+        
+        watcher = FileWatcher(backend=lambda: PollingBackend(0.1))
+        first = watcher.backend
+        watcher.subscribe(Mock())()
+        unsubscribe = watcher.subscribe(Mock())
+        
+        assert watcher.backend is not first
+        assert watcher.is_running
+        unsubscribe()
@@ -0,0 +1,49 @@
+"""Tests for the event-loop lag monitor."""
+
+import asyncio
+import time
+import warnings
+
+from stagdeck import LoopLagMonitor
+
+
+class TestLoopLagMonitor:
+    """Test stall detection and attribution."""
+    
+    async def test_blocking_handler_is_reported(self):
+        """A synchronous stall above the threshold warns and names the handler."""
+        monitor = LoopLagMonitor(threshold=0.05, interval=0.01)
+        monitor.start()
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                with monitor.track('/slow'):
+                    await asyncio.sleep(0.02)
+                    time.sleep(0.15)  # Blocks the loop
+                    await asyncio.sleep(0.05)
+        finally:
+            monitor.stop()
+        
+        assert monitor.stalls >= 1
+        assert monitor.max_lag >= 0.1
+        assert any('/slow' in str(w.message) for w in caught)
+    
+    def test_small_lag_is_ignored(self):
+        """Lag below the threshold is recorded but not reported."""
+        monitor = LoopLagMonitor(threshold=0.1)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            monitor.record(0.01)
+        
+        assert monitor.last_lag == 0.01
+        assert monitor.stalls == 0
+        assert not caught
+    
+    def test_track_is_reentrant(self):
+        """Nested tracking of the same label keeps it active until the last exit."""
+        monitor = LoopLagMonitor()
+        with monitor.track('/'):
+            with monitor.track('/'):
+                pass
+            assert '/' in monitor._active
+        assert '/' not in monitor._active
@@ -293,6 +293,61 @@ class TestInsert:
             deck.insert('# New', after='nonexistent')
 
 
+class TestSplice:
+    """Test splice() for bulk insertion and removal."""
+    
+    def _deck(self, count):
+        deck = SlideDeck()
+        for i in range(count):
+            deck.add(f'# S{i}', name=f's{i}')
+        return deck
+    
+    def test_insert_run(self):
+        """A run of slides is inserted in order at the position."""
+        deck = self._deck(3)
+        run = self._deck(2).slides
+        
+        assert deck.splice(1, run) == []
+        assert [s.title for s in deck.slides] == ['S0', 'S0', 'S1', 'S1', 'S2']
+        assert deck.slides[1] is run[0]
+    
+    def test_remove_and_insert(self):
+        """Deleted slides are returned and lookups see the new order."""
+        deck = self._deck(5)
+        new = SlideDeck().add('# New', name='new').slides
+        
+        removed = deck.splice(1, new, delete=2)
+        
+        assert [s.name for s in removed] == ['s1', 's2']
+        assert [s.name for s in deck.slides] == ['s0', 'new', 's3', 's4']
+        assert deck.get_slide_index('s3') == 2
+        assert deck.get_slide_index('s1') is None
+    
+    def test_negative_and_out_of_range_positions(self):
+        """Positions are clamped like list slicing."""
+        deck = self._deck(3)
+        extra = SlideDeck().add('# X', name='x').slides
+        
+        assert [s.name for s in deck.splice(-1, extra, delete=5)] == ['s2']
+        assert [s.name for s in deck.slides] == ['s0', 's1', 'x']
+        deck.splice(100, self._deck(1).slides)
+        assert deck.slides[-1].name == 's0'
+        
+        with pytest.raises(ValueError):
+            deck.splice(0, [], delete=-1)
+    
+    def test_add_from_file_inserts_pages_as_run(self, tmp_path):
+        """add_from_file(after=...) places all pages right after the target."""
+        md_file = tmp_path / 'extra.md'
+        md_file.write_text('# E1\n\n---\n\n# E2\n\n---\n\n# E3')
+        deck = self._deck(3)
+        
+        deck.add_from_file(md_file, after='s0')
+        
+        assert [s.title for s in deck.slides] == ['S0', 'E1', 'E2', 'E3', 'S1', 'S2']
+        assert deck.get_slide_index('s1') == 4
+
+
 class TestReplace:
     """Test replace() functionality."""
     
@@ -431,3 +486,364 @@ class TestIntegration:
         # Verify content
         assert deck.slides[1].title == 'Agenda'
         assert deck.slides[3].title == 'Sales Chart'
+
+
+class TestReloadSource:
+    """Test incremental reload_source() for hot-reload."""
+    
+    def _write(self, path, *slides):
+        path.write_text('\n\n---\n\n'.join(slides))
+    
+    def test_unchanged_file_rebuilds_nothing(self, tmp_path):
+        """Reloading an unchanged file keeps every slide object."""
+        md_file = tmp_path / 'slides.md'
+        self._write(md_file, '# One', '# Two', '# Three')
+        deck = SlideDeck()
+        deck.add_from_file(md_file)
+        before = list(deck.slides)
+        
+        assert deck.reload_source(md_file) == []
+        assert all(a is b for a, b in zip(before, deck.slides))
+    
+    def test_only_changed_slide_is_rebuilt(self, tmp_path):
+        """Editing one slide rebuilds exactly that slide, in place."""
+        md_file = tmp_path / 'slides.md'
+        self._write(md_file, '# One', '# Two', '# Three')
+        deck = SlideDeck()
+        deck.add_from_file(md_file)
+        first, second, third = deck.slides
+        
+        self._write(md_file, '# One', '# Two (edited)', '# Three')
+        rebuilt = deck.reload_source(md_file)
+        
+        assert rebuilt == [deck.slides[1]]
+        assert deck.slides[0] is first
+        assert deck.slides[2] is third
+        assert deck.slides[1] is not second
+        assert deck.slides[1].title == 'Two (edited)'
+        assert deck.slides[1].name == second.name
+    
+    def test_added_and_removed_slides(self, tmp_path):
+        """Structural edits insert and remove slides around unchanged ones."""
+        md_file = tmp_path / 'slides.md'
+        self._write(md_file, '[name: a]\n# A', '[name: b]\n# B', '[name: c]\n# C')
+        deck = SlideDeck()
+        deck.add(title='Python slide', name='py')
+        deck.add_from_file(md_file)
+        deck.add(title='Outro', name='outro')
+        a, c = deck.slides[1], deck.slides[3]
+        
+        self._write(md_file, '[name: a]\n# A', '[name: new]\n# New', '[name: c]\n# C')
+        deck.reload_source(md_file)
+        
+        assert [s.name for s in deck.slides] == ['py', 'a', 'new', 'c', 'outro']
+        assert deck.slides[1] is a
+        assert deck.slides[3] is c
+        
+        self._write(md_file, '[name: c]\n# C')
+        deck.reload_source(md_file)
+        assert [s.name for s in deck.slides] == ['py', 'c', 'outro']
+        assert deck.slides[1] is c
+    
+    def test_respects_insert_position_and_replaced_slides(self, tmp_path):
+        """Slides replaced from Python keep their content on reload."""
+        md_file = tmp_path / 'slides.md'
+        self._write(md_file, '[name: intro]\n# Intro', '[name: chart]\n# Placeholder')
+        deck = SlideDeck()
+        deck.add_from_file(md_file)
+        deck.replace('chart', title='Real Chart')
+        
+        self._write(md_file, '[name: intro]\n# Intro v2', '[name: chart]\n# Placeholder v2')
+        deck.reload_source(md_file)
+        
+        assert deck.slides[0].title == 'Intro v2'
+        assert deck.slides[1].title == 'Real Chart'
+    
+    @pytest.mark.parametrize('lazy', [False, True])
+    def test_auto_names_match_fresh_build(self, tmp_path, lazy):
+        """After structural edits, unnamed slides are named as a fresh build names them."""
+        md_file = tmp_path / 'slides.md'
+        self._write(md_file, '# One', '# Two', '[name: three]\n# Three', '# Four')
+        deck = SlideDeck()
+        deck.add(title='Python slide')
+        deck.add_from_file(md_file, lazy=lazy)
+        deck.add(title='Outro')
+        original = deck.clone()
+        
+        edits = [
+            ('# Zero', '# One', '# Two', '[name: three]\n# Three', '# Four'),
+            ('# Zero', '# One', '# Two a', '# Two b', '[name: three]\n# Three', '# Four'),
+            ('# One', '[name: three]\n# Three', '# Four'),
+        ]
+        for slides in edits:
+            self._write(md_file, *slides)
+            deck.reload_source(md_file)
+            fresh = SlideDeck()
+            fresh.add(title='Python slide')
+            fresh.add_from_file(md_file, lazy=lazy)
+            fresh.add(title='Outro')
+            
+            assert [s.name for s in deck.slides] == [s.name for s in fresh.slides]
+            assert [s.title for s in deck.slides] == [s.title for s in fresh.slides]
+        assert [s.name for s in original.slides] == [
+            'slide_0', 'slide_1', 'slide_2', 'three', 'slide_4', 'slide_5',
+        ]  # Slides shared with a clone are not renamed in place
+    
+    def test_unknown_file_returns_none(self, tmp_path):
+        """Files that are not markdown sources of the deck return None."""
+        other = tmp_path / 'other.md'
+        other.write_text('# Other')
+        
+        assert SlideDeck().reload_source(other) is None
+
+
+class TestLazyLoading:
+    """Test add_from_file(lazy=True)."""
+    
+    SLIDES = [
+        '# One\nFirst',
+        '[name: chart]\n![left](/media/a.jpg)\n# Two\n## Sub\n\n^ Notes',
+        '![left](/media/a.jpg)\n# Left\nL\n\n![right](/media/b.jpg)\n# Right\nR',
+    ]
+    
+    @pytest.fixture(autouse=True)
+    def cache(self):
+        """Fresh parse cache, so parsing can be counted."""
+        from stagdeck.components import ParseCache
+        
+        ParseCache._instance = ParseCache()
+        yield ParseCache._instance
+        ParseCache._instance = None
+    
+    def _write(self, path, *slides):
+        path.write_text('\n\n---\n\n'.join(slides))
+    
+    def test_matches_eager_loading(self, tmp_path):
+        """Lazy slides have the same content as parsed ones."""
+        md_file = tmp_path / 'slides.md'
+        self._write(md_file, *self.SLIDES)
+        eager = SlideDeck().add_from_file(md_file)
+        lazy = SlideDeck().add_from_file(md_file, lazy=True)
+        
+        for a, b in zip(eager.slides, lazy.slides, strict=True):
+            assert (a.name, a.title, a.subtitle, a.content, a.notes) == (b.name, b.title, b.subtitle, b.content, b.notes)
+            assert (a.background_color, a.background_position, a.data) == (b.background_color, b.background_position, b.data)
+            assert a.regions == b.regions
+    
+    def test_slides_are_parsed_on_first_access(self, tmp_path, cache):
+        """Loading, counting steps and unnamed slide names parse nothing."""
+        md_file = tmp_path / 'slides.md'
+        self._write(md_file, *self.SLIDES)
+        deck = SlideDeck().add_from_file(md_file, lazy=True)
+        
+        assert deck.total_slides == 3
+        assert deck.total_steps == 3
+        assert deck.total_duration == 3 * (deck.default_step_duration + deck.default_transition_duration)
+        assert deck.slides[0].name == 'slide_0'
+        assert cache.misses == 0
+        
+        assert deck.slides[1].title == 'Two'
+        assert cache.misses == 1
+        assert deck.get_slide_by_name('chart') is deck.slides[1]
+    
+    def test_page_selection(self, tmp_path):
+        """Pages select chunks as in eager mode."""
+        md_file = tmp_path / 'slides.md'
+        self._write(md_file, '# A', '# B', '# C', '# D')
+        deck = SlideDeck().add_from_file(md_file, pages='2-3', lazy=True)
+        
+        assert [s.title for s in deck.slides] == ['B', 'C']
+    
+    def test_fields_set_before_parsing_are_kept(self, tmp_path):
+        """Assigning a field does not get overwritten by the parsed value."""
+        md_file = tmp_path / 'slides.md'
+        self._write(md_file, '# A\nBody')
+        deck = SlideDeck().add_from_file(md_file, lazy=True)
+        deck.slides[0].title = 'Changed'
+        
+        assert deck.slides[0].title == 'Changed'
+        assert deck.slides[0].content == 'Body'
+    
+    def test_reload_after_file_rewrite(self, tmp_path):
+        """Unparsed slides still resolve after the file changed around them."""
+        md_file = tmp_path / 'slides.md'
+        self._write(md_file, '# One', '# Two', '# Three')
+        deck = SlideDeck().add_from_file(md_file, lazy=True)
+        first, _, third = deck.slides
+        
+        self._write(md_file, '# One', '# Two, now with a much longer title', '# Three')
+        assert deck.reload_source(md_file) == [deck.slides[1]]
+        
+        assert deck.slides[2] is third
+        assert third.title == 'Three'
+        assert first.title == 'One'
+
+    def test_removed_chunk_gives_stale_slide(self, tmp_path):
+        """A chunk deleted before its slide was read warns instead of raising."""
+        md_file = tmp_path / 'slides.md'
+        self._write(md_file, '# One', '# Two', '# Three')
+        deck = SlideDeck().add_from_file(md_file, lazy=True)
+        
+        self._write(md_file, '# One')
+        with pytest.warns(UserWarning, match='changed'):
+            assert deck.slides[2].title == ''
+        assert deck.slides[0].title == 'One'
+        
+        md_file.unlink()
+        with pytest.warns(UserWarning, match='Could not load'):
+            assert deck.slides[1].title == ''
+    
+    def test_index_keeps_no_mapping_or_deck_state(self, tmp_path):
+        """Lazy slides hold offsets only and share no containers with the deck."""
+        md_file = tmp_path / 'slides.md'
+        self._write(md_file, '# One', '# Two')
+        deck = SlideDeck().add_from_file(md_file, lazy=True)
+        slide = deck.slides[1]
+        builder, index = slide.__dict__['_load'].args[:2]
+        
+        assert not hasattr(index, '_data')
+        assert builder.slides is not deck.slides and not builder.slides
+        assert not builder._markdown_sources and not builder.source_files
+        assert slide.title == 'Two'
+
+
+class TestAddFromFiles:
+    """Test parallel add_from_files()."""
+    
+    @pytest.fixture(autouse=True)
+    def cache(self):
+        """Fresh parse cache, so parsing can be counted."""
+        from stagdeck.components import ParseCache
+        
+        ParseCache._instance = ParseCache()
+        yield ParseCache._instance
+        ParseCache._instance = None
+    
+    @pytest.fixture
+    def files(self, tmp_path):
+        intro = tmp_path / 'intro.md'
+        intro.write_text('[name: intro]\n# Intro\n\n---\n\n[name: outro]\n# Outro')
+        middle = tmp_path / 'middle.md'
+        middle.write_text('# Middle 1\n\n---\n\n# Middle 2\n\n---\n\n# Middle 3')
+        extra = tmp_path / 'extra.md'
+        extra.write_text('# Extra')
+        return intro, middle, extra
+    
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_same_result_as_add_from_file(self, files, workers):
+        """Slides, insert positions and source tracking match sequential loading."""
+        intro, middle, extra = files
+        sources = [intro, {'path': middle, 'pages': '1,3', 'after': 'intro'}, {'path': str(extra), 'before': 'outro'}]
+        
+        expected = SlideDeck()
+        for source in sources:
+            options = source if isinstance(source, dict) else {'path': source}
+            expected.add_from_file(**options)
+        deck = SlideDeck().add_from_files(sources, workers=workers)
+        
+        assert [s.title for s in deck.slides] == ['Intro', 'Middle 1', 'Middle 3', 'Extra', 'Outro']
+        assert [s.title for s in deck.slides] == [s.title for s in expected.slides]
+        assert [s.name for s in deck.slides] == [s.name for s in expected.slides]
+        assert deck.source_files == [intro.resolve(), middle.resolve(), extra.resolve()]
+    
+    def test_parsing_happens_in_workers(self, files, cache):
+        """The calling process only assembles slides from parsed results."""
+        deck = SlideDeck().add_from_files(files, workers=2)
+        
+        assert deck.total_slides == 6
+        assert cache.misses == 0
+        assert cache.hits == 6
+    
+    def test_workers_parse_selected_pages_only(self, files, cache):
+        """Chunks outside the selected pages are never parsed."""
+        intro, middle, extra = files
+        deck = SlideDeck().add_from_files([intro, {'path': middle, 'pages': '2'}], workers=2)
+        
+        assert [s.title for s in deck.slides] == ['Intro', 'Outro', 'Middle 2']
+        assert len(cache) == 3
+    
+    def test_no_pool_for_small_decks(self, files, cache, monkeypatch):
+        """By default, a few small files are loaded in this process."""
+        import concurrent.futures
+        
+        monkeypatch.setattr(concurrent.futures, 'ProcessPoolExecutor', None)
+        assert SlideDeck().add_from_files(files).total_slides == 6
+        assert cache.misses == 6
+    
+    def test_pool_for_large_decks_on_main_thread_only(self, files, cache, monkeypatch):
+        """By default, a pool is used for enough markdown, but not from other threads."""
+        import threading
+        import stagdeck.slide_deck as slide_deck
+        from stagdeck.components import ParseCache
+        
+        monkeypatch.setattr(slide_deck, '_POOL_MIN_BYTES', 1)
+        monkeypatch.setattr(slide_deck.os, 'cpu_count', lambda: 2)
+        decks = []
+        thread = threading.Thread(target=lambda: decks.append(SlideDeck().add_from_files(files)))
+        thread.start()
+        thread.join()
+        assert cache.misses == 6
+        
+        ParseCache._instance = fresh = ParseCache()
+        assert SlideDeck().add_from_files(files).total_slides == decks[0].total_slides == 6
+        assert fresh.misses == 0
+    
+    def test_parent_does_not_split_again(self, files, monkeypatch):
+        """Markdown split by the workers is not read and split again."""
+        import stagdeck.slide_deck as slide_deck
+        
+        split = slide_deck._split_markdown_slides
+        calls = []
+        monkeypatch.setattr(slide_deck, '_split_markdown_slides', lambda text: calls.append(1) or split(text))
+        deck = SlideDeck().add_from_files(files, workers=2)
+        
+        assert deck.total_slides == 6
+        assert calls == []  # Workers split in their own processes
+    
+    def test_reload_source_after_bulk_load(self, files):
+        """Hot reload works on files loaded in bulk."""
+        intro, middle, extra = files
+        deck = SlideDeck().add_from_files(files, workers=2)
+        
+        middle.write_text('# Middle 1\n\n---\n\n# Middle 2 edited\n\n---\n\n# Middle 3')
+        assert deck.reload_source(middle) == [deck.slides[3]]
+        assert deck.slides[3].title == 'Middle 2 edited'
+    
+    def test_missing_file_raises(self, files, tmp_path):
+        """Missing files raise like add_from_file()."""
+        with pytest.raises(FileNotFoundError):
+            SlideDeck().add_from_files([*files, tmp_path / 'missing.md'], workers=2)
+
+
+class TestViewerIncrementalReload:
+    """Test DeckViewer.reload() with a changed path (no UI attached)."""
+    
+    async def test_current_slide_untouched_keeps_view(self, tmp_path):
+        """Editing another slide does not rebuild the current view."""
+        from stagdeck import DeckViewer
+        
+        md_file = tmp_path / 'slides.md'
+        md_file.write_text('# One\n\n---\n\n# Two')
+        deck = SlideDeck()
+        deck.add_from_file(md_file)
+        viewer = DeckViewer(deck, current_index=1)
+        current = viewer.current_slide
+        rebuilds = []
+        
+        async def fake_update_view():
+            rebuilds.append(viewer.current_index)
+        viewer._update_view = fake_update_view
+        
+        md_file.write_text('# Zero\n\n---\n\n# One edited\n\n---\n\n# Two')
+        await viewer.reload(md_file)
+        
+        assert rebuilds == []
+        assert viewer.current_slide.data is current.data  # Only renamed to its new position
+        assert viewer.current_slide.name == 'slide_2'
+        assert viewer.current_index == 2
+        
+        md_file.write_text('# Zero\n\n---\n\n# One edited\n\n---\n\n# Two edited')
+        await viewer.reload(md_file)
+        
+        assert rebuilds == [2]
+        assert viewer.current_slide.title == 'Two edited'
@@ -0,0 +1,110 @@
+"""Tests for the slide build profiler."""
+
+import io
+import json
+import time
+
+import httpx
+import pytest
+from nicegui import app
+from nicegui.testing import User
+
+from stagdeck import App, SlideDeck
+from stagdeck.profiler import BuildProfiler, main, setup_profiler_endpoint
+
+
+@pytest.fixture
+def profiler():
+    """Fresh shared profiler, disabled again after the test."""
+    BuildProfiler._instance = BuildProfiler()
+    yield BuildProfiler._instance
+    BuildProfiler._instance.disable()
+    BuildProfiler._instance = None
+
+
+class TestBuildProfiler:
+    """Test recording and reporting."""
+    
+    def test_disabled_profiler_records_nothing(self):
+        """measure() is a no-op until enabled."""
+        profiler = BuildProfiler()
+        with profiler.measure(0, 'intro', 0):
+            pass
+        
+        assert profiler.report() == []
+    
+    def test_report_sorted_by_column(self):
+        """Rows are aggregated per slide step and sortable."""
+        profiler = BuildProfiler()
+        profiler.enabled = True
+        with profiler.measure(0, 'fast', 0):
+            pass
+        for _ in range(2):
+            with profiler.measure(1, 'slow', 0):
+                time.sleep(0.01)
+        
+        rows = profiler.report(sort_by='max')
+        assert [row['name'] for row in rows] == ['slow', 'fast']
+        assert rows[0]['builds'] == 2
+        assert rows[0]['mean'] == pytest.approx(rows[0]['total'] / 2)
+        assert [row['slide'] for row in profiler.report(sort_by='slide')] == [0, 1]
+        with pytest.raises(ValueError):
+            profiler.report(sort_by='unknown')
+    
+    def test_loop_lag_attributed_to_overlapping_build(self):
+        """A stall reported right after a build is charged to that build."""
+        profiler = BuildProfiler()
+        profiler.enabled = True
+        with profiler.measure(0, 'old', 0):
+            pass
+        time.sleep(0.05)
+        with profiler.measure(1, 'blocking', 0):
+            time.sleep(0.02)
+        profiler._on_lag(0.03)
+        
+        lags = {row['name']: row['lag'] for row in profiler.report()}
+        assert lags == {'old': 0.0, 'blocking': 0.03}
+
+
+async def test_viewer_builds_are_profiled(user: User, profiler: BuildProfiler) -> None:
+    """Slide builds in the viewer are recorded with their element counts."""
+    def create_deck():
+        deck = SlideDeck()
+        deck.add(title='Intro', content='Hello')
+        deck.add(title='Details', content='- a\n- b\n- c')
+        return deck
+    
+    profiler.enable()
+    App.create_page(create_deck, path='/')
+    await user.open('/')
+    user.find('arrow_forward').click()
+    await user.should_see('2 / 2')
+    
+    rows = profiler.report(sort_by='slide')
+    assert [(row['slide'], row['step'], row['builds']) for row in rows] == [(0, 0, 1), (1, 0, 1)]
+    assert all(row['elements'] > 0 for row in rows)
+
+
+async def test_profile_endpoint_and_cli(user: User, profiler: BuildProfiler, monkeypatch, capsys) -> None:
+    """The report is served as JSON/text and printed by the CLI."""
+    setup_profiler_endpoint()
+    with profiler.measure(3, 'chart', 1):
+        pass
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://test') as client:
+        rows = (await client.get('/stagdeck/profile?sort=max')).json()
+        assert [(row['slide'], row['name'], row['step']) for row in rows] == [(3, 'chart', 1)]
+        text = (await client.get('/stagdeck/profile?format=text')).text
+        assert 'chart' in text
+        assert (await client.get('/stagdeck/profile?sort=bogus')).status_code == 400
+    
+    requested = []
+    
+    def fake_urlopen(url):
+        requested.append(url)
+        return io.BytesIO(json.dumps(rows).encode())
+    
+    monkeypatch.setattr('urllib.request.urlopen', fake_urlopen)
+    assert main(['http://example:8080', '--sort', 'cpu', '--limit', '5']) == 0
+    assert requested == ['http://example:8080/stagdeck/profile?sort=cpu&limit=5']
+    assert 'chart' in capsys.readouterr().out
@@ -0,0 +1,265 @@
+"""Tests for DeckRegistry and its built-deck cache."""
+
+import asyncio
+import os
+import threading
+import time
+import warnings
+from unittest.mock import Mock
+
+import pytest
+
+from stagdeck import DeckRegistry, SlideDeck
+from stagdeck.file_watcher import FileWatcher
+from stagdeck.registry import _CachedDeck, build_deck
+from stagdeck.theme import get_theme_loader
+
+
+def _bump_mtime(path):
+    """Move a file's mtime forward so the change is visible on coarse filesystems."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestDeckCache:
+    """Test caching and invalidation of built decks."""
+    
+    def test_factory_runs_once(self):
+        """Repeated get() calls reuse the cached build."""
+        calls = []
+        
+        def factory():
+            calls.append(1)
+            deck = SlideDeck(title='Cached')
+            deck.add(title='One')
+            return deck
+        
+        registry = DeckRegistry().register('talk', factory)
+        first = registry.get('talk')
+        second = registry.get('talk')
+        
+        assert len(calls) == 1
+        assert first is not second
+        assert first.slides[0] is second.slides[0]
+    
+    def test_clones_are_independent(self):
+        """Modifying a returned deck does not leak into the cache."""
+        registry = DeckRegistry().register('talk', lambda: SlideDeck().add(title='One'))
+        deck = registry.get('talk')
+        deck.add(title='Two')
+        
+        assert registry.get('talk').total_slides == 1
+    
+    def test_source_change_invalidates(self, tmp_path):
+        """Editing a markdown source rebuilds the deck."""
+        md_file = tmp_path / 'slides.md'
+        md_file.write_text('# First')
+        
+        def factory():
+            deck = SlideDeck()
+            deck.add_from_file(md_file)
+            return deck
+        
+        registry = DeckRegistry().register('talk', factory)
+        assert registry.get('talk').slides[0].title == 'First'
+        
+        md_file.write_text('# Second')
+        _bump_mtime(md_file)
+        
+        assert registry.get('talk').slides[0].title == 'Second'
+    
+    def test_media_change_invalidates(self, tmp_path):
+        """Adding a media file rebuilds the deck."""
+        calls = []
+        
+        def factory():
+            calls.append(1)
+            return SlideDeck().add_media_folder(tmp_path)
+        
+        registry = DeckRegistry().register('talk', factory)
+        registry.get('talk')
+        registry.get('talk')
+        (tmp_path / 'logo.png').write_bytes(b'png')
+        registry.get('talk')
+        
+        assert len(calls) == 2
+    
+    def test_theme_change_invalidates(self, tmp_path):
+        """Editing a theme file used by the deck rebuilds it."""
+        theme_file = tmp_path / 'custom.json'
+        theme_file.write_text('{"name": "custom"}')
+        loader = get_theme_loader()
+        loader.add_search_path('registrytest', tmp_path)
+        calls = []
+        
+        def factory():
+            calls.append(1)
+            return SlideDeck().use_theme('registrytest:custom.json')
+        
+        try:
+            registry = DeckRegistry().register('talk', factory)
+            registry.get('talk')
+            registry.get('talk')
+            theme_file.write_text('{"name": "changed"}')
+            _bump_mtime(theme_file)
+            registry.get('talk')
+        finally:
+            loader.remove_search_path('registrytest')
+        
+        assert len(calls) == 2
+    
+    async def test_watcher_invalidates_without_stat(self, tmp_path, monkeypatch):
+        """Watched decks are served without checking files and dropped on change."""
+        md_file = tmp_path / 'slides.md'
+        md_file.write_text('# First')
+        registry = DeckRegistry().register('talk', lambda: SlideDeck().add_from_file(md_file))
+        registry.watch_dependencies(FileWatcher(check_interval=0.05, backend='polling', debounce=0))
+        
+        try:
+            assert (await registry.get_async('talk')).slides[0].title == 'First'
+            monkeypatch.setattr(_CachedDeck, 'is_current', Mock(side_effect=AssertionError('stat')))
+            assert registry._cached('talk') is not None
+            monkeypatch.undo()
+            
+            md_file.write_text('# Second')
+            _bump_mtime(md_file)
+            await asyncio.sleep(0.2)
+            
+            assert registry.cached_names == []
+            assert (await registry.get_async('talk')).slides[0].title == 'Second'
+        finally:
+            registry.stop_watching()
+    
+    async def test_theme_recording_is_per_build(self, tmp_path):
+        """Concurrent builds only record the theme files they read themselves."""
+        for name in ('a', 'b'):
+            (tmp_path / f'{name}.json').write_text(f'{{"name": "{name}"}}')
+        loader = get_theme_loader()
+        loader.add_search_path('registrytest', tmp_path)
+        started = threading.Barrier(2)
+        
+        def factory(name):
+            def build():
+                started.wait(timeout=5)
+                return SlideDeck().use_theme(f'registrytest:{name}.json')
+            return build
+        
+        try:
+            registry = DeckRegistry().register('a', factory('a')).register('b', factory('b'))
+            await asyncio.gather(registry.get_async('a'), registry.get_async('b'))
+        finally:
+            loader.remove_search_path('registrytest')
+        
+        theme_files = {name: {p.name for p in registry._cache[name].files} for name in ('a', 'b')}
+        assert theme_files == {'a': {'a.json'}, 'b': {'b.json'}}
+    
+    def test_lru_eviction_by_memory(self):
+        """The least recently used deck is dropped when the budget is exceeded."""
+        def factory():
+            deck = SlideDeck()
+            for i in range(20):
+                deck.add(title=f'Slide {i}', content='x' * 1000)
+            return deck
+        
+        registry = DeckRegistry().register('a', factory).register('b', factory)
+        registry.get('a')
+        registry.max_cache_bytes = registry.cache_size + registry.cache_size // 2
+        registry.get('b')
+        
+        assert registry.cached_names == ['b']
+    
+    def test_oversized_deck_is_not_cached(self):
+        """A deck larger than the whole budget is built but not cached."""
+        registry = DeckRegistry(max_cache_bytes=1).register('talk', lambda: SlideDeck().add(title='One'))
+        
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            assert registry.get('talk').total_slides == 1
+        
+        assert registry.cached_names == []
+        assert any('exceeds' in str(w.message) for w in caught)
+    
+    async def test_build_all(self):
+        """Background build caches every deck and skips failing ones."""
+        def broken():
+            raise RuntimeError('boom')
+        
+        registry = DeckRegistry()
+        registry.register('a', lambda: SlideDeck().add(title='A'))
+        registry.register('b', broken)
+        
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            built = await registry.start_background_build()
+        
+        assert built == 1
+        assert registry.cached_names == ['a']
+        assert any("'b'" in str(w.message) for w in caught)
+
+
+class TestAsyncFactories:
+    """Test building decks off the event loop."""
+    
+    async def test_sync_factory_runs_in_worker_thread(self):
+        """get_async() never runs a sync factory on the loop thread."""
+        loop_thread = threading.get_ident()
+        threads = []
+        
+        def factory():
+            threads.append(threading.get_ident())
+            return SlideDeck().add(title='One')
+        
+        registry = DeckRegistry().register('talk', factory)
+        deck = await registry.get_async('talk')
+        
+        assert deck.total_slides == 1
+        assert threads and threads[0] != loop_thread
+    
+    async def test_async_factory_is_awaited(self):
+        """Async factories are supported and cached like sync ones."""
+        calls = []
+        
+        async def factory():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return SlideDeck().add(title='Async')
+        
+        registry = DeckRegistry().register('talk', factory)
+        first = await registry.get_async('talk')
+        second = await registry.get_async('talk')
+        
+        assert first.slides[0].title == 'Async'
+        assert first is not second
+        assert len(calls) == 1
+    
+    async def test_concurrent_requests_share_one_build(self):
+        """Simultaneous requests for an uncached deck build it once."""
+        calls = []
+        
+        def factory():
+            calls.append(1)
+            time.sleep(0.05)
+            return SlideDeck().add(title='One')
+        
+        registry = DeckRegistry().register('talk', factory)
+        decks = await asyncio.gather(*(registry.get_async('talk') for _ in range(5)))
+        
+        assert len(calls) == 1
+        assert len({id(deck) for deck in decks}) == 5
+    
+    def test_sync_get_rejects_async_factory(self):
+        """get() cannot run an async factory."""
+        async def factory():
+            return SlideDeck()
+        
+        registry = DeckRegistry().register('talk', factory)
+        with pytest.raises(TypeError):
+            registry.get('talk')
+    
+    async def test_build_deck_without_cache(self):
+        """build_deck() calls sync factories in a thread and awaits async ones."""
+        async def async_factory():
+            return SlideDeck(title='A')
+        
+        assert (await build_deck(lambda: SlideDeck(title='S'))).title == 'S'
+        assert (await build_deck(async_factory)).title == 'A'
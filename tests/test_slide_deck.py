@@ -4,6 +4,7 @@ import pytest
 from pathlib import Path
 import tempfile
 import os
+import warnings
 
 from stagdeck import SlideDeck
 
@@ -148,3 +149,146 @@ class TestSlideDeckMarkdownAdd:
         )
         
         assert deck.slides[0].background_color == '#fff'
+    
+    def test_repeat_deck_build_skips_parsing(self, monkeypatch):
+        """A second deck built from the same markdown is served from the parse cache."""
+        from stagdeck.components import ParseCache
+        
+        cache = ParseCache()
+        monkeypatch.setattr(ParseCache, '_instance', cache)
+        
+        def build():
+            deck = SlideDeck()
+            deck.add('[.title:color: red]\n# One')
+            deck.add('![left](a.jpg)\n# A\n![right](b.jpg)\n# B')
+            return deck
+        
+        first, second = build(), build()
+        
+        assert (cache.hits, cache.misses) == (2, 2)
+        assert second.slides[0].data['_style_overrides'] == {'title': {'color': 'red'}}
+        assert second.slides[0].data['_style_overrides'] is not first.slides[0].data['_style_overrides']
+        assert [r.title for r in second.slides[1].regions] == ['A', 'B']
+
+    def test_regions_are_a_list(self):
+        """Regions of parsed and default slides can be extended in place."""
+        from stagdeck.slide import SlideRegion
+        
+        deck = SlideDeck()
+        deck.add('![left](a.jpg)\n# A\n![right](b.jpg)\n# B')
+        deck.add(title='Plain')
+        for slide in deck.slides:
+            slide.regions.append(SlideRegion(title='Extra'))
+        
+        assert [r.title for r in deck.slides[0].regions] == ['A', 'B', 'Extra']
+        assert deck.slides[1].regions == [SlideRegion(title='Extra')]
+    
+    def test_slides_accept_extra_attributes(self):
+        """Slides and regions keep an instance dict for caller data."""
+        from stagdeck.slide import SlideRegion
+        
+        deck = SlideDeck()
+        deck.add('# One')
+        slide = deck.slides[0]
+        slide.extra = 1
+        region = SlideRegion(title='A')
+        region.extra = 2
+        
+        assert (slide.extra, region.extra) == (1, 2)
+
+
+class TestSlideNameIndex:
+    """Test name lookups through the slide list's name index."""
+    
+    def _deck(self, count: int = 5) -> SlideDeck:
+        deck = SlideDeck()
+        for i in range(count):
+            deck.add(title=f'Slide {i}', name=f's{i}')
+        return deck
+    
+    def test_lookup_follows_mutations(self):
+        """The index is current after insert, replace, delete and reassignment."""
+        deck = self._deck()
+        assert deck.get_slide_index('s3') == 3
+        
+        deck.insert(title='New', name='new', before='s1')
+        assert deck.get_slide_index('new') == 1
+        assert deck.get_slide_index('s3') == 4
+        
+        deck.replace('s0', title='Replaced')
+        assert deck.get_slide_by_name('s0').title == 'Replaced'
+        
+        del deck.slides[0]
+        assert deck.get_slide_index('s0') is None
+        assert deck.get_slide_index('new') == 0
+        
+        deck.slides = list(reversed(deck.slides))
+        assert deck.get_slide_index('new') == len(deck.slides) - 1
+        
+        deck.slides[0].name = 'renamed'
+        assert deck.get_slide_index('renamed') is None
+        deck.slides.reindex()
+        assert deck.get_slide_index('renamed') == 0
+    
+    def test_lookups_do_not_scan(self, monkeypatch):
+        """The index is built once and then kept up to date by every change."""
+        from stagdeck.slide_deck import SlideList
+        
+        deck = self._deck(100)
+        builds = []
+        original = SlideList.reindex
+        monkeypatch.setattr(SlideList, 'reindex', lambda self: builds.append(1) or original(self))
+        
+        for i in range(100):
+            assert deck.get_slide_index(f's{i}') == i
+        assert deck.get_slide_index('unknown') is None
+        assert builds == [1]
+        
+        deck.add(title='More', name='more')
+        deck.insert(title='First', name='first', before='s0')
+        deck.slides[50:52] = [deck.slides[51], deck.slides[50]]
+        del deck.slides[10]
+        deck.slides.pop()
+        
+        assert deck.get_slide_index('more') is None
+        assert deck.get_slide_index('first') == 0
+        assert (deck.get_slide_index('s49'), deck.get_slide_index('s50')) == (50, 49)
+        assert deck.get_slide_index('s10') == 10
+        assert deck.get_slide_index('s9') is None
+        assert builds == [1]
+        assert [deck.get_slide_index(slide.name) for slide in deck.slides] == list(range(len(deck.slides)))
+    
+    def test_removing_first_duplicate(self):
+        """Lookups move on to the next slide of a name when the first is removed."""
+        deck = self._deck(3)
+        deck.get_slide_index('s0')
+        with pytest.warns(UserWarning, match="Duplicate slide name 's0'"):
+            deck.add(title='Copy', name='s0')
+        
+        del deck.slides[0]
+        assert deck.get_slide_index('s0') == 2
+        assert deck.duplicate_names == []
+    
+    def test_duplicate_names_warn_once(self):
+        """Duplicate names are reported; lookups use the first slide."""
+        deck = self._deck(3)
+        deck.add(title='Copy', name='s1')
+        
+        with pytest.warns(UserWarning, match="Duplicate slide name 's1'"):
+            assert deck.get_slide_index('s1') == 1
+        assert deck.duplicate_names == ['s1']
+        
+        deck.add(title='Other', name='s9')
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            assert deck.get_slide_index('s9') == 4
+    
+    def test_clone_has_own_index(self):
+        """Changing a clone's slides does not affect the original's lookups."""
+        deck = self._deck()
+        clone = deck.clone()
+        clone.insert(title='Only in clone', name='extra', after='s0')
+        
+        assert clone.get_slide_index('s1') == 2
+        assert deck.get_slide_index('s1') == 1
+        assert deck.get_slide_index('extra') is None
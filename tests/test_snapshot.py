@@ -0,0 +1,146 @@
+"""Tests for compiled deck snapshots."""
+
+import pytest
+
+from stagdeck import SlideDeck
+from stagdeck.components.markdown_parser import ParseCache
+from stagdeck.snapshot import (
+    SNAPSHOT_MAGIC,
+    compile_snapshot,
+    decode_snapshot,
+    encode_snapshot,
+    load_snapshot,
+    main,
+    snapshot_path,
+)
+
+
+SOURCE = """# Intro
+Welcome
+
+---
+
+# Columns
+
+## Left
+One
+
+## Right
+Two
+
+^ Say hello
+
+---
+
+# Outro
+Bye
+"""
+
+
+@pytest.fixture
+def cache():
+    """Fresh shared parse cache."""
+    ParseCache._instance = ParseCache()
+    yield ParseCache._instance
+    ParseCache._instance = None
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'talk.md'
+    path.write_text(SOURCE, encoding='utf-8')
+    return path
+
+
+def _build(path):
+    return SlideDeck(title='Talk').add_from_file(path)
+
+
+class TestSnapshot:
+    """Test compiling and loading snapshots."""
+    
+    def test_snapshot_path(self, source):
+        """Snapshots live next to their source."""
+        assert snapshot_path(source) == source.parent / 'talk.md.snapshot'
+    
+    def test_roundtrip(self):
+        """Encoded entries decode unchanged."""
+        entries = {'abc': (False, {'title': 'T', 'content': '', 'notes': ''})}
+        data = encode_snapshot(entries)
+        assert data.startswith(SNAPSHOT_MAGIC)
+        assert decode_snapshot(data) == entries
+    
+    def test_compiled_deck_skips_parsing(self, source, cache):
+        """A fresh process builds the deck from the snapshot without parsing."""
+        expected = _build(source)
+        compile_snapshot(source)
+        
+        ParseCache._instance = fresh = ParseCache()
+        deck = _build(source)
+        assert fresh.misses == 0
+        assert fresh.hits == 3
+        assert [s.title for s in deck.slides] == [s.title for s in expected.slides]
+        assert deck.slides[1].notes == expected.slides[1].notes == 'Say hello'
+    
+    def test_changed_slide_is_parsed(self, source, cache):
+        """Slides edited after compiling fall back to parsing."""
+        compile_snapshot(source)
+        source.write_text(SOURCE.replace('# Outro', '# Goodbye'), encoding='utf-8')
+        
+        ParseCache._instance = fresh = ParseCache()
+        deck = _build(source)
+        assert fresh.misses == 1
+        assert deck.slides[-1].title == 'Goodbye'
+    
+    @pytest.mark.parametrize('data', [b'', b'garbage', SNAPSHOT_MAGIC + b'\x00\x01\x00\x01broken'])
+    def test_invalid_snapshot_is_ignored(self, source, cache, data):
+        """Corrupted snapshots are ignored and the deck is parsed."""
+        snapshot_path(source).write_bytes(data)
+        assert load_snapshot(source) == 0
+        deck = _build(source)
+        assert cache.misses == 3
+        assert len(deck.slides) == 3
+    
+    def test_other_parser_version_is_ignored(self, source, cache, monkeypatch):
+        """Snapshots of another parser version are not used."""
+        import stagdeck.snapshot as snapshot
+        
+        monkeypatch.setattr(snapshot, 'PARSER_VERSION', 999)
+        compile_snapshot(source)
+        monkeypatch.undo()
+        
+        ParseCache._instance = fresh = ParseCache()
+        assert load_snapshot(source) == 0
+        _build(source)
+        assert fresh.misses == 3
+    
+    def test_only_requested_slides_are_inserted(self, source, cache):
+        """Loading for a few slides does not fill the cache with the others."""
+        from stagdeck.slide_deck import _split_markdown_slides
+        
+        compile_snapshot(source)
+        digests = [ParseCache.digest(md) for md in _split_markdown_slides(SOURCE)]
+        
+        ParseCache._instance = fresh = ParseCache()
+        assert load_snapshot(source, digests=digests[1:2]) == 1
+        assert fresh.peek(digests[1]) is not None
+        assert fresh.peek(digests[0]) is None and fresh.peek(digests[2]) is None
+        assert load_snapshot(source, digests=digests[1:2]) == 0
+        assert load_snapshot(source) == 2
+    
+    def test_cached_deck_skips_snapshot(self, source, cache, monkeypatch):
+        """The snapshot is not touched when every slide is cached already."""
+        import stagdeck.snapshot as snapshot
+        
+        compile_snapshot(source)
+        _build(source)
+        monkeypatch.setattr(snapshot, 'snapshot_path', lambda source: pytest.fail('snapshot read'))
+        
+        assert len(_build(source).slides) == 3
+    
+    def test_cli(self, source, cache, capsys):
+        """The command line compiles every given file."""
+        assert main([str(source)]) == 0
+        assert snapshot_path(source).exists()
+        assert 'talk.md.snapshot' in capsys.readouterr().out
+        assert main([str(source.parent / 'missing.md')]) == 1
@@ -0,0 +1,95 @@
+"""Tests for the cumulative deck timeline."""
+
+import pytest
+
+from stagdeck import SlideDeck
+from stagdeck.timeline import Timeline
+
+
+@pytest.fixture
+def deck():
+    """Three slides: 2 steps (3 s, default), 1 step, 3 steps (1 s, 2 s, default)."""
+    deck = SlideDeck(default_step_duration=5.0, default_transition_duration=0.5)
+    deck.add(title='A', steps=2, step_durations=[3.0])
+    deck.add(title='B')
+    deck.add(title='C', steps=3, step_durations=[1.0, 2.0], transition_duration=0.0)
+    return deck
+
+
+class TestTimeline:
+    """Test prefix-sum lookups."""
+    
+    def test_totals(self, deck):
+        """Totals match the per-slide sums."""
+        assert deck.total_steps == 6
+        assert deck.total_duration == 0.5 + 3 + 5 + 0.5 + 5 + 0 + 1 + 2 + 5
+    
+    def test_duration_at(self, deck):
+        """Elapsed time at each step starts after the slide's transition."""
+        assert deck.get_duration_at(0, 0) == 0.5
+        assert deck.get_duration_at(0, 1) == 3.5
+        assert deck.get_duration_at(1, 0) == 9.0
+        assert deck.get_duration_at(2, 2) == 17.0
+        assert deck.get_duration_at(2, 5) == 22.0 + 5 + 5  # Beyond the slide's steps
+        assert deck.get_duration_at(-1) == 0.0
+        assert deck.get_duration_at(10) == deck.total_duration
+    
+    def test_position_at(self, deck):
+        """Elapsed times map back to the step shown at that time."""
+        assert deck.get_position_at(0.0) == (0, 0)
+        assert deck.get_position_at(3.49) == (0, 0)
+        assert deck.get_position_at(3.5) == (0, 1)
+        assert deck.get_position_at(8.6) == (1, 0)  # During B's transition
+        assert deck.get_position_at(14.5) == (2, 0)
+        assert deck.get_position_at(15.0) == (2, 1)
+        assert deck.get_position_at(100.0) == (2, 2)
+        assert deck.get_position_at(-1.0) == (0, 0)
+        for index, slide in enumerate(deck.slides):
+            for step in range(slide.steps):
+                assert deck.get_position_at(deck.get_duration_at(index, step)) == (index, step)
+    
+    def test_empty_deck(self):
+        """An empty deck has an empty timeline."""
+        timeline = Timeline([], 5.0)
+        assert (timeline.total_steps, timeline.total_duration) == (0, 0.0)
+        assert timeline.position_at(3.0) == (0, 0)
+    
+    def test_slide_edited_in_place(self, deck):
+        """Assigning a slide's steps or durations rebuilds the cached timeline."""
+        before = deck.get_duration_at(2)
+        
+        deck.slides[0].steps = 5
+        assert deck.get_duration_at(2) == before + 3 * deck.default_step_duration
+        
+        deck.slides[0].transition_duration = 2.0
+        assert deck.get_duration_at(2) == before + 3 * deck.default_step_duration + 1.5
+        
+        before = deck.get_duration_at(2)
+        deck.slides[1].step_durations = [10.0]
+        assert deck.get_duration_at(2) == before + 5.0
+        
+        timeline = deck.timeline
+        deck.slides[1].step_durations[0] = 1.0
+        assert deck.timeline is timeline  # In-place list edits need invalidate_timeline()
+        deck.invalidate_timeline()
+        assert deck.timeline is not timeline
+    
+    def test_cached_until_deck_changes(self, deck):
+        """The timeline is reused until slides or the default duration change."""
+        timeline = deck.timeline
+        assert deck.timeline is timeline
+        
+        deck.add(title='D')
+        assert deck.timeline is not timeline
+        assert deck.total_steps == 7
+        
+        timeline = deck.timeline
+        deck.default_step_duration = 1.0
+        assert deck.timeline is not timeline
+        assert deck.get_duration_at(1, 0) == 0.5 + 3 + 1 + 0.5
+        
+        deck.slides[1].steps = 4
+        assert deck.total_steps == 10
+        
+        deck.splice(0, [], delete=1)
+        assert deck.get_duration_at(0, 0) == 0.5
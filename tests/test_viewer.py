@@ -168,3 +168,314 @@ async def test_url_query_params_slide_index(user: User) -> None:
     await user.open('/?slide=2')
     await user.should_see('Slide Two')
     await user.should_see('3 / 3')
+
+
+async def test_hot_reload_is_pushed_without_timers(user: User, tmp_path) -> None:
+    """Test that file changes reach the client without a polling ui.timer."""
+    from nicegui import ui
+    from stagdeck import DeckViewer
+    
+    md_file = tmp_path / 'slides.md'
+    md_file.write_text('# Original Title')
+    
+    def create_deck():
+        deck = SlideDeck(title='Test Deck')
+        deck.add_from_file(md_file)
+        return deck
+    
+    viewers = []
+    
+    @ui.page('/')
+    async def page():
+        viewer = DeckViewer(deck=create_deck(), deck_factory=create_deck)
+        viewer.enable_hot_reload()
+        viewers.append(viewer)
+        await viewer.build()
+    
+    await user.open('/')
+    await user.should_see('Original Title')
+    assert not [e for e in user.client.layout.descendants() if isinstance(e, ui.timer)]
+    
+    md_file.write_text('# Edited Title')
+    await user.should_see('Edited Title', retries=50)
+    
+    viewers[0].release()
+
+
+async def test_hot_reload_released_on_client_delete(user: User, tmp_path) -> None:
+    """Test that deleting the client stops the watcher and drops the viewer."""
+    import asyncio
+    from nicegui import ui
+    from stagdeck import DeckViewer
+    
+    md_file = tmp_path / 'slides.md'
+    md_file.write_text('# Title')
+    viewers = []
+    
+    @ui.page('/')
+    async def page():
+        deck = SlideDeck()
+        deck.add_from_file(md_file)
+        viewer = DeckViewer(deck=deck)
+        viewer.enable_hot_reload()
+        viewers.append(viewer)
+        await viewer.build()
+    
+    await user.open('/')
+    await user.should_see('Title')
+    viewer = viewers[0]
+    watcher = viewer._file_watcher
+    watch_task = watcher._task
+    
+    user.client.delete()
+    await asyncio.sleep(0)
+    
+    assert viewer._file_watcher is None
+    assert viewer._client is None
+    assert not watcher.is_running  # The last viewer stops the shared watcher
+    assert watch_task.done()
+
+
+async def test_hot_reload_shares_one_watcher(user: User, tmp_path) -> None:
+    """Test that all viewers use the process-wide watcher and only see their own files."""
+    from nicegui import ui
+    from stagdeck import DeckViewer
+    from stagdeck.file_watcher import FileWatcher
+    
+    files = {name: tmp_path / f'{name}.md' for name in ('a', 'b')}
+    for name, path in files.items():
+        path.write_text(f'# Deck {name}')
+    viewers = {}
+    
+    @ui.page('/{name}')
+    async def page(name: str):
+        deck = SlideDeck()
+        deck.add_from_file(files[name])
+        viewer = DeckViewer(deck=deck)
+        viewer.enable_hot_reload()
+        viewers[name] = viewer
+        await viewer.build()
+    
+    await user.open('/a')
+    await user.open('/b')
+    watcher = FileWatcher.get_instance()
+    assert viewers['a']._file_watcher is viewers['b']._file_watcher is watcher
+    
+    changed = []
+    viewers['a'].notify_file_changed = changed.append
+    viewers['b']._on_watched_change(files['b'].resolve())
+    viewers['a']._on_watched_change(files['b'].resolve())
+    assert changed == []
+    
+    viewers['a'].release()
+    assert watcher.is_running
+    assert files['a'].resolve() not in watcher._files  # Unwatched with its last viewer
+    assert files['b'].resolve() in watcher._files
+    viewers['b'].release()
+    assert not watcher.is_running
+
+
+async def test_reload_clears_render_caches(user: User, tmp_path) -> None:
+    """Test that a changed deck drops pre-rendered thumbnails and audience images."""
+    from nicegui import ui
+    from stagdeck import BroadcastSession, DeckViewer, RenderCache
+    
+    md_file = tmp_path / 'slides.md'
+    md_file.write_text('# One\n\n---\n\n# Two')
+    thumbnails, audience = RenderCache(), RenderCache()
+    viewers = []
+    
+    @ui.page('/')
+    async def page():
+        deck = SlideDeck()
+        deck.add_from_file(md_file)
+        viewer = DeckViewer(deck=deck, thumbnails=thumbnails)
+        viewer.present_to(BroadcastSession('reload-test'), cache=audience)
+        viewers.append(viewer)
+        await viewer.build()
+    
+    await user.open('/')
+    for cache in (thumbnails, audience):
+        cache.put(1, 0, 320, 180, b'old')
+    
+    await viewers[0].reload(md_file)  # Unchanged file
+    assert len(thumbnails) == len(audience) == 1
+    
+    md_file.write_text('# One\n\n---\n\n# Two, edited')
+    await viewers[0].reload(md_file)
+    assert len(thumbnails) == len(audience) == 0
+    assert thumbnails.generation == audience.generation == 1
+
+
+def test_upcoming_media_urls() -> None:
+    """Test that preload URLs of the next slides match what will be built."""
+    from stagdeck import DeckViewer
+    from stagdeck.slide import Slide, SlideRegion
+    
+    deck = SlideDeck()
+    deck.slides = [
+        Slide(name='current', background_color='url(/media/current.jpg)'),
+        Slide(name='next', background_color='url(/media/next.jpg)', background_modifiers='blur:8'),
+        Slide(name='regions', regions=[
+            SlideRegion(image='/media/intro.mp4'),
+            SlideRegion(image='#1a1a2e'),
+            SlideRegion(image='/media/next.jpg', modifiers='blur:8'),
+        ]),
+        Slide(name='far', background_color='url(/media/far.jpg)'),
+    ]
+    
+    viewer = DeckViewer(deck=deck, preload_slides=2)
+    
+    assert viewer.get_upcoming_media() == [
+        ('image', '/stagdeck/blur?path=/media/next.jpg&radius=8'),
+        ('video', '/media/intro.mp4'),
+    ]
+    assert viewer.get_upcoming_media(count=3)[-1] == ('image', '/media/far.jpg')
+    viewer.current_index = 3
+    assert viewer.get_upcoming_media() == []
+
+
+def test_default_blur_preload_matches_render() -> None:
+    """Test that a plain 'blur' preloads the URL the background requests."""
+    from stagdeck.components.content_elements import MediaView
+    
+    view = MediaView.from_string('url(/media/bg.jpg)', 'blur')
+    url = view.get_preload_url()
+    
+    assert url == '/stagdeck/blur?path=/media/bg.jpg&radius=4'
+    assert f'url({url})' in view.get_background_css(theme_blur_default=4)
+    assert f'url({url})' in view.get_background_css()
+
+
+async def test_rapid_navigation_builds_only_final_slide(user: User) -> None:
+    """Test that a burst of navigation builds only the final target slide."""
+    import asyncio
+    from nicegui import ui
+    from stagdeck import DeckViewer
+    
+    viewers = []
+    
+    @ui.page('/')
+    async def page():
+        deck = SlideDeck()
+        for i in range(10):
+            deck.add(title=f'Slide {i}')
+        viewer = DeckViewer(deck=deck)
+        viewers.append(viewer)
+        await viewer.build()
+    
+    await user.open('/')
+    await user.should_see('Slide 0')
+    viewer = viewers[0]
+    built = []
+    original = viewer._build_slide_content
+    
+    async def counting_build():
+        built.append(viewer.current_index)
+        await original()
+    viewer._build_slide_content = counting_build
+    
+    # Simulates key repeat: each keydown is handled in its own task
+    await asyncio.gather(*[viewer.next_slide() for _ in range(6)])
+    
+    assert built == [6]
+    await user.should_see('Slide 6')
+    await user.should_see('7 / 10')
+
+
+async def test_navigation_sends_single_update_message(user: User) -> None:
+    """Test that one navigation is one client message carrying the URL state."""
+    import asyncio
+    from nicegui import ui
+    from stagdeck import DeckViewer
+    
+    viewers = []
+    
+    @ui.page('/')
+    async def page():
+        deck = SlideDeck()
+        deck.add(title='First')
+        deck.add(title='Second', name='it\'s "named" <b>')
+        deck.add(title='Third')
+        viewer = DeckViewer(deck=deck)
+        viewers.append(viewer)
+        await viewer.build()
+    
+    await user.open('/')
+    await user.should_see('First')
+    viewer = viewers[0]
+    outbox = user.client.outbox
+    sent = []
+    original_emit = outbox._emit
+    
+    async def recording_emit(message):
+        sent.append(message[1])
+        await original_emit(message)
+    outbox._emit = recording_emit
+    
+    await viewer.next_slide()
+    await asyncio.sleep(0.1)
+    sent.clear()
+    await viewer.next_slide()
+    await asyncio.sleep(0.1)
+    
+    assert sent == ['update']
+    
+    await viewer.previous_slide()
+    assert viewer._slide_frame._props['data-slide'] == 'it\'s "named" <b>'
+
+
+async def test_overview_pages_placeholders_and_navigation(user: User) -> None:
+    """Test the overview grid: paging, cached thumbnails, placeholders, jumping."""
+    from nicegui import ui
+    from stagdeck import DeckViewer, RenderCache
+    
+    cache = RenderCache()
+    viewers = []
+    
+    @ui.page('/')
+    async def page():
+        deck = SlideDeck()
+        for i in range(30):
+            deck.add(title=f'Slide {i}')
+        viewer = DeckViewer(deck=deck, current_index=25, thumbnails=cache)
+        viewers.append(viewer)
+        await viewer.build()
+    
+    await user.open('/')
+    viewer = viewers[0]
+    width, height = viewer.thumbnail_size
+    cache.put(26, 0, width, height, b'png')
+    
+    viewer.toggle_overview()
+    
+    tiles = [e for e in viewer._overview_grid.descendants() if 'overview-thumb' in e.classes]
+    images = [e for e in viewer._overview_grid.descendants() if 'overview-image' in e.classes]
+    assert len(tiles) == 6  # Second page: slides 25-30
+    assert [img.props['src'] for img in images] == [f'/stagdeck/thumbnails/{cache.cache_id}/{width}x{height}/26.png?v=0']
+    assert images[0].props['loading'] == 'lazy'
+    await user.should_see('Slide 29')
+    
+    tile = tiles[4]
+    listener = next(iter(tile._event_listeners.values()))
+    await listener.handler()
+    await user.should_see('29 / 30')
+    assert viewer.current_index == 28
+    assert not viewer._overview_dialog.value
+
+
+async def test_shutdown_handler_registered_once(user: User) -> None:
+    """Test that pages share one shutdown handler for the deck watchers."""
+    from nicegui import app
+    from stagdeck.app import _stop_watching
+    
+    def create_deck():
+        deck = SlideDeck(title='Test Deck')
+        deck.add(title='Slide 1')
+        return deck
+    
+    App.create_page(create_deck, path='/')
+    App.create_page(create_deck, path='/cached', cache_decks=True)
+    App.create_page(create_deck, path='/other')
+    
+    assert app._shutdown_handlers.count(_stop_watching) == 1